@@ -0,0 +1,47 @@
+"""
+Event loop lag monitor shared by the benchmarks
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop wakes up a periodic timer
+
+    Any time the loop spends in blocking code shows up as lag, i.e. the delay
+    between when the timer was due and when it actually ran.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    async def _run(self) -> None:
+        while True:
+            due = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.perf_counter() - due))
+
+    def start(self) -> None:
+        self.samples = []
+        self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def summary(self) -> Dict[str, float]:
+        """Return max and 99th percentile lag in milliseconds"""
+        if not self.samples:
+            return {"max_ms": 0.0, "p99_ms": 0.0}
+        ordered = sorted(self.samples)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return {"max_ms": ordered[-1] * 1000, "p99_ms": p99 * 1000}
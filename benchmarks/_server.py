@@ -0,0 +1,68 @@
+"""
+Local HTTP sink used by the upload benchmarks in place of a signed storage URL
+"""
+
+import asyncio
+import threading
+from typing import Any, Optional, Tuple
+
+from aiohttp import web
+
+
+async def start_sink_server(
+    host: str = "127.0.0.1", port: int = 0
+) -> Tuple[web.AppRunner, str]:
+    """
+    Start a server that accepts PUT requests and discards the body
+
+    Args:
+        host: Interface to bind
+        port: Port to bind, 0 picks a free one
+
+    Returns:
+        Tuple of (runner, upload_url); call runner.cleanup() when done
+    """
+
+    async def handle_put(request: web.Request) -> web.Response:
+        async for _ in request.content.iter_chunked(1 << 20):
+            pass
+        return web.Response(text="OK")
+
+    app = web.Application()
+    app.router.add_put("/upload", handle_put)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+
+    bound_port = runner.addresses[0][1]
+    return runner, f"http://{host}:{bound_port}/upload"
+
+
+class SinkServerThread:
+    """
+    Runs the sink server on its own event loop in a background thread, so that
+    server work does not show up in measurements of the client's event loop
+    """
+
+    def __init__(self) -> None:
+        self.url = ""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._runner: Optional[web.AppRunner] = None
+
+    def __enter__(self) -> "SinkServerThread":
+        self._thread.start()
+        future = asyncio.run_coroutine_threadsafe(start_sink_server(), self._loop)
+        self._runner, self.url = future.result()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._runner is not None:
+            asyncio.run_coroutine_threadsafe(
+                self._runner.cleanup(), self._loop
+            ).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -0,0 +1,102 @@
+"""
+Compare the JSON codecs on large result list pages
+
+Each installed codec decodes a synthetic `get_media_results` page from bytes,
+then `format_result_list` turns it into a DetectionResultList. The old path
+(aiohttp decoding the body to str, then json.loads) is included for reference.
+
+Usage:
+    python benchmarks/json_decode.py --items 1000 --repeat 50
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from realitydefender.client.codec import CODECS, JsonCodec
+from realitydefender.detection.results import format_result_list
+
+MODELS = ["rd-img-ensemble", "rd-oak-img", "rd-elm-img", "rd-cedar-img", "rd-pine-img"]
+
+
+def make_page(items: int) -> Dict[str, Any]:
+    """Build a results page shaped like the API response"""
+    media: List[Dict[str, Any]] = []
+    for index in range(items):
+        media.append(
+            {
+                "requestId": f"{index:08d}-8f0c-4a8e-9d7e-{index:012d}",
+                "originalFileName": f"upload-{index}.jpg",
+                "uploadedDate": "2025-01-01T12:00:00.000Z",
+                "resultsSummary": {
+                    "status": random.choice(["AUTHENTIC", "FAKE", "SUSPICIOUS"]),
+                    "metadata": {"finalScore": random.uniform(0, 100)},
+                },
+                "models": [
+                    {
+                        "name": name,
+                        "status": random.choice(["AUTHENTIC", "FAKE"]),
+                        "predictionNumber": random.random(),
+                        "normalizedPredictionNumber": random.uniform(0, 100),
+                    }
+                    for name in MODELS
+                ],
+            }
+        )
+    return {
+        "totalItems": items,
+        "totalPages": 1,
+        "currentPage": 0,
+        "currentPageItemsCount": items,
+        "mediaList": media,
+    }
+
+
+def measure(decode: Callable[[bytes], Any], body: bytes, repeat: int) -> List[float]:
+    """Time decode and format of the page, returning milliseconds per phase"""
+    decode_ms: List[float] = []
+    format_ms: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = decode(body)
+        decoded = time.perf_counter()
+        format_result_list(response)
+        formatted = time.perf_counter()
+        decode_ms.append((decoded - started) * 1000)
+        format_ms.append((formatted - decoded) * 1000)
+    return [statistics.median(decode_ms), statistics.median(format_ms)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    body = json.dumps(make_page(args.items)).encode()
+    print(f"{args.items} items, {len(body) / 1024:.0f} KiB per page")
+    print(f"{'codec':<16}{'decode ms':>12}{'format ms':>12}{'total ms':>12}")
+
+    decoders: Dict[str, Callable[[bytes], Any]] = {
+        "str+json.loads": lambda data: json.loads(data.decode("utf-8"))
+    }
+    for name, factory in CODECS.items():
+        try:
+            codec: JsonCodec = factory()
+        except ImportError:
+            print(f"{name:<16}{'not installed':>12}")
+            continue
+        decoders[name] = codec.loads
+
+    for name, decode in decoders.items():
+        decode_ms, format_ms = measure(decode, body, args.repeat)
+        print(
+            f"{name:<16}{decode_ms:>12.2f}{format_ms:>12.2f}{decode_ms + format_ms:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
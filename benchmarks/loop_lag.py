@@ -0,0 +1,92 @@
+"""
+Measure event loop stalls caused by file I/O during concurrent uploads
+
+Uploads several files concurrently to a local sink server while a timer
+measures event loop lag. The "blocking" mode reproduces the previous upload
+path, which read files on the event loop thread; "buffered" and "stream" are
+the current upload_to_signed_url modes, which read on the I/O executor.
+Executor threads still compete for CPU with the event loop, so the remaining
+lag shrinks with the number of available cores.
+
+Usage:
+    python benchmarks/loop_lag.py --files 16 --size-mb 50
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from typing import List
+
+from realitydefender.client.http_client import HttpClient, create_http_client
+from realitydefender.detection.upload import upload_to_signed_url
+from realitydefender.utils.file_utils import get_file_info
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _loop_lag import LoopLagMonitor
+from _server import SinkServerThread
+
+MODES = ["blocking", "buffered", "stream"]
+
+
+async def upload_blocking(client: HttpClient, url: str, file_path: str) -> None:
+    """The upload path before file I/O was moved off the event loop"""
+    _, content, content_type = get_file_info(file_path)
+    session = await client.ensure_session()
+    async with session.put(
+        url, data=content, headers={"Content-Type": content_type}
+    ) as response:
+        response.raise_for_status()
+
+
+async def run_mode(mode: str, url: str, files: List[str]) -> None:
+    client = create_http_client({"api_key": "benchmark"})
+    monitor = LoopLagMonitor()
+    try:
+        monitor.start()
+        start = time.perf_counter()
+        if mode == "blocking":
+            await asyncio.gather(*(upload_blocking(client, url, f) for f in files))
+        else:
+            await asyncio.gather(
+                *(
+                    upload_to_signed_url(client, url, f, stream=mode == "stream")
+                    for f in files
+                )
+            )
+        elapsed = time.perf_counter() - start
+        await monitor.stop()
+    finally:
+        await client.close()
+
+    lag = monitor.summary()
+    print(f"{mode:<10}{elapsed:>10.2f}{lag['p99_ms']:>14.1f}{lag['max_ms']:>14.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=16)
+    parser.add_argument("--size-mb", type=int, default=50)
+    args = parser.parse_args()
+
+    files: List[str] = []
+    try:
+        for _ in range(args.files):
+            with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
+                f.write(os.urandom(args.size_mb << 20))
+                files.append(f.name)
+
+        print(f"{args.files} concurrent uploads of {args.size_mb} MB")
+        print(f"{'mode':<10}{'wall s':>10}{'p99 lag ms':>14}{'max lag ms':>14}")
+        with SinkServerThread() as server:
+            for mode in MODES:
+                asyncio.run(run_mode(mode, server.url, files))
+    finally:
+        for path in files:
+            os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
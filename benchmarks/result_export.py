@@ -0,0 +1,118 @@
+"""
+Compare a sequential page walk with prefetching and concurrent page fan-out
+
+A local stand-in for the API serves result pages after a fixed latency. The
+sequential walk calls get_detection_results page by page, as callers did before
+iter_detection_results existed; the iterator is run with several prefetch windows
+and get_all_detection_results with several concurrency limits.
+
+Usage:
+    python benchmarks/result_export.py --items 20000 --size 100 --latency 20
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, cast
+
+from realitydefender.client.http_client import HttpClient
+from realitydefender.detection.results import (
+    get_all_detection_results,
+    get_detection_results,
+    iter_detection_results,
+)
+
+
+class LatencyClient:
+    """Serves synthetic result pages after a fixed delay"""
+
+    def __init__(self, items: int, latency: float) -> None:
+        self.items = items
+        self.latency = latency
+
+    async def get(self, path: str, params: Dict[str, str]) -> Dict[str, Any]:
+        await asyncio.sleep(self.latency)
+        page_number = int(path.rsplit("/", 1)[1])
+        size = int(params["size"])
+        first = page_number * size
+        count = max(0, min(size, self.items - first))
+        return {
+            "totalItems": self.items,
+            "totalPages": -(-self.items // size),
+            "currentPage": page_number,
+            "currentPageItemsCount": count,
+            "mediaList": [
+                {
+                    "requestId": f"req-{first + index}",
+                    "resultsSummary": {
+                        "status": "AUTHENTIC",
+                        "metadata": {"finalScore": 12.5},
+                    },
+                    "models": [
+                        {
+                            "name": "model",
+                            "status": "AUTHENTIC",
+                            "predictionNumber": 0.1,
+                        }
+                    ],
+                }
+                for index in range(count)
+            ],
+        }
+
+
+async def sequential(client: HttpClient, size: int) -> int:
+    count = 0
+    page_number = 0
+    while True:
+        page = await get_detection_results(client, page_number=page_number, size=size)
+        count += len(page["items"])
+        page_number += 1
+        if page_number >= page["total_pages"]:
+            return count
+
+
+async def iterate(client: HttpClient, size: int, prefetch: int) -> int:
+    count = 0
+    async for _ in iter_detection_results(client, size=size, prefetch=prefetch):
+        count += 1
+    return count
+
+
+async def fan_out(client: HttpClient, size: int, concurrency: int) -> int:
+    result = await get_all_detection_results(client, size=size, concurrency=concurrency)
+    return len(result["items"])
+
+
+async def run(items: int, size: int, latency: float) -> None:
+    client = cast(HttpClient, LatencyClient(items, latency))
+    print(f"{items} results, {size} per page, {latency * 1000:.0f} ms per request")
+    print(f"{'mode':<24}{'seconds':>10}{'results/s':>12}")
+
+    cases = [("sequential page walk", sequential(client, size))]
+    for prefetch in (1, 4, 16):
+        cases.append((f"iter, prefetch={prefetch}", iterate(client, size, prefetch)))
+    for concurrency in (4, 16):
+        cases.append(
+            (f"all, concurrency={concurrency}", fan_out(client, size, concurrency))
+        )
+
+    for name, case in cases:
+        started = time.perf_counter()
+        count = await case
+        elapsed = time.perf_counter() - started
+        assert count == items
+        print(f"{name:<24}{elapsed:>10.2f}{count / elapsed:>12.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=20, help="milliseconds")
+    args = parser.parse_args()
+    asyncio.run(run(args.items, args.size, args.latency / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Compare the memory used by regular and compact detection results
+
+Formats a synthetic `get_media_results` page into DetectionResult dicts and into
+CompactDetectionResult objects, then reports the traced Python allocations that
+remain per result once the raw response has been released. Compact results are
+measured before and after their models list has been built.
+
+Usage:
+    python benchmarks/result_memory.py --items 10000 --models 5
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from realitydefender.detection.results import format_result, format_result_compact
+
+
+def make_media(items: int, models: int) -> List[Dict[str, Any]]:
+    """Build result items shaped like the API response, from JSON like the client"""
+    media: List[Dict[str, Any]] = []
+    for index in range(items):
+        media.append(
+            {
+                "requestId": f"{index:08d}-8f0c-4a8e-9d7e-{index:012d}",
+                "originalFileName": f"upload-{index}.jpg",
+                "resultsSummary": {
+                    "status": "FAKE" if index % 2 else "AUTHENTIC",
+                    "metadata": {"finalScore": index % 100 + 0.5},
+                },
+                "models": [
+                    {
+                        "name": f"rd-model-{model}",
+                        "status": "FAKE" if (index + model) % 2 else "AUTHENTIC",
+                        "predictionNumber": (index + model) % 100 / 100 + 0.001,
+                    }
+                    for model in range(models)
+                ],
+            }
+        )
+    # Decode from JSON so strings are not shared with the literals above
+    decoded: List[Dict[str, Any]] = json.loads(json.dumps(media))
+    return decoded
+
+
+def measure(
+    build: Callable[[List[Dict[str, Any]]], List[Any]], items: int, models: int
+) -> float:
+    """Return the bytes retained per result by the objects built from a page"""
+    media = make_media(items, models)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    results = build(media)
+    del media
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    assert len(results) == items
+    return retained / items
+
+
+def build_dicts(media: List[Dict[str, Any]]) -> List[Any]:
+    return [format_result(item) for item in media]
+
+
+def build_compact(media: List[Dict[str, Any]]) -> List[Any]:
+    return [format_result_compact(item) for item in media]
+
+
+def build_compact_with_models(media: List[Dict[str, Any]]) -> List[Any]:
+    results = build_compact(media)
+    for result in results:
+        # Accessing models forces the lazy parse
+        _ = result.models
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--models", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.items} results with {args.models} models each")
+    print(f"{'representation':<28}{'bytes/result':>14}")
+    for name, build in (
+        ("DetectionResult dict", build_dicts),
+        ("compact", build_compact),
+        ("compact, models accessed", build_compact_with_models),
+    ):
+        print(f"{name:<28}{measure(build, args.items, args.models):>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Compare memory and CPU cost of the upload body sources
+
+Each mode uploads the same file to a local sink server in a fresh subprocess so
+that peak RSS is not polluted by earlier runs:
+
+- read:   get_file_info() reads the whole file into bytes (default path)
+- stream: fixed-size chunks read into bytes (stream=True)
+- mmap:   memoryview slices of a memory-mapped file (use_mmap=True)
+
+Usage:
+    python benchmarks/upload_memory.py --size-mb 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List
+
+from realitydefender.client.http_client import create_http_client
+from realitydefender.core.constants import DEFAULT_UPLOAD_CHUNK_SIZE
+from realitydefender.detection.upload import upload_to_signed_url
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _server import start_sink_server
+
+MODES = ["read", "stream", "mmap"]
+
+
+async def run_mode(mode: str, file_path: str, chunk_size: int) -> Dict[str, float]:
+    """Upload the file once using the given mode and collect measurements"""
+    runner, url = await start_sink_server()
+    client = create_http_client({"api_key": "benchmark"})
+    try:
+        tracemalloc.start()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        await upload_to_signed_url(
+            client,
+            url,
+            file_path,
+            stream=mode == "stream",
+            chunk_size=chunk_size,
+            use_mmap=mode == "mmap",
+        )
+
+        cpu = time.process_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        await client.close()
+        await runner.cleanup()
+
+    # ru_maxrss is reported in KiB on Linux and bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":
+        max_rss *= 1024
+
+    return {
+        "wall_s": wall,
+        "cpu_s": cpu,
+        "traced_peak_mb": traced_peak / 2**20,
+        "max_rss_mb": max_rss / 2**20,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=int, default=200)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_UPLOAD_CHUNK_SIZE)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        # Child process: run a single mode and report as JSON
+        result = asyncio.run(run_mode(args.mode, args.file, args.chunk_size))
+        print(json.dumps(result))
+        return
+
+    with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
+        block = os.urandom(1 << 20)
+        for _ in range(args.size_mb):
+            f.write(block)
+        file_path = f.name
+
+    rows: List[str] = []
+    try:
+        for mode in MODES:
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--mode",
+                    mode,
+                    "--file",
+                    file_path,
+                    "--chunk-size",
+                    str(args.chunk_size),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            r = json.loads(output.strip().splitlines()[-1])
+            rows.append(
+                f"{mode:<8}{r['wall_s']:>10.2f}{r['cpu_s']:>10.2f}"
+                f"{r['traced_peak_mb']:>16.1f}{r['max_rss_mb']:>14.1f}"
+            )
+    finally:
+        os.unlink(file_path)
+
+    print(f"File size: {args.size_mb} MB, chunk size: {args.chunk_size} bytes")
+    print(f"{'mode':<8}{'wall s':>10}{'cpu s':>10}{'py peak MB':>16}{'max RSS MB':>14}")
+    for row in rows:
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
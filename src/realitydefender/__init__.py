@@ -3,21 +3,81 @@ Reality Defender SDK
 Client library for deepfake detection using the Reality Defender API
 """
 
-from .detection.results import get_detection_result
-from .detection.upload import upload_file
+from .cache import MemoryCache, ResultCache, ResultStore, SQLiteCache, UploadCache
+from .client.circuit_breaker import CircuitBreakerConfig
+from .client.codec import JsonCodec
+from .client.http_client import PoolConfig
+from .client.rate_limit import RateLimitConfig
+from .client.retry import RetryBudgetConfig, RetryPolicy
+from .detection.estimator import ProcessingStats, ProcessingTimeEstimator
+from .detection.journal import UploadJournal
+from .detection.polling import (
+    DecorrelatedJitterPolling,
+    ExponentialPolling,
+    FixedPolling,
+    MediaTypePolling,
+    PollingStrategy,
+)
+from .detection.scheduler import PollingScheduler
+from .detection.planner import DateShard, iter_sharded_results
+from .detection.sync import SyncReport, sync_results
+from .detection.results import (
+    get_all_detection_results,
+    get_detection_result,
+    iter_detection_result_pages,
+    iter_detection_results,
+)
+from .detection.upload import upload_bytes, upload_file, upload_fileobj, upload_stream
 from .errors import ErrorCode, RealityDefenderError
 from realitydefender.model import (
+    CompactDetectionResult,
     DetectionResult,
+    MultipartUploadBackend,
     UploadResult,
 )
 from .reality_defender import RealityDefender
+from .utils.byte_budget import get_upload_byte_budget, set_upload_byte_budget
 
 __all__ = [
     "RealityDefender",
     "upload_file",
+    "upload_bytes",
+    "upload_fileobj",
+    "upload_stream",
     "get_detection_result",
+    "iter_detection_results",
+    "iter_detection_result_pages",
+    "get_all_detection_results",
+    "iter_sharded_results",
+    "DateShard",
+    "sync_results",
+    "SyncReport",
+    "PollingScheduler",
+    "PollingStrategy",
+    "FixedPolling",
+    "ExponentialPolling",
+    "DecorrelatedJitterPolling",
+    "MediaTypePolling",
+    "ProcessingTimeEstimator",
+    "ProcessingStats",
     "RealityDefenderError",
     "ErrorCode",
     "UploadResult",
     "DetectionResult",
+    "CompactDetectionResult",
+    "MultipartUploadBackend",
+    "UploadJournal",
+    "UploadCache",
+    "MemoryCache",
+    "SQLiteCache",
+    "ResultStore",
+    "ResultCache",
+    "PoolConfig",
+    "RetryPolicy",
+    "RetryBudgetConfig",
+    "CircuitBreakerConfig",
+    "RateLimitConfig",
+    "JsonCodec",
+    "set_upload_byte_budget",
+    "get_upload_byte_budget",
 ]
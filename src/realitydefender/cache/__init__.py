@@ -0,0 +1,18 @@
+"""
+Caching for the Reality Defender SDK
+"""
+
+from .backends import CacheBackend, MemoryCache, SQLiteCache
+from .dedup import UploadCache
+from .results import ResultCache, ResultCacheStats
+from .store import ResultStore
+
+__all__ = [
+    "CacheBackend",
+    "MemoryCache",
+    "SQLiteCache",
+    "UploadCache",
+    "ResultStore",
+    "ResultCache",
+    "ResultCacheStats",
+]
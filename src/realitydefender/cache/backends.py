@@ -0,0 +1,192 @@
+"""
+Key-value storage backends for SDK caches
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Protocol, Tuple
+
+from realitydefender.errors import RealityDefenderError
+
+
+class CacheBackend(Protocol):
+    """Storage for cache entries with expiry and bounded size"""
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value for key, or None if it is missing or expired"""
+        ...
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value, expiring after ttl milliseconds if given"""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Remove the value for key if present"""
+        ...
+
+    def clear(self) -> None:
+        """Remove all values"""
+        ...
+
+    def __len__(self) -> int:
+        """Number of stored values, including ones that expired but were not purged"""
+        ...
+
+
+class MemoryCache:
+    """
+    In-process least-recently-used cache
+
+    Once max_entries values are stored, adding another evicts the value that was
+    used least recently.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[int] = None) -> None:
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Maximum number of values kept
+            ttl: Default time to live in milliseconds, None to never expire
+        """
+        if max_entries < 1:
+            raise RealityDefenderError(
+                "max_entries must be at least 1", "invalid_request"
+            )
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = time.monotonic() + ttl / 1000 if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache:
+    """
+    Persistent least-recently-used cache stored in a SQLite database
+
+    Values must be JSON serializable. The database can be shared by several
+    processes on the same host.
+    """
+
+    def __init__(
+        self, path: str, max_entries: int = 100000, ttl: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the cache
+
+        Args:
+            path: Location of the database file, created if missing
+            max_entries: Maximum number of values kept
+            ttl: Default time to live in milliseconds, None to never expire
+        """
+        if max_entries < 1:
+            raise RealityDefenderError(
+                "max_entries must be at least 1", "invalid_request"
+            )
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        try:
+            self._connection = sqlite3.connect(
+                path, timeout=30, check_same_thread=False, isolation_level=None
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)"
+            )
+        except sqlite3.Error as e:
+            raise RealityDefenderError(
+                f"Failed to open cache database: {str(e)}", "unknown_error"
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and now >= expires_at:
+                self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+            self._connection.execute(
+                "UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        now = time.time()
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = now + ttl / 1000 if ttl is not None else None
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), expires_at, now),
+            )
+            # Evict the least recently used values beyond the size bound
+            self._connection.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache "
+                "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM cache")
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM cache").fetchone()
+        return int(row[0])
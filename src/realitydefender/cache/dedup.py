@@ -0,0 +1,94 @@
+"""
+Content-addressed cache that avoids re-uploading identical media
+"""
+
+from typing import Optional
+
+from realitydefender.cache.backends import CacheBackend, MemoryCache
+from realitydefender.core.constants import PENDING_STATUSES
+from realitydefender.model import DetectionResult, UploadResult
+from realitydefender.utils.file_utils import hash_file
+
+
+class UploadCache:
+    """
+    Maps the SHA-256 digest of a file to its previous upload and final result
+
+    Entries are stored under "upload:<digest>", with a "request:<request_id>"
+    index so that results fetched by request ID can be attached to the upload.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None) -> None:
+        """
+        Initialize the cache
+
+        Args:
+            backend: Storage for the entries, an in-memory LRU cache by default
+        """
+        self.backend: CacheBackend = backend if backend is not None else MemoryCache()
+
+    @staticmethod
+    def digest(file_path: str) -> str:
+        """
+        Compute the cache key of a file
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Hex-encoded SHA-256 digest of the file content
+        """
+        return hash_file(file_path)
+
+    def get_upload(self, digest: str) -> Optional[UploadResult]:
+        """
+        Get the previous upload of identical content
+
+        Args:
+            digest: Digest of the file content
+
+        Returns:
+            The cached upload result, or None
+        """
+        upload: Optional[UploadResult] = self.backend.get(f"upload:{digest}")
+        return upload
+
+    def put_upload(self, digest: str, upload: UploadResult) -> None:
+        """
+        Remember the upload of a file
+
+        Args:
+            digest: Digest of the file content
+            upload: Result of uploading the file
+        """
+        self.backend.set(f"upload:{digest}", dict(upload))
+        self.backend.set(f"request:{upload['request_id']}", digest)
+
+    def get_result(self, request_id: str) -> Optional[DetectionResult]:
+        """
+        Get the final detection result for a cached upload
+
+        Args:
+            request_id: Request ID of the upload
+
+        Returns:
+            The cached detection result, or None
+        """
+        result: Optional[DetectionResult] = self.backend.get(f"result:{request_id}")
+        return result
+
+    def put_result(self, result: DetectionResult) -> None:
+        """
+        Remember the detection result of a cached upload
+
+        Only final results of requests that were uploaded through this cache are
+        stored; results that are still being analyzed are ignored.
+
+        Args:
+            result: Detection result returned by the API
+        """
+        if result["status"] in PENDING_STATUSES:
+            return
+        if self.backend.get(f"request:{result['request_id']}") is None:
+            return
+        self.backend.set(f"result:{result['request_id']}", dict(result))
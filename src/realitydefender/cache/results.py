@@ -0,0 +1,162 @@
+"""
+In-process cache of final detection results
+"""
+
+import threading
+from typing import Optional, TypedDict
+
+from realitydefender.cache.backends import CacheBackend, MemoryCache
+from realitydefender.core.constants import (
+    DEFAULT_NOT_FOUND_TTL,
+    DEFAULT_RESULT_CACHE_SIZE,
+    PENDING_STATUSES,
+)
+from realitydefender.errors import RealityDefenderError
+from realitydefender.model import DetectionResult
+
+# Cached in place of a result for request IDs the API did not find
+_NOT_FOUND = "not_found"
+
+
+class ResultCacheStats(TypedDict):
+    """Counters of a result cache"""
+
+    hits: int
+    """Lookups answered with a cached result"""
+
+    misses: int
+    """Lookups that found nothing cached"""
+
+    not_found_hits: int
+    """Lookups answered with a cached not found error"""
+
+    size: int
+    """Number of cached entries, including ones that expired but were not purged"""
+
+
+class ResultCache:
+    """
+    Cache of detection results that finished processing, keyed by request ID
+
+    Final results never change, so they can be answered without contacting the
+    API. Results that are still being processed are never cached. Request IDs
+    the API did not find are cached for a short time, so that clients retrying
+    an unknown ID do not all reach the API.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_RESULT_CACHE_SIZE,
+        ttl: Optional[int] = None,
+        not_found_ttl: Optional[int] = DEFAULT_NOT_FOUND_TTL,
+        backend: Optional[CacheBackend] = None,
+    ) -> None:
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Maximum number of entries kept, the least recently used
+                are evicted first
+            ttl: Time to live of results in milliseconds, None to keep them
+                until they are evicted
+            not_found_ttl: Time to live of not found answers in milliseconds,
+                None to not cache them
+            backend: Storage for the entries, replacing max_entries and ttl
+        """
+        self.backend: CacheBackend = (
+            backend if backend is not None else MemoryCache(max_entries, ttl)
+        )
+        self.not_found_ttl = not_found_ttl
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._not_found_hits = 0
+
+    def get(self, request_id: str, not_found: bool = True) -> Optional[DetectionResult]:
+        """
+        Get the cached result of a request
+
+        Args:
+            request_id: Request ID of the result
+            not_found: Whether to raise for a request recently not found,
+                rather than treating it as a miss
+
+        Returns:
+            A copy of the cached result, which callers may modify, or None
+
+        Raises:
+            RealityDefenderError: If the request ID was recently not found and
+                not_found is True
+        """
+        cached = self.backend.get(request_id)
+        if cached == _NOT_FOUND and not not_found:
+            cached = None
+        with self._lock:
+            if cached is None:
+                self._misses += 1
+            elif cached == _NOT_FOUND:
+                self._not_found_hits += 1
+            else:
+                self._hits += 1
+        if cached == _NOT_FOUND:
+            raise RealityDefenderError(
+                f"Result for request {request_id} not found", "not_found"
+            )
+        if cached is None:
+            return None
+        return _copy_result(cached)
+
+    def put(self, result: DetectionResult) -> None:
+        """
+        Cache a result if it finished processing
+
+        Args:
+            result: Detection result returned by the API
+        """
+        if result["status"] in PENDING_STATUSES:
+            return
+        self.backend.set(result["request_id"], _copy_result(result))
+
+    def put_not_found(self, request_id: str) -> None:
+        """
+        Cache that a request ID was not found
+
+        Args:
+            request_id: Request ID the API did not find
+        """
+        if self.not_found_ttl is not None:
+            self.backend.set(request_id, _NOT_FOUND, ttl=self.not_found_ttl)
+
+    def invalidate(self, request_id: Optional[str] = None) -> None:
+        """
+        Remove a cached entry
+
+        Args:
+            request_id: Request ID to remove, None to remove all entries
+        """
+        if request_id is None:
+            self.backend.clear()
+        else:
+            self.backend.delete(request_id)
+
+    def stats(self) -> ResultCacheStats:
+        """
+        Get the counters of the cache
+
+        Returns:
+            Hits, misses, not found hits and size
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "not_found_hits": self._not_found_hits,
+                "size": len(self.backend),
+            }
+
+
+def _copy_result(result: DetectionResult) -> DetectionResult:
+    """Copy a result down to its models, so callers never share cached entries"""
+    copy = result.copy()
+    copy["models"] = [model.copy() for model in result["models"]]
+    return copy
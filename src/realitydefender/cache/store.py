@@ -0,0 +1,353 @@
+"""
+Persistent local store of detection results
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, time as day_time, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from realitydefender.core.constants import PENDING_STATUSES
+from realitydefender.errors import RealityDefenderError
+from realitydefender.model import DetectionResult, DetectionResultList, ModelResult
+
+
+class ResultStore:
+    """
+    Detection results stored in a SQLite database
+
+    Results are upserted by request ID, so storing a result again only writes
+    when its status or score changed. Each result keeps the time it was first
+    stored and last changed, and its model scores are stored in a table of their
+    own for analytics queries. The store also keeps the watermarks of incremental
+    syncs. The database can be shared by several processes on the same host.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialize the store
+
+        Args:
+            path: Location of the database file, created if missing
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            self._connection = sqlite3.connect(
+                path, timeout=30, check_same_thread=False, isolation_level=None
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA foreign_keys=ON")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "request_id TEXT PRIMARY KEY, name TEXT, status TEXT NOT NULL, "
+                "score REAL, created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS model_scores ("
+                "request_id TEXT NOT NULL "
+                "REFERENCES results (request_id) ON DELETE CASCADE, "
+                "position INTEGER NOT NULL, name TEXT NOT NULL, "
+                "status TEXT NOT NULL, score REAL, "
+                "PRIMARY KEY (request_id, position))"
+            )
+            for index, table, columns in (
+                ("results_status", "results", "status, created_at"),
+                ("results_score", "results", "score"),
+                ("results_created_at", "results", "created_at"),
+                ("results_name", "results", "name, created_at"),
+                ("model_scores_name", "model_scores", "name, score"),
+            ):
+                self._connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {index} ON {table} ({columns})"
+                )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state ("
+                "key TEXT PRIMARY KEY, watermark TEXT NOT NULL)"
+            )
+        except sqlite3.Error as e:
+            raise RealityDefenderError(
+                f"Failed to open result store: {str(e)}", "unknown_error"
+            )
+
+    def upsert(
+        self, results: Iterable[DetectionResult], name: Optional[str] = None
+    ) -> int:
+        """
+        Store results, replacing stored ones whose status or score changed
+
+        Args:
+            results: Results to store
+            name: Name the results were listed under, kept for name queries;
+                results stored without a name keep the one they already have
+
+        Returns:
+            Number of results that were added or changed
+        """
+        now = time.time()
+        with self._lock:
+            changed = 0
+            self._connection.execute("BEGIN")
+            try:
+                for result in results:
+                    cursor = self._connection.execute(
+                        "INSERT INTO results "
+                        "(request_id, name, status, score, created_at, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT (request_id) DO UPDATE SET "
+                        "status = excluded.status, score = excluded.score, "
+                        "name = COALESCE(excluded.name, results.name), "
+                        "updated_at = excluded.updated_at "
+                        "WHERE results.status != excluded.status "
+                        "OR results.score IS NOT excluded.score "
+                        "OR results.name IS NOT COALESCE(excluded.name, results.name)",
+                        (
+                            result["request_id"],
+                            name,
+                            result["status"],
+                            result["score"],
+                            now,
+                            now,
+                        ),
+                    )
+                    if cursor.rowcount == 0:
+                        continue
+                    changed += 1
+                    self._connection.execute(
+                        "DELETE FROM model_scores WHERE request_id = ?",
+                        (result["request_id"],),
+                    )
+                    self._connection.executemany(
+                        "INSERT INTO model_scores "
+                        "(request_id, position, name, status, score) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        [
+                            (
+                                result["request_id"],
+                                position,
+                                model["name"],
+                                model["status"],
+                                model["score"],
+                            )
+                            for position, model in enumerate(result["models"])
+                        ],
+                    )
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+        return changed
+
+    def get(self, request_id: str) -> Optional[DetectionResult]:
+        """
+        Get a stored result
+
+        Args:
+            request_id: Request ID of the result
+
+        Returns:
+            The stored result, or None
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT request_id, status, score FROM results WHERE request_id = ?",
+                (request_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            return self._with_models([row])[0]
+
+    def query(
+        self,
+        page_number: int = 0,
+        size: int = 10,
+        name: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        status: Optional[str] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+    ) -> DetectionResultList:
+        """
+        Query stored results, with the filters and pagination of get_results
+
+        Results are ordered from the most recently stored to the oldest. Dates
+        filter on the UTC day each result was first stored.
+
+        Args:
+            page_number: Zero-based index of the page
+            size: Number of results per page
+            name: Only return results stored under this name
+            start_date: Only return results stored from this day on (inclusive)
+            end_date: Only return results stored up to this day (inclusive)
+            status: Only return results with this status
+            min_score: Only return results with at least this score
+            max_score: Only return results with at most this score
+
+        Returns:
+            DetectionResultList: The requested page of results
+        """
+        where, params = _where(
+            ("name = ?", name),
+            ("created_at >= ?", _day_start(start_date)),
+            ("created_at < ?", _day_start(end_date, 1)),
+            ("status = ?", status),
+            ("score >= ?", min_score),
+            ("score <= ?", max_score),
+        )
+
+        with self._lock:
+            total_items = self._connection.execute(
+                f"SELECT COUNT(*) FROM results{where}", params
+            ).fetchone()[0]
+            rows = self._connection.execute(
+                "SELECT request_id, status, score FROM results"
+                f"{where} ORDER BY created_at DESC, request_id LIMIT ? OFFSET ?",
+                [*params, size, page_number * size],
+            ).fetchall()
+            items = self._with_models(rows)
+
+        return DetectionResultList(
+            total_items=total_items,
+            total_pages=-(-total_items // size) if size > 0 else 0,
+            current_page=page_number,
+            current_page_items_count=len(items),
+            items=items,
+        )
+
+    def status_counts(
+        self, start_date: Optional[date] = None, end_date: Optional[date] = None
+    ) -> Dict[str, int]:
+        """
+        Count stored results by status
+
+        Args:
+            start_date: Only count results stored from this day on (inclusive)
+            end_date: Only count results stored up to this day (inclusive)
+
+        Returns:
+            Number of results per status
+        """
+        where, params = _where(
+            ("created_at >= ?", _day_start(start_date)),
+            ("created_at < ?", _day_start(end_date, 1)),
+        )
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT status, COUNT(*) FROM results{where} GROUP BY status", params
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+    def model_score_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize the stored scores of each model
+
+        Returns:
+            For each model name, the number of results it scored and the
+            minimum, average and maximum of its scores
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT name, COUNT(score), MIN(score), AVG(score), MAX(score) "
+                "FROM model_scores GROUP BY name"
+            ).fetchall()
+        return {
+            name: {"count": count, "min": low, "avg": mean, "max": high}
+            for name, count, low, mean, high in rows
+        }
+
+    def pending_request_ids(self) -> List[str]:
+        """
+        Get the request IDs of stored results that were still being processed
+
+        Returns:
+            Request IDs whose stored status is pending
+        """
+        placeholders = ", ".join("?" for _ in PENDING_STATUSES)
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT request_id FROM results WHERE status IN ({placeholders})",
+                list(PENDING_STATUSES),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_watermark(self, key: str = "") -> Optional[date]:
+        """
+        Get the watermark of an incremental sync
+
+        Args:
+            key: Name of the sync, e.g. its name filter
+
+        Returns:
+            The watermark date, or None if the sync never completed
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT watermark FROM sync_state WHERE key = ?", (key,)
+            ).fetchone()
+        return date.fromisoformat(row[0]) if row is not None else None
+
+    def set_watermark(self, watermark: date, key: str = "") -> None:
+        """
+        Record the watermark of an incremental sync
+
+        Args:
+            watermark: Date from which the next sync lists results
+            key: Name of the sync, e.g. its name filter
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sync_state (key, watermark) VALUES (?, ?)",
+                (key, watermark.isoformat()),
+            )
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM results").fetchone()
+        return int(row[0])
+
+    def _with_models(
+        self, rows: List[Tuple[str, str, Optional[float]]]
+    ) -> List[DetectionResult]:
+        """Attach the stored model scores to result rows, with the lock held"""
+        models: Dict[str, List[ModelResult]] = {row[0]: [] for row in rows}
+        if models:
+            placeholders = ", ".join("?" for _ in models)
+            for request_id, model_name, status, score in self._connection.execute(
+                "SELECT request_id, name, status, score FROM model_scores "
+                f"WHERE request_id IN ({placeholders}) ORDER BY request_id, position",
+                list(models),
+            ):
+                models[request_id].append(
+                    {"name": model_name, "status": status, "score": score}
+                )
+        return [
+            {
+                "request_id": request_id,
+                "status": status,
+                "score": score,
+                "models": models[request_id],
+            }
+            for request_id, status, score in rows
+        ]
+
+
+def _day_start(day: Optional[date], offset: int = 0) -> Optional[float]:
+    """Get the UTC timestamp of the start of a day, offset by a number of days"""
+    if day is None:
+        return None
+    start = datetime.combine(day + timedelta(days=offset), day_time(), timezone.utc)
+    return start.timestamp()
+
+
+def _where(*filters: Tuple[str, Any]) -> Tuple[str, List[Any]]:
+    """Build a WHERE clause from the (condition, value) filters whose value is set"""
+    conditions = [condition for condition, value in filters if value is not None]
+    params = [value for _, value in filters if value is not None]
+    return (f" WHERE {' AND '.join(conditions)}" if conditions else "", params)
@@ -2,6 +2,30 @@
 HTTP client for Reality Defender API interaction
 """
 
-from .http_client import create_http_client
+from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+from .codec import JsonCodec, get_codec
+from .http_client import ClientConfig, PoolConfig, create_http_client
+from .rate_limit import (
+    RateLimitConfig,
+    RateLimiter,
+    SQLiteTokenBucket,
+    TokenBucket,
+)
+from .retry import RetryBudget, RetryBudgetConfig, RetryPolicy
 
-__all__ = ["create_http_client"]
+__all__ = [
+    "create_http_client",
+    "ClientConfig",
+    "PoolConfig",
+    "RetryPolicy",
+    "RetryBudget",
+    "RetryBudgetConfig",
+    "CircuitBreaker",
+    "CircuitBreakerConfig",
+    "RateLimitConfig",
+    "RateLimiter",
+    "TokenBucket",
+    "SQLiteTokenBucket",
+    "JsonCodec",
+    "get_codec",
+]
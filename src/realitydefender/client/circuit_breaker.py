@@ -0,0 +1,138 @@
+"""
+Circuit breaker that stops calls to an endpoint while it is failing
+"""
+
+import time
+from typing import Literal, TypedDict, cast
+
+from realitydefender.core.constants import DEFAULT_CIRCUIT_BREAKER
+from realitydefender.errors import RealityDefenderError
+
+# States of a circuit breaker
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreakerConfig(TypedDict, total=False):
+    """Settings of a circuit breaker, with times in milliseconds"""
+
+    failure_threshold: int
+    """Consecutive transient failures that open the circuit"""
+
+    reset_timeout: int
+    """How long the circuit stays open before probe requests are let through"""
+
+    half_open_max_calls: int
+    """Maximum number of probe requests in flight while half-open"""
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast while an endpoint is unhealthy
+
+    The circuit starts closed. After failure_threshold consecutive transient
+    failures it opens and every call fails immediately with a "circuit_open"
+    error. Once reset_timeout has passed it becomes half-open and lets up to
+    half_open_max_calls probe requests through: a successful probe closes the
+    circuit again, a failed one re-opens it.
+    """
+
+    def __init__(self, name: str, config: CircuitBreakerConfig) -> None:
+        """
+        Initialize the circuit breaker
+
+        Args:
+            name: Name of the guarded endpoint class, used in error messages
+            config: Circuit breaker settings, missing values use the defaults
+        """
+        settings = cast(CircuitBreakerConfig, {**DEFAULT_CIRCUIT_BREAKER, **config})
+        self.name = name
+        self.failure_threshold = settings["failure_threshold"]
+        self.reset_timeout = settings["reset_timeout"]
+        self.half_open_max_calls = settings["half_open_max_calls"]
+        self._state: CircuitState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, taking the reset timeout into account"""
+        if (
+            self._state == "open"
+            and (time.monotonic() - self._opened_at) * 1000 >= self.reset_timeout
+        ):
+            self._state = "half_open"
+            self._probes = 0
+        return self._state
+
+    def before_call(self) -> None:
+        """
+        Check whether a call may proceed
+
+        Raises:
+            RealityDefenderError: If the circuit is open or all probe slots are taken
+        """
+        state = self.state
+        if state == "open":
+            remaining = self.reset_timeout - int(
+                (time.monotonic() - self._opened_at) * 1000
+            )
+            raise RealityDefenderError(
+                f"Circuit for {self.name} requests is open, retry in {remaining} ms",
+                "circuit_open",
+            )
+        if state == "half_open":
+            if self._probes >= self.half_open_max_calls:
+                raise RealityDefenderError(
+                    f"Circuit for {self.name} requests is half-open and "
+                    "waiting for probe requests",
+                    "circuit_open",
+                )
+            self._probes += 1
+
+    def on_success(self) -> None:
+        """Record a call that reached a healthy endpoint"""
+        if self._state == "half_open":
+            self._probes = max(0, self._probes - 1)
+        self._state = "closed"
+        self._failures = 0
+
+    def on_failure(self) -> None:
+        """Record a transient failure of a call"""
+        if self._state == "half_open":
+            self._open()
+            return
+        self._failures += 1
+        if self._state == "closed" and self._failures >= self.failure_threshold:
+            self._open()
+
+    def on_cancel(self) -> None:
+        """Record a call that was abandoned before it completed"""
+        if self._state == "half_open":
+            self._probes = max(0, self._probes - 1)
+
+    def _open(self) -> None:
+        self._state = "open"
+        self._opened_at = time.monotonic()
+        self._failures = 0
+        self._probes = 0
+
+
+def is_endpoint_failure(error: RealityDefenderError) -> bool:
+    """
+    Tell whether an error shows its endpoint is failing, rather than rejecting
+    the request
+
+    Args:
+        error: Error raised by a call that was not retried
+
+    Returns:
+        False for 4xx responses, True for 5xx responses, server errors and
+        timeouts
+    """
+    if error.status is not None and 400 <= error.status < 500:
+        return False
+    return (error.status is not None and error.status >= 500) or error.code in (
+        "server_error",
+        "timeout",
+    )
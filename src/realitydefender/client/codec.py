@@ -0,0 +1,108 @@
+"""
+JSON codecs used to decode API responses
+"""
+
+import json
+from typing import Any, Callable, Dict, Protocol, Union
+
+from realitydefender.errors import RealityDefenderError
+
+
+class JsonCodec(Protocol):
+    """Decodes JSON directly from bytes"""
+
+    name: str
+    """Name of the codec"""
+
+    def loads(self, data: bytes) -> Any:
+        """Decode a JSON document, raising ValueError if it is invalid"""
+        ...
+
+
+class StdlibCodec:
+    """Codec based on the standard library json module"""
+
+    name = "stdlib"
+
+    def loads(self, data: bytes) -> Any:
+        # json.loads detects the encoding of bytes itself, without a str copy
+        # made by the caller
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """Codec based on orjson"""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec:
+    """Codec based on msgspec"""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec  # type: ignore[import-not-found]
+
+        self._msgspec = msgspec
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+# Codecs by name, in order of preference for automatic selection
+CODECS: Dict[str, Callable[[], JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "stdlib": StdlibCodec,
+}
+
+
+def get_codec(codec: Union[str, JsonCodec] = "auto") -> JsonCodec:
+    """
+    Get a JSON codec
+
+    Args:
+        codec: A codec instance, the name of a codec, or "auto" to use the fastest
+            installed one, falling back to the standard library
+
+    Returns:
+        The codec
+
+    Raises:
+        RealityDefenderError: If the named codec is unknown or not installed
+    """
+    if not isinstance(codec, str):
+        return codec
+
+    if codec == "auto":
+        for factory in CODECS.values():
+            try:
+                return factory()
+            except ImportError:
+                continue
+
+    if codec not in CODECS:
+        raise RealityDefenderError(
+            f"Unknown JSON codec {codec!r}, expected one of: auto, "
+            + ", ".join(CODECS),
+            "invalid_request",
+        )
+    try:
+        return CODECS[codec]()
+    except ImportError:
+        raise RealityDefenderError(
+            f"JSON codec {codec!r} is not installed", "invalid_request"
+        )
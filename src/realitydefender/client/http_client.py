@@ -2,15 +2,84 @@
 HTTP client for making requests to the Reality Defender API
 """
 
-import json
-from typing import Any, Dict, Optional, Tuple, TypedDict
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    TypedDict,
+    TypeVar,
+    cast,
+    Union,
+)
 
 import aiohttp
 import ssl
 import certifi
 
-from realitydefender.core.constants import DEFAULT_API_ENDPOINT
+from realitydefender.client.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    is_endpoint_failure,
+)
+from realitydefender.client.codec import JsonCodec, get_codec
+from realitydefender.client.rate_limit import (
+    RateLimitConfig,
+    RateLimiter,
+    create_rate_limiter,
+)
+from realitydefender.client.retry import (
+    RetryableError,
+    RetryBudget,
+    RetryBudgetConfig,
+    RetryPolicy,
+    call_with_retry,
+)
+from realitydefender.core.constants import (
+    API_PATHS,
+    DEFAULT_API_ENDPOINT,
+    DEFAULT_API_POOL,
+    DEFAULT_RETRY_BUDGET,
+    DEFAULT_RETRY_POLICIES,
+    DEFAULT_STORAGE_POOL,
+    UNPROCESSED_STATUSES,
+)
 from realitydefender.errors import RealityDefenderError
+from realitydefender.utils.backoff import parse_retry_after
+from realitydefender.utils.singleflight import SingleFlight
+
+T = TypeVar("T")
+
+
+class PoolConfig(TypedDict, total=False):
+    """Connection pool and timeout settings, with times in milliseconds"""
+
+    limit: int
+    """Maximum number of open connections, 0 for no limit"""
+
+    limit_per_host: int
+    """Maximum number of open connections to one host, 0 for no limit"""
+
+    keepalive_timeout: Optional[int]
+    """How long an idle connection is kept open for reuse"""
+
+    ttl_dns_cache: Optional[int]
+    """How long resolved addresses are cached, None to cache forever"""
+
+    force_close: bool
+    """Close every connection after its request instead of reusing it"""
+
+    connect_timeout: Optional[int]
+    """Maximum time to establish a connection, None for no limit"""
+
+    read_timeout: Optional[int]
+    """Maximum time between two reads from a connection, None for no limit"""
+
+    total_timeout: Optional[int]
+    """Maximum time for a whole request, None for no limit"""
 
 
 class ClientConfig(TypedDict, total=False):
@@ -18,6 +87,72 @@ class ClientConfig(TypedDict, total=False):
 
     api_key: str
     base_url: Optional[str]
+    pool: PoolConfig
+    """Connection pool used for API requests"""
+
+    storage_pool: PoolConfig
+    """Separate connection pool used for uploads to signed URLs"""
+
+    retry: Dict[str, RetryPolicy]
+    """Retry policy overrides per operation: signed_url, upload, result, list
+    or default"""
+
+    retry_budget: RetryBudgetConfig
+    """Limit on retries across all requests of the client"""
+
+    circuit_breaker: CircuitBreakerConfig
+    """Settings of the circuit breakers kept for each operation"""
+
+    rate_limits: Dict[str, RateLimitConfig]
+    """Request rates allowed per operation: signed_url, upload, result, list or
+    default. Operations without an entry are not limited."""
+
+    codec: Union[str, JsonCodec]
+    """JSON codec for responses: "auto" (default) picks orjson or msgspec when
+    installed and falls back to "stdlib"; a codec instance can also be given"""
+
+    coalesce: bool
+    """Whether concurrent identical GET requests share one request (default True)"""
+
+
+def _seconds(milliseconds: Optional[int]) -> Optional[float]:
+    return milliseconds / 1000 if milliseconds is not None else None
+
+
+def create_session(
+    pool: PoolConfig, headers: Optional[Dict[str, str]] = None
+) -> aiohttp.ClientSession:
+    """
+    Create a session with its own connection pool
+
+    Args:
+        pool: Connection pool and timeout settings
+        headers: Headers sent with every request
+
+    Returns:
+        New aiohttp.ClientSession
+    """
+    ssl_context = ssl.create_default_context(cafile=certifi.where())
+    force_close = pool.get("force_close", False)
+    ttl_dns_cache = pool.get("ttl_dns_cache")
+    conn = aiohttp.TCPConnector(
+        ssl=ssl_context,
+        limit=pool.get("limit", 100),
+        limit_per_host=pool.get("limit_per_host", 0),
+        # Cached addresses expire with second granularity
+        ttl_dns_cache=ttl_dns_cache // 1000 if ttl_dns_cache is not None else None,
+        force_close=force_close,
+        # aiohttp rejects a keep-alive timeout for connections that are not kept
+        keepalive_timeout=(
+            None if force_close else _seconds(pool.get("keepalive_timeout"))
+        ),
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=_seconds(pool.get("total_timeout")),
+        sock_connect=_seconds(pool.get("connect_timeout")),
+        sock_read=_seconds(pool.get("read_timeout")),
+    )
+    return aiohttp.ClientSession(connector=conn, timeout=timeout, headers=headers)
 
 
 class HttpClient:
@@ -34,7 +169,34 @@ class HttpClient:
         """
         self.api_key = config["api_key"]
         self.base_url = config.get("base_url") or DEFAULT_API_ENDPOINT
+        self.pool = cast(PoolConfig, {**DEFAULT_API_POOL, **config.get("pool", {})})
+        self.storage_pool = cast(
+            PoolConfig, {**DEFAULT_STORAGE_POOL, **config.get("storage_pool", {})}
+        )
+        self.codec = get_codec(config.get("codec", "auto"))
         self.session: Optional[aiohttp.ClientSession] = None
+        self.storage_session: Optional[aiohttp.ClientSession] = None
+
+        overrides = config.get("retry", {})
+        self.retry_policies: Dict[str, RetryPolicy] = {
+            operation: cast(RetryPolicy, {**policy, **overrides.get(operation, {})})
+            for operation, policy in DEFAULT_RETRY_POLICIES.items()
+        }
+        budget = cast(
+            RetryBudgetConfig,
+            {**DEFAULT_RETRY_BUDGET, **config.get("retry_budget", {})},
+        )
+        self.retry_budget = RetryBudget(
+            max_tokens=budget["max_tokens"], token_ratio=budget["token_ratio"]
+        )
+        self.circuit_breaker_config = config.get("circuit_breaker", {})
+        self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self.rate_limiters: Dict[str, RateLimiter] = {
+            operation: create_rate_limiter(operation, limit)
+            for operation, limit in config.get("rate_limits", {}).items()
+        }
+        self.coalesce = config.get("coalesce", True)
+        self.get_flights: SingleFlight[Dict[str, Any]] = SingleFlight()
 
     async def ensure_session(self) -> aiohttp.ClientSession:
         """
@@ -44,11 +206,8 @@ class HttpClient:
             Active aiohttp.ClientSession
         """
         if self.session is None or self.session.closed:
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            conn = aiohttp.TCPConnector(ssl=ssl_context)
-
-            self.session = aiohttp.ClientSession(
-                connector=conn,
+            self.session = create_session(
+                self.pool,
                 headers={
                     "X-API-KEY": self.api_key,
                     "Accept": "application/json",
@@ -56,12 +215,30 @@ class HttpClient:
             )
         return self.session
 
+    async def ensure_storage_session(self) -> aiohttp.ClientSession:
+        """
+        Ensure the session for uploads to signed URLs exists or create one
+
+        Uploads use their own connection pool so that slow bulk transfers cannot
+        take the connections needed by API requests. The API key is not sent to
+        the storage host.
+
+        Returns:
+            Active aiohttp.ClientSession
+        """
+        if self.storage_session is None or self.storage_session.closed:
+            self.storage_session = create_session(self.storage_pool)
+        return self.storage_session
+
     async def get(
         self, path: str, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Make a GET request to the API
 
+        Unless coalescing is disabled, concurrent calls with the same path and
+        parameters share one request and receive the same response.
+
         Args:
             path: API endpoint path
             params: Query parameters
@@ -75,11 +252,20 @@ class HttpClient:
         session = await self.ensure_session()
         url = f"{self.base_url}{path}"
 
-        try:
+        async def attempt() -> Dict[str, Any]:
             async with session.get(url, params=params) as response:
-                return await self._handle_response(response)
-        except aiohttp.ClientError as e:
-            raise RealityDefenderError(f"HTTP request failed: {str(e)}", "server_error")
+                return await self._handle_retryable_response(response, "GET", path)
+
+        async def request() -> Dict[str, Any]:
+            return await self.with_retry(
+                self.operation("GET", path), self._wrap_errors(attempt)
+            )
+
+        if not self.coalesce:
+            return await request()
+        # Concurrent identical GETs share one request and its response
+        key = (path, tuple(sorted((params or {}).items())))
+        return await self.get_flights.do(key, request)
 
     async def post(
         self,
@@ -118,11 +304,182 @@ class HttpClient:
                     field_name, content, filename=filename, content_type=content_type
                 )
 
-        try:
+        async def attempt() -> Dict[str, Any]:
             async with session.post(url, data=form_data) as response:
-                return await self._handle_response(response)
-        except aiohttp.ClientError as e:
-            raise RealityDefenderError(f"HTTP request failed: {str(e)}", "server_error")
+                return await self._handle_retryable_response(response, "POST", path)
+
+        return await self.with_retry(
+            self.operation("POST", path),
+            self._wrap_errors(attempt),
+            idempotent=False,
+        )
+
+    def operation(self, method: str, path: str) -> str:
+        """
+        Get the name of the retry policy for a request
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+
+        Returns:
+            The operation name: signed_url, result, list or default
+        """
+        if method == "POST" and path == API_PATHS["SIGNED_URL"]:
+            return "signed_url"
+        if method == "GET" and path.startswith(API_PATHS["ALL_MEDIA_RESULTS"]):
+            return "list"
+        if method == "GET" and path.startswith(API_PATHS["MEDIA_RESULT"]):
+            return "result"
+        return "default"
+
+    async def with_retry(
+        self,
+        operation: str,
+        attempt: Callable[[], Awaitable[T]],
+        idempotent: bool = True,
+        max_attempts: Optional[int] = None,
+    ) -> T:
+        """
+        Run an attempt under the rate limit, retry policy and circuit breaker of
+        an operation
+
+        Every attempt, including retries, waits for the operation's rate limit.
+
+        Args:
+            operation: Name of the operation
+            attempt: Performs one attempt, raising RetryableError on transient
+                failures
+            idempotent: Whether repeating a processed request is safe
+            max_attempts: Maximum number of attempts, replacing the policy's,
+                e.g. 1 for requests whose body cannot be sent again
+
+        Returns:
+            The result of the first successful attempt
+
+        Raises:
+            RealityDefenderError: The error of the last attempt, or "circuit_open"
+                while the operation's endpoint is failing
+        """
+        policy = self.retry_policies.get(operation, self.retry_policies["default"])
+        if max_attempts is not None:
+            policy = {**policy, "max_attempts": max_attempts}
+        breaker = self.circuit_breaker(operation)
+        limiter = self.rate_limiters.get(operation)
+
+        async def guarded() -> T:
+            if limiter is not None:
+                await limiter.acquire()
+            breaker.before_call()
+            try:
+                result = await attempt()
+            except RetryableError:
+                breaker.on_failure()
+                raise
+            except RealityDefenderError as e:
+                if is_endpoint_failure(e):
+                    breaker.on_failure()
+                else:
+                    # The endpoint answered, even if it rejected the request
+                    breaker.on_success()
+                raise
+            except BaseException:
+                breaker.on_cancel()
+                raise
+            breaker.on_success()
+            return result
+
+        return await call_with_retry(guarded, policy, self.retry_budget, idempotent)
+
+    def circuit_breaker(self, operation: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker of an endpoint class
+
+        Args:
+            operation: Name of the operation: signed_url, upload, result, list or
+                default
+
+        Returns:
+            The circuit breaker shared by all requests of the operation
+        """
+        breaker = self.circuit_breakers.get(operation)
+        if breaker is None:
+            breaker = CircuitBreaker(operation, self.circuit_breaker_config)
+            self.circuit_breakers[operation] = breaker
+        return breaker
+
+    def _wrap_errors(
+        self, attempt: Callable[[], Awaitable[T]]
+    ) -> Callable[[], Awaitable[T]]:
+        """
+        Mark connection failures and timeouts of an attempt as retryable
+
+        Args:
+            attempt: Performs one request
+
+        Returns:
+            The attempt with transport errors converted to RetryableError
+        """
+
+        async def wrapped() -> T:
+            try:
+                return await attempt()
+            except aiohttp.ClientConnectorError as e:
+                # The request never reached the server
+                raise RetryableError(
+                    RealityDefenderError(
+                        f"HTTP request failed: {str(e)}", "server_error"
+                    ),
+                    processed=False,
+                )
+            except aiohttp.ClientError as e:
+                raise RetryableError(
+                    RealityDefenderError(
+                        f"HTTP request failed: {str(e)}", "server_error"
+                    )
+                )
+            except asyncio.TimeoutError:
+                raise RetryableError(
+                    RealityDefenderError("HTTP request timed out", "timeout")
+                )
+
+        return wrapped
+
+    async def _handle_retryable_response(
+        self, client_response: aiohttp.ClientResponse, method: str, path: str
+    ) -> Dict[str, Any]:
+        """
+        Handle an HTTP response, marking transient failures as retryable
+
+        Args:
+            client_response: HTTP response from aiohttp
+            method: HTTP method of the request
+            path: API endpoint path of the request
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            RetryableError: If the status is retried by the operation's policy
+            RealityDefenderError: If the response contains another error
+        """
+        status = client_response.status
+        policy = self.retry_policies.get(
+            self.operation(method, path), self.retry_policies["default"]
+        )
+        if status not in policy.get("retry_statuses", []):
+            return await self._handle_response(client_response)
+
+        try:
+            return await self._handle_response(client_response)
+        except RealityDefenderError as e:
+            raise RetryableError(
+                e,
+                retry_after=parse_retry_after(
+                    client_response.headers.get("Retry-After")
+                ),
+                processed=status not in UNPROCESSED_STATUSES,
+            )
 
     async def _handle_response(
         self, client_response: aiohttp.ClientResponse
@@ -142,46 +499,51 @@ class HttpClient:
         json_content: Dict[str, Any] | None = None
         code: str
         response: str
+        body: bytes = await client_response.read()
         try:
-            json_content = await client_response.json()
+            # Decode straight from the body bytes, without an intermediate str
+            json_content = self.codec.loads(body)
             code = json_content.get("code") or ""
             response = json_content.get("response") or "Unknown error"
-        except json.JSONDecodeError:
-            text_content: str = await client_response.text()
+        except ValueError:
+            json_content = None
             code = ""
-            response = text_content
+            response = body.decode("utf-8", errors="replace")
 
         # Handle error responses.
-        if client_response.status == 400:
+        status = client_response.status
+        if status == 400:
             if code in ["free-tier-not-allowed", "upload-limit-reached"]:
-                raise RealityDefenderError(response, "unauthorized")
+                raise RealityDefenderError(response, "unauthorized", status)
             else:
                 raise RealityDefenderError(
-                    f"Invalid request: {response}", "invalid_request"
+                    f"Invalid request: {response}", "invalid_request", status
                 )
 
-        elif client_response.status == 401:
-            raise RealityDefenderError("Invalid API key", "unauthorized")
+        elif status == 401:
+            raise RealityDefenderError("Invalid API key", "unauthorized", status)
 
-        elif client_response.status == 404:
-            raise RealityDefenderError("Resource not found", "not_found")
+        elif status == 404:
+            raise RealityDefenderError("Resource not found", "not_found", status)
 
-        elif client_response.status > 400:
+        elif status > 400:
             # Anything else is a generic API error, originated from the server.
-            raise RealityDefenderError(f"API error: {response}", "server_error")
+            raise RealityDefenderError(f"API error: {response}", "server_error", status)
 
         elif json_content is None:
             raise RealityDefenderError(
-                f"Invalid JSON response: {response}", "server_error"
+                f"Invalid JSON response: {response}", "server_error", status
             )
 
         # Return response unchanged.
         return json_content
 
     async def close(self) -> None:
-        """Close the HTTP session if it exists"""
+        """Close the HTTP sessions if they exist"""
         if self.session and not self.session.closed:
             await self.session.close()
+        if self.storage_session and not self.storage_session.closed:
+            await self.storage_session.close()
 
 
 def create_http_client(config: ClientConfig) -> HttpClient:
@@ -0,0 +1,230 @@
+"""
+Client-side rate limiting with token buckets
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Optional, Protocol, TypedDict
+
+from realitydefender.errors import RealityDefenderError
+from realitydefender.utils.async_utils import run_blocking
+
+
+class RateLimitConfig(TypedDict, total=False):
+    """Request rate allowed for an operation"""
+
+    rate: float
+    """Sustained number of requests per second"""
+
+    burst: int
+    """Number of requests that can be sent at once after a quiet period"""
+
+    shared_path: Optional[str]
+    """SQLite database shared with other processes on the host, None to limit
+    this process only"""
+
+
+class RateLimiter(Protocol):
+    """Limits how often requests are sent"""
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent"""
+        ...
+
+
+def _validate(rate: float, burst: int) -> None:
+    if rate <= 0 or burst < 1:
+        raise RealityDefenderError(
+            "rate must be positive and burst at least 1", "invalid_request"
+        )
+
+
+class TokenBucket:
+    """
+    Token bucket shared by the coroutines and threads of one process
+
+    Tokens are added at `rate` per second up to `burst`. Each request takes one
+    token; when the bucket is empty the request reserves the next token and
+    waits for it, so waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """
+        Initialize the bucket, initially full
+
+        Args:
+            rate: Tokens added per second
+            burst: Capacity of the bucket
+        """
+        _validate(rate, burst)
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take the next token, which may only become available in the future
+
+        Returns:
+            Seconds to wait before the token may be used
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def release(self) -> None:
+        """Give back a token reserved but never used"""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+
+    async def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                # Waiters queued behind a cancelled one do not wait for its token
+                self.release()
+                raise
+
+
+class SQLiteTokenBucket:
+    """
+    Token bucket stored in a SQLite database shared by processes on one host
+
+    Every acquisition updates the bucket in an immediate transaction, so workers
+    of a pre-fork server together stay within a single quota.
+    """
+
+    def __init__(self, path: str, name: str, rate: float, burst: int) -> None:
+        """
+        Initialize the bucket, creating it full if it does not exist yet
+
+        Args:
+            path: Location of the database file, created if missing
+            name: Name of the bucket within the database
+            rate: Tokens added per second
+            burst: Capacity of the bucket
+        """
+        _validate(rate, burst)
+        self.path = path
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        try:
+            self._connection = sqlite3.connect(
+                path, timeout=30, check_same_thread=False, isolation_level=None
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS token_buckets ("
+                "name TEXT PRIMARY KEY, tokens REAL NOT NULL, "
+                "updated_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "INSERT OR IGNORE INTO token_buckets (name, tokens, updated_at) "
+                "VALUES (?, ?, ?)",
+                (name, float(burst), time.time()),
+            )
+        except sqlite3.Error as e:
+            raise RealityDefenderError(
+                f"Failed to open rate limit database: {str(e)}", "unknown_error"
+            )
+
+    def reserve(self) -> float:
+        """
+        Take the next token, which may only become available in the future
+
+        Returns:
+            Seconds to wait before the token may be used
+        """
+        with self._lock:
+            connection = self._connection
+            # Lock the database for writing so that no other process can take
+            # a token between the read and the update
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                stored, updated_at = connection.execute(
+                    "SELECT tokens, updated_at FROM token_buckets WHERE name = ?",
+                    (self.name,),
+                ).fetchone()
+                now = time.time()
+                tokens: float = min(
+                    self.burst, stored + max(0.0, now - updated_at) * self.rate
+                )
+                tokens -= 1
+                connection.execute(
+                    "UPDATE token_buckets SET tokens = ?, updated_at = ? "
+                    "WHERE name = ?",
+                    (tokens, now, self.name),
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return max(0.0, -tokens / self.rate)
+
+    async def acquire(self) -> None:
+        try:
+            wait = await run_blocking(self.reserve)
+        except sqlite3.Error as e:
+            raise RealityDefenderError(
+                f"Failed to update rate limit: {str(e)}", "unknown_error"
+            )
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                # Other processes queued behind this request must not wait for
+                # a token it never used
+                try:
+                    await run_blocking(self.release)
+                except sqlite3.Error:
+                    pass
+                raise
+
+    def release(self) -> None:
+        """Give back a token reserved but never used"""
+        with self._lock:
+            self._connection.execute(
+                "UPDATE token_buckets SET tokens = MIN(?, tokens + 1) WHERE name = ?",
+                (float(self.burst), self.name),
+            )
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+
+def create_rate_limiter(name: str, config: RateLimitConfig) -> RateLimiter:
+    """
+    Create the rate limiter described by a configuration
+
+    Args:
+        name: Name of the limited operation, shared by all processes using it
+        config: Rate, burst and optional shared database
+
+    Returns:
+        A SQLite-backed bucket if shared_path is set, an in-process one otherwise
+    """
+    if "rate" not in config:
+        raise RealityDefenderError(
+            "rate is required for rate limits", "invalid_request"
+        )
+    rate = config["rate"]
+    burst = config.get("burst", max(1, int(rate)))
+    shared_path = config.get("shared_path")
+    if shared_path:
+        return SQLiteTokenBucket(shared_path, name, rate, burst)
+    return TokenBucket(rate, burst)
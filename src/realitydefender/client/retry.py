@@ -0,0 +1,156 @@
+"""
+Retries of transient HTTP failures with backoff and a shared retry budget
+"""
+
+from typing import Awaitable, Callable, List, Optional, TypedDict, TypeVar
+
+from realitydefender.errors import RealityDefenderError
+from realitydefender.utils.async_utils import sleep
+from realitydefender.utils.backoff import decorrelated_jitter
+
+T = TypeVar("T")
+
+
+class RetryPolicy(TypedDict, total=False):
+    """How an operation is retried, with times in milliseconds"""
+
+    max_attempts: int
+    """Maximum number of attempts including the first one, 1 disables retries"""
+
+    base_delay: int
+    """Minimum delay before a retry"""
+
+    max_delay: int
+    """Maximum delay before a retry, longer Retry-After values are not waited for"""
+
+    retry_statuses: List[int]
+    """HTTP statuses that are retried"""
+
+
+class RetryBudgetConfig(TypedDict, total=False):
+    """Settings of the retry budget shared by all requests of a client"""
+
+    max_tokens: float
+    """Capacity of the budget; retries stop once half of it is used up"""
+
+    token_ratio: float
+    """Tokens returned by each successful request"""
+
+
+class RetryableError(Exception):
+    """A failed attempt that may succeed if it is repeated"""
+
+    def __init__(
+        self,
+        error: RealityDefenderError,
+        retry_after: Optional[int] = None,
+        processed: bool = True,
+    ) -> None:
+        """
+        Initialize the error
+
+        Args:
+            error: Error raised if the attempt is not retried
+            retry_after: Delay in milliseconds requested by the server
+            processed: Whether the server may have acted on the request, which
+                makes retrying unsafe for requests that are not idempotent
+        """
+        super().__init__(str(error))
+        self.error = error
+        self.retry_after = retry_after
+        self.processed = processed
+
+
+class RetryBudget:
+    """
+    Token bucket that limits retries across all requests of a client
+
+    Every failed attempt takes a token and every success returns a fraction of
+    one. Retries are only allowed while more than half of the tokens are left, so
+    during an outage retries stop instead of multiplying the load on the server.
+    """
+
+    def __init__(self, max_tokens: float = 10, token_ratio: float = 0.1) -> None:
+        """
+        Initialize the budget
+
+        Args:
+            max_tokens: Capacity of the budget
+            token_ratio: Tokens returned by each successful request
+        """
+        if max_tokens <= 0 or token_ratio < 0:
+            raise RealityDefenderError(
+                "max_tokens must be positive and token_ratio not negative",
+                "invalid_request",
+            )
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self.tokens = max_tokens
+
+    def can_retry(self) -> bool:
+        """Whether a failed attempt may be retried"""
+        return self.tokens > self.max_tokens / 2
+
+    def on_success(self) -> None:
+        """Record a successful request"""
+        self.tokens = min(self.max_tokens, self.tokens + self.token_ratio)
+
+    def on_failure(self) -> None:
+        """Record a failed attempt"""
+        self.tokens = max(0.0, self.tokens - 1)
+
+
+async def call_with_retry(
+    attempt: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    budget: Optional[RetryBudget] = None,
+    idempotent: bool = True,
+) -> T:
+    """
+    Call a function until it succeeds or its failure should not be retried
+
+    Only RetryableError failures are retried. Requests that are not idempotent
+    are only retried when the server did not process them.
+
+    Args:
+        attempt: Performs one attempt, raising RetryableError on transient failures
+        policy: Retry policy of the operation
+        budget: Retry budget shared with other requests
+        idempotent: Whether repeating a processed request is safe
+
+    Returns:
+        The result of the first successful attempt
+
+    Raises:
+        RealityDefenderError: The error of the last attempt
+    """
+    max_attempts = policy.get("max_attempts", 1)
+    base_delay = policy.get("base_delay", 0)
+    max_delay = policy.get("max_delay", base_delay)
+    delay = base_delay
+
+    attempts = 0
+    while True:
+        attempts += 1
+        try:
+            result = await attempt()
+        except RetryableError as e:
+            if budget is not None:
+                budget.on_failure()
+            if (
+                attempts >= max_attempts
+                or (e.processed and not idempotent)
+                or (budget is not None and not budget.can_retry())
+                or (e.retry_after is not None and e.retry_after > max_delay)
+            ):
+                raise e.error
+
+            delay = decorrelated_jitter(delay, base_delay, max_delay)
+            if e.retry_after is not None:
+                delay = max(delay, e.retry_after)
+            await sleep(delay)
+            continue
+
+        if budget is not None:
+            budget.on_success()
+        return result
@@ -13,22 +13,170 @@ API_PATHS = {
     "SOCIAL_MEDIA": "/api/files/social",
 }
 
+# Statuses of a detection that has not reached its final result yet
+PENDING_STATUSES = ["ANALYZING", "UNKNOWN"]
+
+# Default connection pool settings for API requests, times in milliseconds
+DEFAULT_API_POOL = {
+    "limit": 100,
+    "limit_per_host": 0,
+    "keepalive_timeout": 15000,
+    "ttl_dns_cache": 10000,
+    "force_close": False,
+    "connect_timeout": 30000,
+    "read_timeout": None,
+    "total_timeout": 300000,
+}
+
+# Default connection pool settings for uploads to signed URLs. Large uploads
+# can take a long time, so only establishing the connection is time-limited.
+DEFAULT_STORAGE_POOL = {
+    "limit": 100,
+    "limit_per_host": 0,
+    "keepalive_timeout": 15000,
+    "ttl_dns_cache": 10000,
+    "force_close": False,
+    "connect_timeout": 30000,
+    "read_timeout": None,
+    "total_timeout": None,
+}
+
+# Default retry policies per operation, times in milliseconds. Storage hosts
+# also ask for retries of 500 responses, the API does not.
+DEFAULT_RETRY_POLICIES = {
+    "default": {
+        "max_attempts": 3,
+        "base_delay": 100,
+        "max_delay": 5000,
+        "retry_statuses": [429, 502, 503, 504],
+    },
+    "signed_url": {
+        "max_attempts": 3,
+        "base_delay": 100,
+        "max_delay": 5000,
+        "retry_statuses": [429, 502, 503, 504],
+    },
+    "upload": {
+        "max_attempts": 3,
+        "base_delay": 500,
+        "max_delay": 10000,
+        "retry_statuses": [429, 500, 502, 503, 504],
+    },
+    "result": {
+        "max_attempts": 4,
+        "base_delay": 100,
+        "max_delay": 5000,
+        "retry_statuses": [429, 502, 503, 504],
+    },
+    "list": {
+        "max_attempts": 4,
+        "base_delay": 200,
+        "max_delay": 10000,
+        "retry_statuses": [429, 502, 503, 504],
+    },
+}
+
+# HTTP statuses returned before a request is processed, so that retrying even
+# non-idempotent requests is safe
+UNPROCESSED_STATUSES = [429, 503]
+
+# Default retry budget shared by all requests of a client
+DEFAULT_RETRY_BUDGET = {"max_tokens": 10, "token_ratio": 0.1}
+
+# Default circuit breaker settings, times in milliseconds
+DEFAULT_CIRCUIT_BREAKER = {
+    "failure_threshold": 5,
+    "reset_timeout": 30000,
+    "half_open_max_calls": 1,
+}
+
 # Default polling interval in milliseconds
 DEFAULT_POLLING_INTERVAL = 2000
 
+# Default number of result polls a polling scheduler sends concurrently
+DEFAULT_POLLING_CONCURRENCY = 16
+
 # Default timeout in milliseconds (1 minute)
 DEFAULT_TIMEOUT = 60000
 
 # Default maximum polling attempts
 DEFAULT_MAX_ATTEMPTS = 30
 
+# Default maximum time in milliseconds between polls of a backing off polling
+# strategy (30 seconds)
+DEFAULT_POLLING_MAX_INTERVAL = 30000
+
+# Default number of result pages fetched ahead while iterating over results
+DEFAULT_RESULTS_PREFETCH = 4
+
+# Default number of result pages fetched concurrently when listing all results
+DEFAULT_RESULTS_CONCURRENCY = 8
+
+# Default maximum number of results in one date range shard of a sharded listing
+DEFAULT_SHARD_MAX_ITEMS = 1000
+
+# Default number of results kept by a result cache
+DEFAULT_RESULT_CACHE_SIZE = 10000
+
+# Default time in milliseconds a not found answer is cached for (5 seconds)
+DEFAULT_NOT_FOUND_TTL = 5000
+
+# Percentiles of the observed processing times at which a processing time
+# estimator polls for a result
+DEFAULT_ESTIMATOR_PERCENTILES = (0.5, 0.75, 0.9, 0.99)
+
+# Minimum number of processing times observed for a kind of media before a
+# processing time estimator schedules its polls
+DEFAULT_ESTIMATOR_MIN_SAMPLES = 5
+
+# Maximum number of processing times a processing time estimator keeps per kind
+# of media, older ones are dropped first
+DEFAULT_ESTIMATOR_MAX_SAMPLES = 200
+
+# Minimum time in milliseconds between polls scheduled by a processing time
+# estimator
+MIN_ESTIMATED_POLLING_INTERVAL = 250
+
+# Maximum number of uploads a processing time estimator times at once, the
+# oldest ones are dropped first
+DEFAULT_ESTIMATOR_MAX_PENDING = 10000
+
+# Time in milliseconds after which a processing time estimator stops timing an
+# upload whose result was never seen (1 hour)
+DEFAULT_ESTIMATOR_PENDING_TTL = 3600000
+
+# Minimum time in milliseconds between two saves of a processing time
+# estimator's observations by get_result
+DEFAULT_ESTIMATOR_SAVE_INTERVAL = 60000
+
+# Default chunk size in bytes for streaming uploads (1 MiB)
+DEFAULT_UPLOAD_CHUNK_SIZE = 1048576
+
+# Default part size in bytes for multipart uploads (8 MiB)
+DEFAULT_MULTIPART_PART_SIZE = 8388608
+
+# Minimum part size in bytes for multipart uploads, except the last part (5 MiB)
+MIN_MULTIPART_PART_SIZE = 5242880
+
+# Default number of parts uploaded concurrently in a multipart upload
+DEFAULT_MULTIPART_CONCURRENCY = 4
+
+# Default lifetime of an upload journal entry in milliseconds (1 hour), which
+# should not exceed the validity of a signed URL
+DEFAULT_UPLOAD_JOURNAL_TTL = 3600000
+
 # Supported file types and maximum sizes for each one of them.
 SUPPORTED_FILE_TYPES: list[dict] = [
-    {"extensions": [".mp4", ".mov"], "size_limit": 262144000},
-    {"extensions": [".jpg", ".png", ".jpeg", ".gif", ".webp"], "size_limit": 52428800},
+    {"extensions": [".mp4", ".mov"], "size_limit": 262144000, "media_type": "video"},
+    {
+        "extensions": [".jpg", ".png", ".jpeg", ".gif", ".webp"],
+        "size_limit": 52428800,
+        "media_type": "image",
+    },
     {
         "extensions": [".flac", ".wav", ".mp3", ".m4a", ".aac", ".alac", ".ogg"],
         "size_limit": 20971520,
+        "media_type": "audio",
     },
-    {"extensions": [".txt"], "size_limit": 5242880},
+    {"extensions": [".txt"], "size_limit": 5242880, "media_type": "text"},
 ]
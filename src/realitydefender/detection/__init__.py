@@ -2,7 +2,49 @@
 Detection functionality for the Reality Defender SDK
 """
 
-from .results import get_detection_result
-from .upload import upload_file
+from .estimator import EstimatedPolling, ProcessingStats, ProcessingTimeEstimator
+from .journal import UploadJournal
+from .polling import (
+    DecorrelatedJitterPolling,
+    ExponentialPolling,
+    FixedPolling,
+    MediaTypePolling,
+    PollingStrategy,
+)
+from .scheduler import PollingScheduler
+from .planner import DateShard, iter_sharded_results
+from .sync import SyncReport, sync_results
+from .multipart import upload_multipart
+from .results import (
+    get_all_detection_results,
+    get_detection_result,
+    iter_detection_result_pages,
+    iter_detection_results,
+)
+from .upload import upload_bytes, upload_file, upload_fileobj, upload_stream
 
-__all__ = ["upload_file", "get_detection_result"]
+__all__ = [
+    "upload_file",
+    "upload_bytes",
+    "upload_fileobj",
+    "upload_stream",
+    "upload_multipart",
+    "get_detection_result",
+    "iter_detection_results",
+    "iter_detection_result_pages",
+    "get_all_detection_results",
+    "iter_sharded_results",
+    "DateShard",
+    "sync_results",
+    "SyncReport",
+    "PollingScheduler",
+    "PollingStrategy",
+    "FixedPolling",
+    "ExponentialPolling",
+    "DecorrelatedJitterPolling",
+    "MediaTypePolling",
+    "EstimatedPolling",
+    "ProcessingTimeEstimator",
+    "ProcessingStats",
+    "UploadJournal",
+]
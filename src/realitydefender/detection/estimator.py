@@ -0,0 +1,408 @@
+"""
+Estimation of processing times to schedule result polls
+"""
+
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, TypedDict
+
+from realitydefender.core.constants import (
+    DEFAULT_ESTIMATOR_MAX_PENDING,
+    DEFAULT_ESTIMATOR_MAX_SAMPLES,
+    DEFAULT_ESTIMATOR_MIN_SAMPLES,
+    DEFAULT_ESTIMATOR_PENDING_TTL,
+    DEFAULT_ESTIMATOR_PERCENTILES,
+    DEFAULT_ESTIMATOR_SAVE_INTERVAL,
+    MIN_ESTIMATED_POLLING_INTERVAL,
+    PENDING_STATUSES,
+)
+from realitydefender.detection.polling import FixedPolling, PollingStrategy
+from realitydefender.errors import RealityDefenderError
+from realitydefender.model import DetectionResult
+
+
+class ProcessingStats(TypedDict):
+    """Counters of a processing time estimator"""
+
+    results: int
+    """Results whose processing time was recorded"""
+
+    polls: int
+    """Polls sent for those results"""
+
+    wasted_polls: int
+    """Polls that found the result still being processed"""
+
+    samples: int
+    """Processing times kept across all kinds of media"""
+
+
+class EstimatedPolling:
+    """
+    Polls at percentiles of the processing times observed for similar media
+
+    The first poll is sent once the first percentile of the observed times has
+    elapsed, each following one at the next percentile. Past the last
+    percentile, the fallback strategy takes over. The strategy counts the
+    polls that found the result still being processed, so each request needs
+    an instance of its own.
+    """
+
+    def __init__(
+        self,
+        schedule: Sequence[int],
+        fallback: PollingStrategy,
+        started: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the strategy
+
+        Args:
+            schedule: Times after the upload at which to poll, in milliseconds
+                and increasing order; empty to only use the fallback
+            fallback: Strategy used once the schedule is exhausted
+            started: time.monotonic() at the end of the upload, now if None
+        """
+        self.schedule = list(schedule)
+        self.fallback = fallback
+        self.started = started if started is not None else time.monotonic()
+        self.wasted_polls = 0
+
+    def first_delay(self) -> int:
+        if not self.schedule:
+            return self.fallback.first_delay()
+        # Polling may start a while after the upload finished
+        elapsed = int((time.monotonic() - self.started) * 1000)
+        return max(self.schedule[0] - elapsed, 0)
+
+    def next_delay(self, previous: int) -> int:
+        self.wasted_polls += 1
+        index = self.wasted_polls
+        if index < len(self.schedule):
+            return max(
+                self.schedule[index] - self.schedule[index - 1],
+                MIN_ESTIMATED_POLLING_INTERVAL,
+            )
+        if index == len(self.schedule):
+            # Start the fallback afresh rather than from the last scheduled gap
+            previous = 0
+        return self.fallback.next_delay(previous)
+
+
+class ProcessingTimeEstimator:
+    """
+    Learns how long the API takes to process media, to poll when results are due
+
+    Processing times are measured from the end of an upload until its result
+    is seen with a final status, and kept per file extension and power-of-two
+    size bucket. Once enough times were observed for a kind of media, its
+    requests are polled at percentiles of those times instead of right away
+    and every couple of seconds. Observations are kept in a small JSON file
+    when a path is given, so they survive restarts.
+
+    Uploads whose result is never seen with a final status stop being timed
+    after pending_ttl, or once max_pending newer uploads are being timed.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        percentiles: Sequence[float] = DEFAULT_ESTIMATOR_PERCENTILES,
+        min_samples: int = DEFAULT_ESTIMATOR_MIN_SAMPLES,
+        max_samples: int = DEFAULT_ESTIMATOR_MAX_SAMPLES,
+        fallback: Optional[PollingStrategy] = None,
+        max_pending: int = DEFAULT_ESTIMATOR_MAX_PENDING,
+        pending_ttl: int = DEFAULT_ESTIMATOR_PENDING_TTL,
+        save_interval: int = DEFAULT_ESTIMATOR_SAVE_INTERVAL,
+    ) -> None:
+        """
+        Initialize the estimator
+
+        Args:
+            path: Location of the JSON file keeping the observations, None to
+                keep them in memory only
+            percentiles: Increasing fractions of the observed processing times
+                at which to poll, e.g. 0.5 for the median
+            min_samples: Number of observations needed before polls of a kind
+                of media are scheduled from them
+            max_samples: Number of observations kept per kind of media, older
+                ones are dropped first
+            fallback: Strategy for media without enough observations and for
+                polls past the last percentile, polling at a fixed interval by
+                default
+            max_pending: Maximum number of uploads timed at once, the oldest
+                ones are dropped first
+            pending_ttl: Time in milliseconds after which an upload whose
+                result was not seen stops being timed
+            save_interval: Minimum time in milliseconds between saves that
+                save_due allows
+        """
+        if max_pending < 1:
+            raise RealityDefenderError(
+                "max_pending must be at least 1", "invalid_request"
+            )
+        if not percentiles or list(percentiles) != sorted(percentiles):
+            raise RealityDefenderError(
+                "percentiles must be a non-empty increasing sequence",
+                "invalid_request",
+            )
+        if any(not 0 < percentile <= 1 for percentile in percentiles):
+            raise RealityDefenderError(
+                "percentiles must be between 0 and 1", "invalid_request"
+            )
+        self.path = path
+        self.percentiles = list(percentiles)
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.max_pending = max_pending
+        self.pending_ttl = pending_ttl
+        self.save_interval = save_interval
+        self.fallback: PollingStrategy = (
+            fallback if fallback is not None else FixedPolling()
+        )
+        self._lock = threading.Lock()
+        self._samples: Dict[str, List[int]] = {}
+        self._stats: ProcessingStats = {
+            "results": 0,
+            "polls": 0,
+            "wasted_polls": 0,
+            "samples": 0,
+        }
+        # Uploads whose result is awaited: (bucket, start time, strategy), in
+        # the order they started
+        self._pending: Dict[str, Tuple[str, float, EstimatedPolling]] = {}
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        self._load()
+
+    @staticmethod
+    def bucket(filename: str, size: int) -> str:
+        """
+        Get the kind of media a file is grouped with
+
+        Args:
+            filename: Name or path of the file
+            size: Size of the file in bytes
+
+        Returns:
+            Key made of the lower-case extension and the power-of-two size bucket
+        """
+        extension = os.path.splitext(filename)[1].lower()
+        return f"{extension}:{max(size, 0).bit_length()}"
+
+    def start(self, request_id: str, filename: str, size: int) -> None:
+        """
+        Start timing the processing of an uploaded file
+
+        Args:
+            request_id: Request ID assigned to the upload
+            filename: Name or path of the uploaded file
+            size: Size of the uploaded file in bytes
+        """
+        key = self.bucket(filename, size)
+        started = time.monotonic()
+        strategy = EstimatedPolling(self._schedule(key), self.fallback, started)
+        with self._lock:
+            self._pending.pop(request_id, None)
+            self._evict(started)
+            self._pending[request_id] = (key, started, strategy)
+
+    def strategy_for(self, request_id: str) -> Optional[PollingStrategy]:
+        """
+        Get the polling strategy of a request whose upload is being timed
+
+        Args:
+            request_id: Request ID assigned to the upload
+
+        Returns:
+            The strategy, or None if the upload was not timed by this estimator
+        """
+        with self._lock:
+            pending = self._pending.get(request_id)
+        return pending[2] if pending is not None else None
+
+    def finish(self, request_id: str, result: DetectionResult) -> bool:
+        """
+        Record the processing time of a request once its result is final
+
+        Results still being processed are ignored. Call save to persist the
+        observations.
+
+        Args:
+            request_id: Request ID assigned to the upload
+            result: Detection result returned for the request
+
+        Returns:
+            Whether a processing time was recorded
+        """
+        if result["status"] in PENDING_STATUSES:
+            return False
+        with self._lock:
+            pending = self._pending.pop(request_id, None)
+            if pending is None:
+                return False
+            key, started, strategy = pending
+            duration = int((time.monotonic() - started) * 1000)
+            self._observe(key, duration)
+            self._stats["results"] += 1
+            self._stats["polls"] += strategy.wasted_polls + 1
+            self._stats["wasted_polls"] += strategy.wasted_polls
+            self._dirty = True
+        return True
+
+    def discard(self, request_id: str) -> None:
+        """
+        Stop timing a request without recording its processing time
+
+        Used when the result was answered from a cache or the request does not
+        exist, so the time taken says nothing about processing.
+
+        Args:
+            request_id: Request ID assigned to the upload
+        """
+        with self._lock:
+            self._pending.pop(request_id, None)
+
+    def observe(self, filename: str, size: int, duration: int) -> None:
+        """
+        Record a processing time measured elsewhere
+
+        Args:
+            filename: Name or path of the processed file
+            size: Size of the processed file in bytes
+            duration: Time from upload to final result in milliseconds
+        """
+        with self._lock:
+            self._observe(self.bucket(filename, size), duration)
+            self._dirty = True
+
+    def estimate(
+        self, filename: str, size: int, percentile: float = 0.5
+    ) -> Optional[int]:
+        """
+        Estimate the processing time of a file
+
+        Args:
+            filename: Name or path of the file
+            size: Size of the file in bytes
+            percentile: Fraction of similar media processed within the estimate
+
+        Returns:
+            Estimated processing time in milliseconds, or None without enough
+            observations of similar media
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(self.bucket(filename, size), []))
+        if len(samples) < self.min_samples:
+            return None
+        return _percentile(samples, percentile)
+
+    def stats(self) -> ProcessingStats:
+        """
+        Get the counters of the estimator
+
+        Returns:
+            Results recorded, polls and wasted polls sent for them, and samples
+            kept
+        """
+        with self._lock:
+            stats = self._stats.copy()
+            stats["samples"] = sum(len(x) for x in self._samples.values())
+            return stats
+
+    def save_due(self) -> bool:
+        """
+        Whether new observations were not saved for at least save_interval
+
+        Returns:
+            True if save should be called, always False without a path
+        """
+        with self._lock:
+            return (
+                self.path is not None
+                and self._dirty
+                and (time.monotonic() - self._saved_at) * 1000 >= self.save_interval
+            )
+
+    def save(self) -> None:
+        """
+        Persist the observations and counters
+
+        Raises:
+            RealityDefenderError: If the file cannot be written
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            content = {"samples": self._samples, "stats": dict(self._stats)}
+            directory = os.path.dirname(os.path.abspath(self.path))
+            temp_path: Optional[str] = None
+            try:
+                # Write to a temporary file and rename so a crash never leaves a
+                # truncated file behind
+                fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(content, f)
+                os.replace(temp_path, self.path)
+                self._dirty = False
+                self._saved_at = time.monotonic()
+            except OSError as e:
+                if temp_path is not None and os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise RealityDefenderError(
+                    f"Failed to write processing times: {str(e)}", "unknown_error"
+                )
+
+    def _schedule(self, key: str) -> List[int]:
+        """Get the poll times of a kind of media, empty without enough samples"""
+        with self._lock:
+            samples = sorted(self._samples.get(key, []))
+        if len(samples) < self.min_samples:
+            return []
+        return [_percentile(samples, percentile) for percentile in self.percentiles]
+
+    def _evict(self, now: float) -> None:
+        """Stop timing expired and excess uploads, with the lock held"""
+        expired = now - self.pending_ttl / 1000
+        while self._pending:
+            request_id, (_, started, _) = next(iter(self._pending.items()))
+            if started > expired and len(self._pending) < self.max_pending:
+                break
+            del self._pending[request_id]
+
+    def _observe(self, key: str, duration: int) -> None:
+        """Keep a processing time, with the lock held"""
+        samples = self._samples.setdefault(key, [])
+        samples.append(duration)
+        del samples[: -self.max_samples]
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                content = json.load(f)
+            samples = {
+                str(key): [int(x) for x in durations][-self.max_samples :]
+                for key, durations in content.get("samples", {}).items()
+            }
+            stats = content.get("stats", {})
+            results = int(stats.get("results", 0))
+            polls = int(stats.get("polls", 0))
+            wasted_polls = int(stats.get("wasted_polls", 0))
+        except (OSError, AttributeError, TypeError, ValueError):
+            # Missing or corrupt observations only cost relearning them
+            return
+        self._samples = samples
+        self._stats["results"] = results
+        self._stats["polls"] = polls
+        self._stats["wasted_polls"] = wasted_polls
+
+
+def _percentile(samples: List[int], percentile: float) -> int:
+    """Get the nearest-rank percentile of sorted samples"""
+    return samples[max(math.ceil(percentile * len(samples)) - 1, 0)]
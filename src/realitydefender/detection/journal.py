@@ -0,0 +1,184 @@
+"""
+On-disk checkpoint journal for resumable uploads
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, TypedDict
+
+from realitydefender.core.constants import DEFAULT_UPLOAD_JOURNAL_TTL
+from realitydefender.errors import RealityDefenderError
+from realitydefender.model import CompletedPart
+
+
+class JournalEntry(TypedDict):
+    """Progress of an upload that has not finished yet"""
+
+    file_size: int
+    """Size of the file when the upload started"""
+
+    mtime_ns: int
+    """Modification time of the file when the upload started"""
+
+    signed_url: str
+    """Signed URL the content is uploaded to"""
+
+    request_id: str
+    """Request ID assigned to the upload"""
+
+    media_id: str
+    """Media ID assigned to the upload"""
+
+    upload_id: Optional[str]
+    """Multipart upload ID, if the file is uploaded in parts"""
+
+    part_size: Optional[int]
+    """Part size of the multipart upload, parts only resume with the same size"""
+
+    completed_parts: List[CompletedPart]
+    """Parts already stored by the multipart backend"""
+
+    created_at: float
+    """Unix time at which the signed URL was obtained"""
+
+
+class UploadJournal:
+    """
+    Records upload progress in a small JSON file so that a retry, or a restarted
+    process, can continue an interrupted upload instead of starting over
+    """
+
+    def __init__(self, path: str, ttl: int = DEFAULT_UPLOAD_JOURNAL_TTL) -> None:
+        """
+        Initialize the journal
+
+        Args:
+            path: Location of the journal file, created on first write
+            ttl: Time in milliseconds after which an entry is discarded, which
+                should not exceed the lifetime of a signed URL
+        """
+        self.path = path
+        self.ttl = ttl
+        # Serializes the read-modify-write cycles of concurrent uploads
+        self._lock = threading.RLock()
+
+    def get(self, file_path: str) -> Optional[JournalEntry]:
+        """
+        Get the checkpoint for a file
+
+        Entries are ignored when they are older than the TTL or when the file has
+        changed since the upload started.
+
+        Args:
+            file_path: Path to the file being uploaded
+
+        Returns:
+            The checkpoint, or None if the upload has to start from scratch
+        """
+        with self._lock:
+            entry = self._load().get(self._key(file_path))
+        if entry is None:
+            return None
+
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        if (
+            entry["file_size"] != stat.st_size
+            or entry["mtime_ns"] != stat.st_mtime_ns
+            or (time.time() - entry["created_at"]) * 1000 > self.ttl
+        ):
+            self.remove(file_path)
+            return None
+        return entry
+
+    def start(
+        self, file_path: str, signed_url: str, request_id: str, media_id: str
+    ) -> JournalEntry:
+        """
+        Record a new upload for a file, replacing any previous checkpoint
+
+        Args:
+            file_path: Path to the file being uploaded
+            signed_url: Signed URL the content is uploaded to
+            request_id: Request ID assigned to the upload
+            media_id: Media ID assigned to the upload
+
+        Returns:
+            The recorded checkpoint
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError as e:
+            raise RealityDefenderError(f"Error reading file: {str(e)}", "invalid_file")
+
+        entry: JournalEntry = {
+            "file_size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "signed_url": signed_url,
+            "request_id": request_id,
+            "media_id": media_id,
+            "upload_id": None,
+            "part_size": None,
+            "completed_parts": [],
+            "created_at": time.time(),
+        }
+        self.save(file_path, entry)
+        return entry
+
+    def save(self, file_path: str, entry: JournalEntry) -> None:
+        """
+        Persist the checkpoint for a file
+
+        Args:
+            file_path: Path to the file being uploaded
+            entry: Checkpoint to store
+        """
+        with self._lock:
+            entries = self._load()
+            entries[self._key(file_path)] = entry
+            self._write(entries)
+
+    def remove(self, file_path: str) -> None:
+        """
+        Forget the checkpoint for a file, typically once its upload finished
+
+        Args:
+            file_path: Path to the file that was uploaded
+        """
+        with self._lock:
+            entries = self._load()
+            if entries.pop(self._key(file_path), None) is not None:
+                self._write(entries)
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        return os.path.abspath(file_path)
+
+    def _load(self) -> Dict[str, JournalEntry]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries: Dict[str, JournalEntry] = json.load(f)
+                return entries
+        except (OSError, ValueError):
+            # A missing or corrupt journal only costs a restart from byte zero
+            return {}
+
+    def _write(self, entries: Dict[str, JournalEntry]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            # Write to a temporary file and rename so a crash never leaves a
+            # truncated journal behind
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            raise RealityDefenderError(
+                f"Failed to write upload journal: {str(e)}", "unknown_error"
+            )
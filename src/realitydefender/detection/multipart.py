@@ -0,0 +1,151 @@
+"""
+Parallel multipart upload of large files
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Iterator, List, Optional, Tuple
+
+from realitydefender.core.constants import (
+    DEFAULT_MULTIPART_CONCURRENCY,
+    DEFAULT_MULTIPART_PART_SIZE,
+    MIN_MULTIPART_PART_SIZE,
+)
+from realitydefender.errors import RealityDefenderError
+from realitydefender.model import CompletedPart, MultipartUploadBackend
+from realitydefender.utils.async_utils import run_blocking
+from realitydefender.utils.byte_budget import reserve_upload_bytes
+from realitydefender.utils.file_utils import get_file_metadata, read_file_range
+
+# Maximum number of parts accepted by S3-compatible storage
+MAX_PARTS = 10000
+
+
+def plan_parts(file_size: int, part_size: int) -> List[Tuple[int, int, int]]:
+    """
+    Split a file into parts
+
+    Args:
+        file_size: Size of the file in bytes
+        part_size: Size of every part except the last one
+
+    Returns:
+        List of (part_number, offset, length), with 1-based part numbers
+
+    Raises:
+        RealityDefenderError: If the part size is invalid for this file
+    """
+    if part_size < MIN_MULTIPART_PART_SIZE:
+        raise RealityDefenderError(
+            f"part_size must be at least {MIN_MULTIPART_PART_SIZE} bytes",
+            "invalid_request",
+        )
+
+    parts = [
+        (index + 1, offset, min(part_size, file_size - offset))
+        for index, offset in enumerate(range(0, max(file_size, 1), part_size))
+    ]
+    if len(parts) > MAX_PARTS:
+        raise RealityDefenderError(
+            f"part_size too small: {len(parts)} parts exceed the limit of {MAX_PARTS}",
+            "invalid_request",
+        )
+    return parts
+
+
+async def upload_multipart(
+    backend: MultipartUploadBackend,
+    target_url: str,
+    file_path: str,
+    part_size: int = DEFAULT_MULTIPART_PART_SIZE,
+    concurrency: int = DEFAULT_MULTIPART_CONCURRENCY,
+    upload_id: Optional[str] = None,
+    completed_parts: Optional[List[CompletedPart]] = None,
+    on_progress: Optional[Callable[[str, List[CompletedPart]], Awaitable[None]]] = None,
+    abort_on_failure: bool = True,
+) -> None:
+    """
+    Upload a file as concurrently transferred parts and complete the upload
+
+    At most `concurrency` parts are read and in flight at any time, so memory
+    use is bounded by part_size * concurrency, and each part also holds its size
+    in the process-wide upload byte budget. If any part fails the upload is
+    aborted on the backend unless abort_on_failure is False.
+
+    Args:
+        backend: Storage backend that receives the parts
+        target_url: Destination of the upload, e.g. a signed URL
+        file_path: Path to the file to upload
+        part_size: Size in bytes of every part except the last one
+        concurrency: Maximum number of parts uploaded at the same time
+        upload_id: Continue this existing upload instead of creating a new one
+        completed_parts: Parts of upload_id that are already stored and skipped
+        on_progress: Awaited with the upload ID and all stored parts whenever
+            the upload is created or a part completes
+        abort_on_failure: Abort the upload on the backend if it fails
+
+    Raises:
+        RealityDefenderError: If the upload fails
+    """
+    if concurrency < 1:
+        raise RealityDefenderError("concurrency must be at least 1", "invalid_request")
+
+    _, file_size, content_type = await run_blocking(get_file_metadata, file_path)
+    parts = plan_parts(file_size, part_size)
+
+    completed: List[CompletedPart] = []
+    if upload_id is None:
+        try:
+            upload_id = await backend.create_upload(target_url, content_type)
+        except RealityDefenderError:
+            raise
+        except Exception as e:
+            raise RealityDefenderError(
+                f"Failed to start multipart upload: {str(e)}", "upload_failed"
+            )
+    else:
+        completed.extend(completed_parts or [])
+
+    active_upload_id: str = upload_id
+    if on_progress:
+        await on_progress(active_upload_id, list(completed))
+
+    done = {part["part_number"] for part in completed}
+    remaining = [part for part in parts if part[0] not in done]
+    pending: Iterator[Tuple[int, int, int]] = iter(remaining)
+
+    async def worker() -> None:
+        # Workers share one iterator so each part is taken exactly once
+        for part_number, offset, length in pending:
+            async with reserve_upload_bytes(length):
+                data = await run_blocking(read_file_range, file_path, offset, length)
+                etag = await backend.upload_part(
+                    target_url, active_upload_id, part_number, data
+                )
+                # Drop the part before its budget is handed to another one
+                del data
+            completed.append({"part_number": part_number, "etag": etag})
+            if on_progress:
+                await on_progress(active_upload_id, list(completed))
+
+    workers = [
+        asyncio.ensure_future(worker()) for _ in range(min(concurrency, len(remaining)))
+    ]
+    try:
+        await asyncio.gather(*workers)
+        completed.sort(key=lambda part: part["part_number"])
+        await backend.complete_upload(target_url, active_upload_id, completed)
+    except BaseException as e:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        if abort_on_failure:
+            try:
+                await backend.abort_upload(target_url, active_upload_id)
+            except Exception:
+                # The original failure is more useful to the caller
+                pass
+        if isinstance(e, RealityDefenderError) or not isinstance(e, Exception):
+            raise
+        raise RealityDefenderError(
+            f"Multipart upload failed: {str(e)}", "upload_failed"
+        )
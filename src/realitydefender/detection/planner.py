@@ -0,0 +1,257 @@
+"""
+Query planner splitting large result listings into date range shards
+"""
+
+import asyncio
+import math
+from datetime import date, timedelta
+from typing import AsyncGenerator, List, Optional, Tuple, TypedDict, Union
+
+from realitydefender.core.constants import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_POLLING_INTERVAL,
+    DEFAULT_RESULTS_CONCURRENCY,
+    DEFAULT_SHARD_MAX_ITEMS,
+)
+from realitydefender.detection.results import (
+    ClientType,
+    get_detection_results,
+    get_media_results,
+)
+from realitydefender.errors import RealityDefenderError
+from realitydefender.model import DetectionResult, DetectionResultList
+
+
+class DateShard(TypedDict):
+    """A date range of a result listing, fetched on its own"""
+
+    start_date: date
+    """First day of the shard (inclusive)"""
+
+    end_date: date
+    """Last day of the shard (inclusive)"""
+
+    total_items: int
+    """Number of results in the shard when it was planned"""
+
+
+def split_date_range(start_date: date, end_date: date, parts: int) -> List[DateShard]:
+    """
+    Split a date range into contiguous sub-ranges of (nearly) equal length
+
+    Args:
+        start_date: First day of the range (inclusive)
+        end_date: Last day of the range (inclusive)
+        parts: Number of sub-ranges, limited to the number of days in the range
+
+    Returns:
+        The sub-ranges in chronological order, with an unknown total_items of -1
+    """
+    days = (end_date - start_date).days + 1
+    parts = max(1, min(parts, days))
+    shards: List[DateShard] = []
+    first = start_date
+    for index in range(parts):
+        length = days // parts + (1 if index < days % parts else 0)
+        last = first + timedelta(days=length - 1)
+        shards.append({"start_date": first, "end_date": last, "total_items": -1})
+        first = last + timedelta(days=1)
+    return shards
+
+
+async def plan_date_shards(
+    client: ClientType,
+    start_date: date,
+    end_date: date,
+    name: Optional[str] = None,
+    max_shard_items: int = DEFAULT_SHARD_MAX_ITEMS,
+    concurrency: int = DEFAULT_RESULTS_CONCURRENCY,
+) -> List[DateShard]:
+    """
+    Split a date range into shards holding at most `max_shard_items` results each
+
+    Each range is probed with a single-item page to read its totalItems. Ranges
+    that hold too many results are split into as many equal parts as their count
+    suggests, and the parts are probed again, until every shard is small enough
+    or covers a single day. Empty shards are dropped.
+
+    Args:
+        client: HTTP client for API requests
+        start_date: First day of the listing (inclusive)
+        end_date: Last day of the listing (inclusive)
+        name: Only count results with this name
+        max_shard_items: Maximum number of results per shard
+        concurrency: Maximum number of probes sent concurrently
+
+    Returns:
+        The shards in chronological order
+
+    Raises:
+        RealityDefenderError: If the date range is invalid or a probe fails
+    """
+    if end_date < start_date:
+        raise RealityDefenderError(
+            "end_date must not be before start_date", "invalid_request"
+        )
+    if max_shard_items < 1:
+        raise RealityDefenderError(
+            "max_shard_items must be at least 1", "invalid_request"
+        )
+
+    probes = asyncio.Semaphore(max(concurrency, 1))
+
+    async def plan(shard: DateShard) -> List[DateShard]:
+        async with probes:
+            response = await get_media_results(
+                client,
+                page_number=0,
+                size=1,
+                name=name,
+                start_date=shard["start_date"],
+                end_date=shard["end_date"],
+            )
+        total_items = int(response.get("totalItems") or 0)
+        if total_items == 0:
+            return []
+        if total_items <= max_shard_items or shard["start_date"] == shard["end_date"]:
+            return [{**shard, "total_items": total_items}]
+
+        parts = split_date_range(
+            shard["start_date"],
+            shard["end_date"],
+            math.ceil(total_items / max_shard_items),
+        )
+        tasks = [asyncio.ensure_future(plan(part)) for part in parts]
+        try:
+            planned = await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop the sibling probes rather than leaving them running unawaited
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return [part for shards in planned for part in shards]
+
+    return await plan(
+        {"start_date": start_date, "end_date": end_date, "total_items": -1}
+    )
+
+
+async def iter_sharded_results(
+    client: ClientType,
+    start_date: date,
+    end_date: Optional[date] = None,
+    name: Optional[str] = None,
+    size: int = 100,
+    max_shard_items: int = DEFAULT_SHARD_MAX_ITEMS,
+    concurrency: int = DEFAULT_RESULTS_CONCURRENCY,
+    newest_first: bool = True,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    polling_interval: int = DEFAULT_POLLING_INTERVAL,
+    compact: bool = False,
+) -> AsyncGenerator[DetectionResult, None]:
+    """
+    Iterate over the detection results of a date range, fetching shards concurrently
+
+    The range is split with plan_date_shards so that no listing has to page
+    deeper than `max_shard_items` results. Up to `concurrency` shards are then
+    fetched at once, one page at a time each, and merged into a single stream:
+    shards are yielded one after the other in date order, each in the order of
+    the API listing, or reversed when listing oldest first. Shards fetched ahead
+    of the one being yielded buffer at most three pages each, bounding memory.
+
+    Args:
+        client: HTTP client for API requests
+        start_date: First day of the listing (inclusive)
+        end_date: Last day of the listing (inclusive), defaults to today
+        name: Only return results with this name
+        size: Number of results per page
+        max_shard_items: Maximum number of results per shard
+        concurrency: Maximum number of shards fetched concurrently
+        newest_first: Whether to yield the most recent results first, else the
+            oldest ones first
+        max_attempts: Maximum number of attempts to fetch each page
+        polling_interval: How long to wait between attempts, in milliseconds
+        compact: Whether to yield CompactDetectionResult objects
+
+    Returns:
+        Async iterator over the detection results
+
+    Raises:
+        RealityDefenderError: If the date range is invalid or a request fails
+    """
+    shards = await plan_date_shards(
+        client,
+        start_date,
+        end_date or date.today(),
+        name=name,
+        max_shard_items=max_shard_items,
+        concurrency=concurrency,
+    )
+    if newest_first:
+        shards.reverse()
+
+    async def fetch(
+        shard: DateShard,
+        pages: "asyncio.Queue[Union[DetectionResultList, Exception, None]]",
+    ) -> None:
+        async def fetch_page(page_number: int) -> DetectionResultList:
+            return await get_detection_results(
+                client,
+                page_number=page_number,
+                size=size,
+                name=name,
+                start_date=shard["start_date"],
+                end_date=shard["end_date"],
+                max_attempts=max_attempts,
+                polling_interval=polling_interval,
+                compact=compact,
+            )
+
+        try:
+            first = await fetch_page(0)
+            if newest_first:
+                await pages.put(first)
+                for page_number in range(1, first["total_pages"]):
+                    await pages.put(await fetch_page(page_number))
+            else:
+                # The API lists newest first, so walk the pages backwards and
+                # keep the first one, which tells how many there are, for last
+                for page_number in range(first["total_pages"] - 1, 0, -1):
+                    await pages.put(await fetch_page(page_number))
+                await pages.put(first)
+        except Exception as e:
+            await pages.put(e)
+            return
+        await pages.put(None)
+
+    fetching: List[
+        Tuple[
+            "asyncio.Task[None]",
+            "asyncio.Queue[Union[DetectionResultList, Exception, None]]",
+        ]
+    ] = []
+    next_shard = 0
+    try:
+        while fetching or next_shard < len(shards):
+            # Keep up to `concurrency` shards fetching, in the order they are yielded
+            while len(fetching) < max(concurrency, 1) and next_shard < len(shards):
+                pages: "asyncio.Queue[Union[DetectionResultList, Exception, None]]" = (
+                    asyncio.Queue(maxsize=2)
+                )
+                task = asyncio.ensure_future(fetch(shards[next_shard], pages))
+                fetching.append((task, pages))
+                next_shard += 1
+
+            _, pages = fetching[0]
+            while (page := await pages.get()) is not None:
+                if isinstance(page, Exception):
+                    raise page
+                items = page["items"]
+                for item in items if newest_first else reversed(items):
+                    yield item
+            fetching.pop(0)
+    finally:
+        for task, _ in fetching:
+            task.cancel()
+        await asyncio.gather(*(task for task, _ in fetching), return_exceptions=True)
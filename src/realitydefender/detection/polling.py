@@ -0,0 +1,194 @@
+"""
+Strategies deciding when to poll for detection results
+"""
+
+from typing import Dict, Mapping, Optional, Protocol
+
+from realitydefender.core.constants import (
+    DEFAULT_POLLING_INTERVAL,
+    DEFAULT_POLLING_MAX_INTERVAL,
+)
+from realitydefender.errors import RealityDefenderError
+from realitydefender.utils.backoff import decorrelated_jitter
+from realitydefender.utils.file_utils import get_media_type
+
+
+class PollingStrategy(Protocol):
+    """Decides how long to wait before each poll of a result"""
+
+    def first_delay(self) -> int:
+        """Time to wait before the first poll, in milliseconds"""
+        ...
+
+    def next_delay(self, previous: int) -> int:
+        """Time to wait before the next poll, given the previous wait (0 if none)"""
+        ...
+
+
+class FixedPolling:
+    """Polls at a fixed interval"""
+
+    def __init__(
+        self, interval: int = DEFAULT_POLLING_INTERVAL, initial_delay: int = 0
+    ) -> None:
+        """
+        Initialize the strategy
+
+        Args:
+            interval: Time between polls in milliseconds
+            initial_delay: Time before the first poll in milliseconds
+        """
+        self.interval = interval
+        self.initial_delay = initial_delay
+
+    def first_delay(self) -> int:
+        return self.initial_delay
+
+    def next_delay(self, previous: int) -> int:
+        return self.interval
+
+
+class ExponentialPolling:
+    """Polls at intervals growing by a constant factor, up to a cap"""
+
+    def __init__(
+        self,
+        interval: int = 500,
+        factor: float = 2.0,
+        max_interval: int = DEFAULT_POLLING_MAX_INTERVAL,
+        initial_delay: int = 0,
+    ) -> None:
+        """
+        Initialize the strategy
+
+        Args:
+            interval: Time before the second poll in milliseconds
+            factor: Factor each following interval grows by
+            max_interval: Maximum time between polls in milliseconds
+            initial_delay: Time before the first poll in milliseconds
+        """
+        if factor < 1:
+            raise RealityDefenderError("factor must be at least 1", "invalid_request")
+        self.interval = interval
+        self.factor = factor
+        self.max_interval = max_interval
+        self.initial_delay = initial_delay
+
+    def first_delay(self) -> int:
+        return self.initial_delay
+
+    def next_delay(self, previous: int) -> int:
+        if previous <= 0:
+            return min(self.interval, self.max_interval)
+        return min(int(previous * self.factor), self.max_interval)
+
+
+class DecorrelatedJitterPolling:
+    """
+    Polls at random intervals growing from the previous one, up to a cap
+
+    Clients that submitted media at the same time spread their polls out
+    instead of polling in lockstep.
+    """
+
+    def __init__(
+        self,
+        interval: int = DEFAULT_POLLING_INTERVAL,
+        max_interval: int = DEFAULT_POLLING_MAX_INTERVAL,
+        initial_delay: int = 0,
+    ) -> None:
+        """
+        Initialize the strategy
+
+        Args:
+            interval: Minimum time between polls in milliseconds
+            max_interval: Maximum time between polls in milliseconds
+            initial_delay: Time before the first poll in milliseconds
+        """
+        self.interval = interval
+        self.max_interval = max_interval
+        self.initial_delay = initial_delay
+
+    def first_delay(self) -> int:
+        return self.initial_delay
+
+    def next_delay(self, previous: int) -> int:
+        return decorrelated_jitter(
+            previous or self.interval, self.interval, self.max_interval
+        )
+
+
+# Polling of each media type: images are analyzed within seconds, videos can
+# take minutes, so they are first polled later and back off further
+DEFAULT_MEDIA_POLLING: Mapping[str, PollingStrategy] = {
+    "image": ExponentialPolling(interval=250, max_interval=2000),
+    "text": ExponentialPolling(interval=250, max_interval=2000),
+    "audio": DecorrelatedJitterPolling(
+        interval=1000, max_interval=10000, initial_delay=1000
+    ),
+    "video": DecorrelatedJitterPolling(
+        interval=2000, max_interval=DEFAULT_POLLING_MAX_INTERVAL, initial_delay=5000
+    ),
+}
+
+
+class MediaTypePolling:
+    """
+    Picks the polling strategy of a request from the type of its media
+
+    The media type is inferred from the file extension. Used without a filename,
+    it polls with the default strategy.
+    """
+
+    def __init__(
+        self,
+        strategies: Optional[Mapping[str, PollingStrategy]] = None,
+        default: Optional[PollingStrategy] = None,
+    ) -> None:
+        """
+        Initialize the strategy
+
+        Args:
+            strategies: Strategy per media type ("video", "image", "audio" or
+                "text"), replacing the defaults of the types given
+            default: Strategy for unknown media types, polling at a fixed
+                interval by default
+        """
+        self.strategies: Dict[str, PollingStrategy] = dict(DEFAULT_MEDIA_POLLING)
+        if strategies is not None:
+            self.strategies.update(strategies)
+        self.default: PollingStrategy = (
+            default if default is not None else FixedPolling()
+        )
+
+    def for_media(self, filename: Optional[str]) -> PollingStrategy:
+        """
+        Get the strategy for a media file
+
+        Args:
+            filename: Name or path of the uploaded file
+
+        Returns:
+            The strategy of the file's media type, or the default one
+        """
+        return self.for_media_type(get_media_type(filename) if filename else None)
+
+    def for_media_type(self, media_type: Optional[str]) -> PollingStrategy:
+        """
+        Get the strategy for a media type
+
+        Args:
+            media_type: "video", "image", "audio" or "text"
+
+        Returns:
+            The strategy of the media type, or the default one
+        """
+        if media_type is None:
+            return self.default
+        return self.strategies.get(media_type, self.default)
+
+    def first_delay(self) -> int:
+        return self.default.first_delay()
+
+    def next_delay(self, previous: int) -> int:
+        return self.default.next_delay(previous)
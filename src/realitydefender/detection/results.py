@@ -2,18 +2,42 @@
 Detection results retrieval and processing
 """
 
+import asyncio
+from collections import deque
 from datetime import date
-from typing import Any, Dict, TypeVar, Optional
+from typing import (
+    Any,
+    AsyncGenerator,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
+from realitydefender.cache.results import ResultCache
 from realitydefender.client.http_client import HttpClient
 from realitydefender.core.constants import (
     API_PATHS,
     DEFAULT_MAX_ATTEMPTS,
     DEFAULT_POLLING_INTERVAL,
+    DEFAULT_RESULTS_CONCURRENCY,
+    DEFAULT_RESULTS_PREFETCH,
+    PENDING_STATUSES,
 )
+from realitydefender.detection.polling import FixedPolling, PollingStrategy
 from realitydefender.errors import RealityDefenderError
-from realitydefender.model import DetectionResult, ModelResult, DetectionResultList
+from realitydefender.model import (
+    CompactDetectionResult,
+    DetectionResult,
+    DetectionResultList,
+    ModelResult,
+)
 from realitydefender.utils.async_utils import sleep
+from realitydefender.utils.singleflight import SingleFlight
 
 # Generic type for the HTTP client
 ClientType = TypeVar("ClientType", bound=HttpClient)
@@ -95,6 +119,31 @@ async def get_media_results(
         raise RealityDefenderError(f"Failed to get results: {str(e)}", "unknown_error")
 
 
+def _format_status(status: str) -> str:
+    """Replace the FAKE status reported by the API with MANIPULATED"""
+    return "MANIPULATED" if status == "FAKE" else status
+
+
+def _format_score(results_summary: Dict[str, Any]) -> Optional[float]:
+    """Get the final score normalized to a float between 0 and 1"""
+    raw_score = results_summary.get("metadata", {}).get("finalScore")
+    if raw_score is None:
+        return None
+    try:
+        score: float = raw_score / 100.0
+        return score
+    except (ValueError, TypeError):
+        return None
+
+
+def _format_model_score(model: Dict[str, Any]) -> Optional[float]:
+    """Get the prediction number of a model if it is numeric"""
+    predicted_number = model.get("predictionNumber")
+    if isinstance(predicted_number, (int, float)):
+        return predicted_number
+    return None
+
+
 def format_result(response: Dict[str, Any]) -> DetectionResult:
     """
     Format the raw API response into a user-friendly result
@@ -111,52 +160,22 @@ def format_result(response: Dict[str, Any]) -> DetectionResult:
 
     if response.get("resultsSummary") is not None:
         results_summary = response.get("resultsSummary", {})
-        status = results_summary.get("status", "UNKNOWN")
-
-        # Replace FAKE with MANIPULATED
-        if status == "FAKE":
-            status = "MANIPULATED"
-
-        # Get the score and normalize it to a float between 0 and 1
-        raw_score = results_summary.get("metadata", {}).get("finalScore")
-        score = None
-        if raw_score is not None:
-            try:
-                score = raw_score / 100.0
-            except (ValueError, TypeError):
-                score = None
 
-        # Extract active models (not NOT_APPLICABLE)
-        models_data = [
-            m for m in response.get("models", []) if m.get("status") != "NOT_APPLICABLE"
+        # Format active models (not NOT_APPLICABLE)
+        models: list[ModelResult] = [
+            {
+                "name": model.get("name", "Unknown"),
+                "status": _format_status(model.get("status", "UNKNOWN")),
+                "score": _format_model_score(model),
+            }
+            for model in response.get("models", [])
+            if model.get("status") != "NOT_APPLICABLE"
         ]
 
-        # Format models
-        models: list[ModelResult] = []
-        for model in models_data:
-            predicted_number = model.get("predictionNumber")
-            if isinstance(predicted_number, (int, float)):
-                model_score = predicted_number
-            else:
-                model_score = None
-
-            # Replace FAKE with MANIPULATED in model status
-            model_status = model.get("status", "UNKNOWN")
-            if model_status == "FAKE":
-                model_status = "MANIPULATED"
-
-            models.append(
-                {
-                    "name": model.get("name", "Unknown"),
-                    "status": model_status,
-                    "score": model_score,
-                }
-            )
-
         return {
             "request_id": request_id,
-            "status": status,
-            "score": score,
+            "status": _format_status(results_summary.get("status", "UNKNOWN")),
+            "score": _format_score(results_summary),
             "models": models,
         }
 
@@ -164,12 +183,53 @@ def format_result(response: Dict[str, Any]) -> DetectionResult:
     return {"request_id": request_id, "status": "UNKNOWN", "score": None, "models": []}
 
 
-def format_result_list(response: Dict[str, Any]) -> DetectionResultList:
+def format_result_compact(response: Dict[str, Any]) -> CompactDetectionResult:
+    """
+    Format the raw API response into a compact result
+
+    Equivalent to format_result, but the result is a CompactDetectionResult that
+    only keeps the model fields and builds the models list on first access.
+
+    Args:
+        response: Raw API response
+
+    Returns:
+        Compact detection result
+    """
+    request_id: str = response.get("requestId", "UNKNOWN")
+
+    results_summary = response.get("resultsSummary")
+    if results_summary is None:
+        return CompactDetectionResult(request_id, "UNKNOWN", None)
+
+    model_fields: List[Any] = []
+    for model in response.get("models", []):
+        status = model.get("status", "UNKNOWN")
+        if status == "NOT_APPLICABLE":
+            continue
+        model_fields += (
+            model.get("name", "Unknown"),
+            _format_status(status),
+            _format_model_score(model),
+        )
+
+    return CompactDetectionResult(
+        request_id,
+        _format_status(results_summary.get("status", "UNKNOWN")),
+        _format_score(results_summary),
+        tuple(model_fields),
+    )
+
+
+def format_result_list(
+    response: Dict[str, Any], compact: bool = False
+) -> DetectionResultList:
     """
     Format the list all media API response into a user-friendly result
 
     Args:
         response: Raw API response
+        compact: Whether to format the items as CompactDetectionResult objects
 
     Returns:
         DetectionResultList: Simplified detection result list
@@ -200,8 +260,15 @@ def format_result_list(response: Dict[str, Any]) -> DetectionResultList:
         items=[],
     )
 
-    for item in response.get("mediaList", []):
-        result.setdefault("items", []).append(format_result(item))
+    if compact:
+        # Compact results are read-only mappings with the same keys
+        result["items"] = cast(
+            List[DetectionResult],
+            [format_result_compact(item) for item in response.get("mediaList", [])],
+        )
+    else:
+        for item in response.get("mediaList", []):
+            result.setdefault("items", []).append(format_result(item))
 
     return result
 
@@ -211,6 +278,9 @@ async def get_detection_result(
     request_id: str,
     max_attempts: int = DEFAULT_MAX_ATTEMPTS,
     polling_interval: int = DEFAULT_POLLING_INTERVAL,
+    cache: Optional[ResultCache] = None,
+    polls: Optional["SingleFlight[DetectionResult]"] = None,
+    polling_strategy: Optional[PollingStrategy] = None,
 ) -> DetectionResult:
     """
     Get the detection result for a specific request
@@ -220,6 +290,13 @@ async def get_detection_result(
         request_id: The request ID to get results for
         max_attempts: Maximum number of attempts to get results
         polling_interval: How long to wait between attempts
+        cache: Cache answering final results without contacting the API, and
+            recent not found errors when max_attempts is 1; polling longer
+            gives a fresh upload the time to appear
+        polls: Polling loops in progress; a concurrent call for the same
+            request ID waits for the running loop instead of starting its own
+        polling_strategy: Decides the wait before each poll, replacing the
+            fixed polling_interval
 
     Returns:
         Detection result with status and scores
@@ -230,7 +307,53 @@ async def get_detection_result(
     if not request_id:
         raise RealityDefenderError("request_id is required", "not_found")
 
+    strategy = (
+        polling_strategy
+        if polling_strategy is not None
+        else FixedPolling(polling_interval)
+    )
+
+    async def poll() -> DetectionResult:
+        if polls is None:
+            return await _poll_detection_result(
+                client, request_id, max_attempts, strategy
+            )
+        # Concurrent calls for the same request share one polling loop
+        return await polls.do(
+            request_id,
+            lambda: _poll_detection_result(client, request_id, max_attempts, strategy),
+        )
+
+    if cache is None:
+        return await poll()
+
+    # A not found cached by a single poll must not cut a longer polling short
+    cached = cache.get(request_id, not_found=max_attempts <= 1)
+    if cached is not None:
+        return cached
+    try:
+        result = await poll()
+    except RealityDefenderError as e:
+        if e.code == "not_found":
+            cache.put_not_found(request_id)
+        raise
+    cache.put(result)
+    return result
+
+
+async def _poll_detection_result(
+    client: ClientType,
+    request_id: str,
+    max_attempts: int,
+    strategy: PollingStrategy,
+) -> DetectionResult:
+    """Poll the result of a request until it finished processing or attempts run out"""
+
     attempts = 0
+    delay = strategy.first_delay()
+    if delay > 0:
+        await sleep(delay)
+    delay = 0
 
     while attempts < max_attempts:
         try:
@@ -241,7 +364,7 @@ async def get_detection_result(
             result = format_result(media_result)
 
             # If the status is not ANALYZING, return the results immediately
-            if result["status"] not in ["ANALYZING", "UNKNOWN"]:
+            if result["status"] not in PENDING_STATUSES:
                 return result
 
             # If we've reached the maximum attempts, return the current result even if still analyzing
@@ -250,13 +373,15 @@ async def get_detection_result(
 
             # Increment attempts and wait before trying again
             attempts += 1
-            await sleep(polling_interval)
+            delay = strategy.next_delay(delay)
+            await sleep(delay)
 
         except RealityDefenderError as e:
             # If not found and we have attempts left, wait and try again
             if e.code == "not_found" and attempts < max_attempts - 1:
                 attempts += 1
-                await sleep(polling_interval)
+                delay = strategy.next_delay(delay)
+                await sleep(delay)
                 continue
             # Otherwise re-raise the error
             raise
@@ -281,6 +406,7 @@ async def get_detection_results(
     end_date: Optional[date] = None,
     max_attempts: int = DEFAULT_MAX_ATTEMPTS,
     polling_interval: int = DEFAULT_POLLING_INTERVAL,
+    compact: bool = False,
 ) -> DetectionResultList:
     """
     Retrieves detection results asynchronously based on specified criteria. This function
@@ -308,6 +434,9 @@ async def get_detection_results(
     polling_interval: int
         The interval in seconds between retries when fetching results.
         Defaults to the value of DEFAULT_POLLING_INTERVAL.
+    compact: bool
+        Whether to return the items as CompactDetectionResult objects, which use
+        less memory and build their models list on first access. Defaults to False.
 
     Returns:
     DetectionResultList
@@ -327,7 +456,7 @@ async def get_detection_results(
             )
 
             # Format and return the result
-            return format_result_list(media_results)
+            return format_result_list(media_results, compact=compact)
 
         except RealityDefenderError as e:
             # Don't retry authentication errors - they won't resolve with retries
@@ -348,3 +477,236 @@ async def get_detection_results(
     raise RealityDefenderError(
         f"Failed to get detection result list after {attempts} attempts", "timeout"
     )
+
+
+async def iter_detection_results(
+    client: ClientType,
+    size: int = 10,
+    name: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    polling_interval: int = DEFAULT_POLLING_INTERVAL,
+    compact: bool = False,
+    prefetch: int = DEFAULT_RESULTS_PREFETCH,
+    start_page: int = 0,
+) -> AsyncGenerator[DetectionResult, None]:
+    """
+    Iterate over all detection results matching the filters, page by page
+
+    While the caller consumes a page, up to `prefetch` following pages are
+    fetched concurrently, so at most `prefetch + 1` pages are held in memory.
+    Results uploaded while iterating shift the pages of the listing, so an
+    item may be yielded twice when that happens.
+
+    Args:
+        client: HTTP client for API requests
+        size: Number of results per page
+        name: Only return results with this name
+        start_date: Only return results from this date on (inclusive)
+        end_date: Only return results up to this date (inclusive)
+        max_attempts: Maximum number of attempts to fetch each page
+        polling_interval: How long to wait between attempts, in milliseconds
+        compact: Whether to yield CompactDetectionResult objects
+        prefetch: Maximum number of pages fetched ahead of the current one, 0
+            to fetch each page after the previous one has been consumed
+        start_page: Zero-based index of the first page
+
+    Returns:
+        Async iterator over the detection results
+
+    Raises:
+        RealityDefenderError: If a page cannot be fetched
+    """
+
+    async def fetch(page_number: int) -> DetectionResultList:
+        return await get_detection_results(
+            client,
+            page_number=page_number,
+            size=size,
+            name=name,
+            start_date=start_date,
+            end_date=end_date,
+            max_attempts=max_attempts,
+            polling_interval=polling_interval,
+            compact=compact,
+        )
+
+    page = await fetch(start_page)
+    total_pages = page["total_pages"]
+    next_page = start_page + 1
+    pending: Deque["asyncio.Task[DetectionResultList]"] = deque()
+
+    try:
+        while True:
+            # Keep the window full before handing out the current page
+            while len(pending) < prefetch and next_page < total_pages:
+                pending.append(asyncio.ensure_future(fetch(next_page)))
+                next_page += 1
+
+            for item in page["items"]:
+                yield item
+
+            if pending:
+                page = await pending.popleft()
+            elif next_page < total_pages:
+                page = await fetch(next_page)
+                next_page += 1
+            else:
+                return
+    finally:
+        for task in pending:
+            task.cancel()
+        # Wait for the cancellations so no fetch outlives the iterator
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def iter_detection_result_pages(
+    client: ClientType,
+    size: int = 10,
+    name: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    polling_interval: int = DEFAULT_POLLING_INTERVAL,
+    compact: bool = False,
+    concurrency: int = DEFAULT_RESULTS_CONCURRENCY,
+) -> AsyncGenerator[Tuple[int, DetectionResultList], None]:
+    """
+    Fetch every page of detection results concurrently, yielding them as they arrive
+
+    The first page is fetched on its own to learn the number of pages, then the
+    remaining pages are requested by up to `concurrency` concurrent workers. Each
+    page is retried up to `max_attempts` times. Pages are yielded out of order
+    together with their zero-based index; at most `concurrency` fetched pages
+    wait for the caller at any time.
+
+    Args:
+        client: HTTP client for API requests
+        size: Number of results per page
+        name: Only return results with this name
+        start_date: Only return results from this date on (inclusive)
+        end_date: Only return results up to this date (inclusive)
+        max_attempts: Maximum number of attempts to fetch each page
+        polling_interval: How long to wait between attempts, in milliseconds
+        compact: Whether the pages hold CompactDetectionResult objects
+        concurrency: Maximum number of pages fetched concurrently
+
+    Returns:
+        Async iterator over (page index, page) pairs
+
+    Raises:
+        RealityDefenderError: If a page cannot be fetched
+    """
+
+    async def fetch(page_number: int) -> DetectionResultList:
+        return await get_detection_results(
+            client,
+            page_number=page_number,
+            size=size,
+            name=name,
+            start_date=start_date,
+            end_date=end_date,
+            max_attempts=max_attempts,
+            polling_interval=polling_interval,
+            compact=compact,
+        )
+
+    first = await fetch(0)
+    total_pages = first["total_pages"]
+    page_numbers = iter(range(1, total_pages))
+    fetched: "asyncio.Queue[Tuple[int, Union[DetectionResultList, Exception]]]" = (
+        asyncio.Queue(maxsize=max(concurrency, 1))
+    )
+
+    async def worker() -> None:
+        # Workers share the iterator, so each page is taken by exactly one of them
+        for page_number in page_numbers:
+            try:
+                page: Union[DetectionResultList, Exception] = await fetch(page_number)
+            except Exception as e:
+                page = e
+            await fetched.put((page_number, page))
+
+    workers = [
+        asyncio.ensure_future(worker())
+        for _ in range(min(max(concurrency, 1), total_pages - 1))
+    ]
+    try:
+        yield 0, first
+        del first
+
+        for _ in range(total_pages - 1):
+            page_number, page = await fetched.get()
+            if isinstance(page, Exception):
+                raise page
+            yield page_number, page
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def get_all_detection_results(
+    client: ClientType,
+    size: int = 10,
+    name: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    polling_interval: int = DEFAULT_POLLING_INTERVAL,
+    compact: bool = False,
+    concurrency: int = DEFAULT_RESULTS_CONCURRENCY,
+) -> DetectionResultList:
+    """
+    Fetch all detection results matching the filters, with pages fetched concurrently
+
+    Pages are fetched as in iter_detection_result_pages and reassembled in order
+    into a single list holding every result.
+
+    Args:
+        client: HTTP client for API requests
+        size: Number of results per page
+        name: Only return results with this name
+        start_date: Only return results from this date on (inclusive)
+        end_date: Only return results up to this date (inclusive)
+        max_attempts: Maximum number of attempts to fetch each page
+        polling_interval: How long to wait between attempts, in milliseconds
+        compact: Whether to return CompactDetectionResult objects
+        concurrency: Maximum number of pages fetched concurrently
+
+    Returns:
+        DetectionResultList: A single page holding all the results
+
+    Raises:
+        RealityDefenderError: If a page cannot be fetched
+    """
+    pages: Dict[int, List[DetectionResult]] = {}
+    total_items = 0
+    pages_iterator = iter_detection_result_pages(
+        client,
+        size=size,
+        name=name,
+        start_date=start_date,
+        end_date=end_date,
+        max_attempts=max_attempts,
+        polling_interval=polling_interval,
+        compact=compact,
+        concurrency=concurrency,
+    )
+    try:
+        async for page_number, page in pages_iterator:
+            if page_number == 0:
+                total_items = page["total_items"]
+            pages[page_number] = page["items"]
+    finally:
+        await pages_iterator.aclose()
+
+    items = [item for page_number in sorted(pages) for item in pages[page_number]]
+    return DetectionResultList(
+        total_items=total_items,
+        total_pages=1,
+        current_page=0,
+        current_page_items_count=len(items),
+        items=items,
+    )
@@ -0,0 +1,291 @@
+"""
+Central scheduler polling the results of many requests
+"""
+
+import asyncio
+import heapq
+import itertools
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from realitydefender.cache.results import ResultCache
+from realitydefender.core.constants import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_POLLING_CONCURRENCY,
+    DEFAULT_POLLING_INTERVAL,
+    PENDING_STATUSES,
+)
+from realitydefender.detection.polling import FixedPolling, PollingStrategy
+from realitydefender.detection.results import (
+    ClientType,
+    format_result,
+    get_media_result,
+)
+from realitydefender.errors import RealityDefenderError
+from realitydefender.model import DetectionResult
+
+
+class _PendingRequest:
+    """A request whose result is being polled"""
+
+    __slots__ = (
+        "request_id",
+        "future",
+        "attempts",
+        "max_attempts",
+        "strategy",
+        "delay",
+    )
+
+    def __init__(
+        self,
+        request_id: str,
+        future: "asyncio.Future[DetectionResult]",
+        max_attempts: int,
+        strategy: PollingStrategy,
+    ) -> None:
+        self.request_id = request_id
+        self.future = future
+        self.attempts = 0
+        self.max_attempts = max_attempts
+        self.strategy = strategy
+        self.delay = 0
+
+
+class PollingScheduler:
+    """
+    Polls the results of many requests from a single task
+
+    Pending requests are kept in a min-heap keyed by the time their next poll is
+    due. One task sleeps until the earliest due time and sends the due polls,
+    with at most `concurrency` in flight, so the number of timers and the
+    request rate stay flat however many requests are pending. Each request gets
+    a future resolved with its result once it finished processing or ran out of
+    attempts, as get_detection_result would return it.
+    """
+
+    def __init__(
+        self,
+        client: ClientType,
+        concurrency: int = DEFAULT_POLLING_CONCURRENCY,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        polling_interval: int = DEFAULT_POLLING_INTERVAL,
+        cache: Optional[ResultCache] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ) -> None:
+        """
+        Initialize the scheduler
+
+        Args:
+            client: HTTP client for API requests
+            concurrency: Maximum number of polls in flight
+            max_attempts: Default maximum number of polls per request
+            polling_interval: Default time between polls of a request, in milliseconds
+            cache: Cache answering final results and storing the ones polled
+            polling_strategy: Default strategy deciding the wait before each
+                poll, replacing the fixed polling_interval
+        """
+        if concurrency < 1:
+            raise RealityDefenderError(
+                "concurrency must be at least 1", "invalid_request"
+            )
+        self.client = client
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.polling_interval = polling_interval
+        self.cache = cache
+        self.polling_strategy = polling_strategy
+        self._heap: List[Tuple[float, int, _PendingRequest]] = []
+        self._order = itertools.count()
+        self._requests: Dict[str, _PendingRequest] = {}
+        self._slots = asyncio.Semaphore(concurrency)
+        self._wakeup = asyncio.Event()
+        self._runner: Optional["asyncio.Task[None]"] = None
+        self._polls: Set["asyncio.Task[None]"] = set()
+
+    def submit(
+        self,
+        request_id: str,
+        max_attempts: Optional[int] = None,
+        polling_interval: Optional[int] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ) -> "asyncio.Future[DetectionResult]":
+        """
+        Start polling the result of a request
+
+        Must be called from within a running event loop. Submitting a request
+        that is already being polled returns its existing future.
+
+        Args:
+            request_id: The request ID to poll
+            max_attempts: Maximum number of polls, defaults to the scheduler's
+            polling_interval: Time between polls in milliseconds, defaults to
+                the scheduler's
+            polling_strategy: Decides the wait before each poll, replacing
+                polling_interval; defaults to the scheduler's
+
+        Returns:
+            Future resolved with the detection result
+
+        Raises:
+            RealityDefenderError: If request_id is empty
+        """
+        if not request_id:
+            raise RealityDefenderError("request_id is required", "not_found")
+
+        existing = self._requests.get(request_id)
+        if existing is not None:
+            return existing.future
+
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[DetectionResult]" = loop.create_future()
+        cached = self._cached(request_id)
+        if isinstance(cached, RealityDefenderError):
+            future.set_exception(cached)
+            return future
+        if cached is not None:
+            future.set_result(cached)
+            return future
+
+        if polling_strategy is None:
+            if polling_interval is not None or self.polling_strategy is None:
+                polling_strategy = FixedPolling(
+                    polling_interval
+                    if polling_interval is not None
+                    else self.polling_interval
+                )
+            else:
+                polling_strategy = self.polling_strategy
+        request = _PendingRequest(
+            request_id,
+            future,
+            max_attempts if max_attempts is not None else self.max_attempts,
+            polling_strategy,
+        )
+        self._requests[request_id] = request
+        future.add_done_callback(lambda _: self._forget(request))
+        self._schedule(request, loop.time() + polling_strategy.first_delay() / 1000)
+
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.ensure_future(self._run())
+        return future
+
+    def pending(self) -> int:
+        """Number of requests whose result is not known yet"""
+        return len(self._requests)
+
+    async def close(self) -> None:
+        """Stop polling, cancelling the futures of pending requests"""
+        if self._runner is not None:
+            self._runner.cancel()
+        for task in list(self._polls):
+            task.cancel()
+        for request in list(self._requests.values()):
+            request.future.cancel()
+        await asyncio.gather(
+            *self._polls,
+            *([self._runner] if self._runner is not None else []),
+            return_exceptions=True,
+        )
+        self._runner = None
+        self._heap.clear()
+
+    def _cached(
+        self, request_id: str
+    ) -> Union[DetectionResult, RealityDefenderError, None]:
+        """Get a cached result, or the cached error for a request not found"""
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.get(request_id)
+        except RealityDefenderError as e:
+            return e
+
+    def _schedule(self, request: _PendingRequest, due: float) -> None:
+        heapq.heappush(self._heap, (due, next(self._order), request))
+        self._wakeup.set()
+
+    def _forget(self, request: _PendingRequest) -> None:
+        if self._requests.get(request.request_id) is request:
+            del self._requests[request.request_id]
+
+    async def _run(self) -> None:
+        """Send polls as they become due, sleeping until the earliest due time"""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            delay = self._heap[0][0] - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._slots.acquire()
+            _, _, request = heapq.heappop(self._heap)
+            if request.future.done():
+                # The caller cancelled the future
+                self._slots.release()
+                continue
+            task = asyncio.ensure_future(self._poll(request))
+            self._polls.add(task)
+            task.add_done_callback(self._poll_done)
+
+    def _poll_done(self, task: "asyncio.Task[None]") -> None:
+        self._polls.discard(task)
+        self._slots.release()
+
+    async def _poll(self, request: _PendingRequest) -> None:
+        """Poll a request once, then resolve its future or schedule the next poll"""
+        request.attempts += 1
+        last_attempt = request.attempts >= request.max_attempts
+        try:
+            result = format_result(
+                await get_media_result(self.client, request.request_id)
+            )
+        except RealityDefenderError as e:
+            if e.code == "not_found" and not last_attempt:
+                self._reschedule(request)
+                return
+            if e.code == "not_found" and self.cache is not None:
+                self.cache.put_not_found(request.request_id)
+            self._resolve(request, error=e)
+            return
+        except Exception as e:
+            self._resolve(
+                request,
+                error=RealityDefenderError(
+                    f"Failed to get detection result: {str(e)}", "server_error"
+                ),
+            )
+            return
+
+        if result["status"] in PENDING_STATUSES and not last_attempt:
+            self._reschedule(request)
+            return
+        if self.cache is not None:
+            self.cache.put(result)
+        self._resolve(request, result=result)
+
+    def _reschedule(self, request: _PendingRequest) -> None:
+        if not request.future.done():
+            loop = asyncio.get_running_loop()
+            request.delay = request.strategy.next_delay(request.delay)
+            self._schedule(request, loop.time() + request.delay / 1000)
+
+    @staticmethod
+    def _resolve(
+        request: _PendingRequest,
+        result: Optional[DetectionResult] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        if request.future.done():
+            return
+        if error is not None:
+            request.future.set_exception(error)
+        elif result is not None:
+            request.future.set_result(result)
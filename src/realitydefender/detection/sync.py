@@ -0,0 +1,142 @@
+"""
+Incremental sync of detection results into a local store
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, TypedDict
+
+from realitydefender.cache.store import ResultStore
+from realitydefender.core.constants import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_POLLING_INTERVAL,
+    DEFAULT_RESULTS_CONCURRENCY,
+    DEFAULT_RESULTS_PREFETCH,
+)
+from realitydefender.detection.results import (
+    ClientType,
+    format_result,
+    get_media_result,
+    iter_detection_results,
+)
+from realitydefender.errors import RealityDefenderError
+from realitydefender.model import DetectionResult
+from realitydefender.utils.async_utils import run_blocking
+
+
+class SyncReport(TypedDict):
+    """Outcome of an incremental sync"""
+
+    since: Optional[date]
+    """Date the listing started from, None if the full history was listed"""
+
+    listed: int
+    """Number of results listed since the watermark"""
+
+    rechecked: int
+    """Number of pending results outside the listing that were fetched again"""
+
+    stored: int
+    """Number of results that were added to the store or changed"""
+
+    pending: int
+    """Number of stored results that are still being processed"""
+
+
+async def sync_results(
+    client: ClientType,
+    store: ResultStore,
+    name: Optional[str] = None,
+    size: int = 100,
+    prefetch: int = DEFAULT_RESULTS_PREFETCH,
+    concurrency: int = DEFAULT_RESULTS_CONCURRENCY,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    polling_interval: int = DEFAULT_POLLING_INTERVAL,
+) -> SyncReport:
+    """
+    Bring a local result store up to date with the API
+
+    The first sync lists the full history. Each sync then records the day it
+    started, minus one day to absorb clock and time zone differences, as its
+    watermark; the next sync only lists results from that day on. Stored results
+    that were still pending and fall outside that listing are fetched again one
+    by one, so each sync after the first costs a few requests. A sync that fails
+    keeps the previous watermark.
+
+    Args:
+        client: HTTP client for API requests
+        store: Store the results are written to
+        name: Only sync results with this name, with a watermark of its own
+        size: Number of results per page
+        prefetch: Maximum number of pages fetched ahead of the current one
+        concurrency: Maximum number of pending results fetched again concurrently
+        max_attempts: Maximum number of attempts to fetch each page
+        polling_interval: How long to wait between attempts, in milliseconds
+
+    Returns:
+        What the sync listed and stored
+
+    Raises:
+        RealityDefenderError: If a request fails
+    """
+    key = name or ""
+    started = datetime.now(timezone.utc).date()
+    since = await run_blocking(store.get_watermark, key)
+    pending_before = set(await run_blocking(store.pending_request_ids))
+
+    listed = 0
+    stored = 0
+    seen = set()
+    page: List[DetectionResult] = []
+    results = iter_detection_results(
+        client,
+        size=size,
+        name=name,
+        start_date=since,
+        max_attempts=max_attempts,
+        polling_interval=polling_interval,
+        prefetch=prefetch,
+    )
+    try:
+        async for result in results:
+            listed += 1
+            seen.add(result["request_id"])
+            page.append(result)
+            if len(page) >= size:
+                stored += await run_blocking(store.upsert, page, name)
+                page = []
+    finally:
+        await results.aclose()
+    stored += await run_blocking(store.upsert, page, name)
+
+    # Results still pending last time that were not listed again this time
+    recheck = sorted(pending_before - seen)
+    fetches = asyncio.Semaphore(max(concurrency, 1))
+
+    async def fetch(request_id: str) -> Optional[DetectionResult]:
+        async with fetches:
+            try:
+                return format_result(await get_media_result(client, request_id))
+            except RealityDefenderError as e:
+                if e.code == "not_found":
+                    return None
+                raise
+
+    rechecked = [
+        result
+        for result in await asyncio.gather(
+            *(fetch(request_id) for request_id in recheck)
+        )
+        if result is not None
+    ]
+    stored += await run_blocking(store.upsert, rechecked, name)
+
+    await run_blocking(store.set_watermark, started - timedelta(days=1), key)
+    pending = len(await run_blocking(store.pending_request_ids))
+    return {
+        "since": since,
+        "listed": listed,
+        "rechecked": len(recheck),
+        "stored": stored,
+        "pending": pending,
+    }
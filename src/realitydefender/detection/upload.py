@@ -2,14 +2,53 @@
 File upload functionality for detection
 """
 
+import asyncio
 import os
-from typing import Any, Dict
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import aiohttp
 
 from realitydefender.client.http_client import HttpClient
-from realitydefender.core.constants import API_PATHS
+from realitydefender.client.retry import RetryableError
+from realitydefender.core.constants import (
+    API_PATHS,
+    DEFAULT_MULTIPART_CONCURRENCY,
+    DEFAULT_MULTIPART_PART_SIZE,
+    DEFAULT_UPLOAD_CHUNK_SIZE,
+)
+from realitydefender.detection.journal import UploadJournal
+from realitydefender.detection.multipart import upload_multipart
 from realitydefender.errors import RealityDefenderError
-from realitydefender.model import UploadResult
-from realitydefender.utils.file_utils import get_file_info
+from realitydefender.model import CompletedPart, MultipartUploadBackend, UploadResult
+from realitydefender.utils.file_utils import (
+    get_file_info,
+    get_file_metadata,
+    get_remaining_size,
+    mmap_file_chunks,
+    read_file_chunks,
+    validate_media,
+)
+from realitydefender.utils.async_utils import run_blocking
+from realitydefender.utils.backoff import parse_retry_after
+from realitydefender.utils.byte_budget import (
+    get_upload_byte_budget,
+    reserve_upload_bytes,
+)
+
+# Request body accepted by put_to_signed_url
+UploadBody = Union[bytes, AsyncIterator[Union[bytes, memoryview]]]
 
 
 async def get_signed_url(client: HttpClient, filename: str) -> Dict[str, Any]:
@@ -39,8 +78,167 @@ async def get_signed_url(client: HttpClient, filename: str) -> Dict[str, Any]:
         )
 
 
+async def request_signed_url(client: HttpClient, filename: str) -> Tuple[str, str, str]:
+    """
+    Get a signed URL and validate the response
+
+    Args:
+        client: HTTP client for API requests
+        filename: Name of the file to upload
+
+    Returns:
+        Tuple of (request_id, media_id, signed_url)
+
+    Raises:
+        RealityDefenderError: If the request fails or the response is incomplete
+    """
+    signed_url_response = await get_signed_url(client, filename)
+
+    # Handle regular API response format
+    request_id: str = signed_url_response.get("requestId", "")
+    media_id: str = signed_url_response.get("mediaId", "")
+    signed_url: str = signed_url_response.get("response", {}).get("signedUrl", "")
+
+    if not request_id or not media_id or not signed_url:
+        raise RealityDefenderError(
+            "Invalid response from API - missing requestId, mediaId, or signedUrl",
+            "server_error",
+        )
+
+    return request_id, media_id, signed_url
+
+
+async def iter_slices(data: bytes, chunk_size: int) -> AsyncIterator[memoryview]:
+    """
+    Asynchronously yield zero-copy slices of an in-memory body
+
+    Args:
+        data: Content to split
+        chunk_size: Maximum number of bytes per slice
+
+    Yields:
+        Consecutive memoryview slices of data
+    """
+    view = memoryview(data)
+    for offset in range(0, len(view), chunk_size):
+        yield view[offset : offset + chunk_size]
+
+
+async def put_to_signed_url(
+    client: HttpClient,
+    signed_url: str,
+    data: Union[UploadBody, Callable[[], UploadBody]],
+    headers: Dict[str, str],
+) -> None:
+    """
+    Send a request body to a signed URL
+
+    Transient failures are retried under the client's "upload" retry policy
+    when the body can be sent again: in-memory content, or a function that
+    creates a fresh body for each attempt. Other async iterators are only
+    consumed once and are not retried.
+
+    Args:
+        client: HTTP client for API requests
+        signed_url: URL for uploading
+        data: Content, either in full, as an async iterator of chunks, or as a
+            function returning a new body for every attempt
+        headers: Request headers, including Content-Length for chunked bodies
+
+    Raises:
+        RealityDefenderError: If upload fails
+    """
+    replayable = isinstance(data, bytes) or callable(data)
+
+    async def attempt() -> None:
+        body = data() if callable(data) else data
+        request_headers = headers
+        if isinstance(body, bytes) and len(body) > DEFAULT_UPLOAD_CHUNK_SIZE:
+            # Handing a large body to the transport in one write stalls the event
+            # loop while it is buffered, so feed it in slices instead
+            request_headers = {**headers, "Content-Length": str(len(body))}
+            body = iter_slices(body, DEFAULT_UPLOAD_CHUNK_SIZE)
+
+        session = await client.ensure_storage_session()
+
+        # Upload directly to the signed URL
+        try:
+            async with session.put(
+                signed_url, data=body, headers=request_headers
+            ) as response:
+                if response.status >= 400:
+                    text = await response.text()
+                    error = RealityDefenderError(
+                        f"Upload failed with status {response.status}: {text}",
+                        "upload_failed",
+                        response.status,
+                    )
+                    retry_statuses = client.retry_policies["upload"].get(
+                        "retry_statuses", []
+                    )
+                    if response.status in retry_statuses:
+                        raise RetryableError(
+                            error,
+                            retry_after=parse_retry_after(
+                                response.headers.get("Retry-After")
+                            ),
+                        )
+                    raise error
+        except aiohttp.ClientError as e:
+            raise RetryableError(
+                RealityDefenderError(f"Upload failed: {str(e)}", "upload_failed")
+            )
+        except asyncio.TimeoutError:
+            raise RetryableError(RealityDefenderError("Upload timed out", "timeout"))
+
+    try:
+        # A body that cannot be produced again is only sent once, still under
+        # the rate limit and circuit breaker of uploads
+        await client.with_retry(
+            "upload", attempt, max_attempts=None if replayable else 1
+        )
+    except RealityDefenderError:
+        raise
+    except Exception as e:
+        raise RealityDefenderError(f"Upload failed: {str(e)}", "upload_failed")
+
+
+async def stream_file(
+    file_path: str, chunk_size: int, use_mmap: bool = False
+) -> AsyncIterator[Union[bytes, memoryview]]:
+    """
+    Asynchronously yield a file's content in fixed-size chunks
+
+    Each chunk is read on the I/O executor so that disk reads never block the
+    event loop.
+
+    Args:
+        file_path: Path to the file
+        chunk_size: Maximum number of bytes per chunk
+        use_mmap: Yield memoryview slices of a memory-mapped file instead of bytes
+
+    Yields:
+        Consecutive chunks of the file content
+    """
+    chunks: Iterator[Union[bytes, memoryview]] = (
+        mmap_file_chunks(file_path, chunk_size)
+        if use_mmap
+        else read_file_chunks(file_path, chunk_size)
+    )
+    while True:
+        chunk = await run_blocking(next, chunks, None)
+        if chunk is None:
+            break
+        yield chunk
+
+
 async def upload_to_signed_url(
-    client: HttpClient, signed_url: str, file_path: str
+    client: HttpClient,
+    signed_url: str,
+    file_path: str,
+    stream: bool = False,
+    chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    use_mmap: bool = False,
 ) -> None:
     """
     Upload file content to a signed URL
@@ -49,39 +247,77 @@ async def upload_to_signed_url(
         client: HTTP client for API requests
         signed_url: URL for uploading
         file_path: Path to the file to upload
+        stream: Send the body in chunks instead of reading the whole file first
+        chunk_size: Size in bytes of each chunk when streaming
+        use_mmap: Stream zero-copy slices of a memory-mapped file (implies stream)
 
     Raises:
         RealityDefenderError: If upload fails
     """
     try:
-        # Get file information
-        _, content, content_type = get_file_info(file_path)
+        headers: Dict[str, str]
 
-        session = await client.ensure_session()
+        if stream or use_mmap:
+            # Validate without reading, then send with an explicit length so the
+            # storage endpoint does not receive a chunked transfer encoding
+            _, file_size, content_type = await run_blocking(
+                get_file_metadata, file_path
+            )
+            headers = {
+                "Content-Type": content_type,
+                "Content-Length": str(file_size),
+            }
 
-        # Upload directly to the signed URL
-        async with session.put(
-            signed_url, data=content, headers={"Content-Type": content_type}
-        ) as response:
-            if response.status >= 400:
-                text = await response.text()
-                raise RealityDefenderError(
-                    f"Upload failed with status {response.status}: {text}",
-                    "upload_failed",
-                )
+            def body() -> UploadBody:
+                # Read the file again from the start on every attempt
+                return stream_file(file_path, chunk_size, use_mmap=use_mmap)
+
+            # Only one chunk is held in memory at a time
+            async with reserve_upload_bytes(min(chunk_size, file_size)):
+                await put_to_signed_url(client, signed_url, body, headers)
+        else:
+            reserved = 0
+            if get_upload_byte_budget() is not None:
+                # Wait for budget before the whole file is read into memory
+                _, reserved, _ = await run_blocking(get_file_metadata, file_path)
+
+            async with reserve_upload_bytes(reserved):
+                # Get file information
+                _, content, content_type = await run_blocking(get_file_info, file_path)
+                headers = {"Content-Type": content_type}
+                await put_to_signed_url(client, signed_url, content, headers)
     except RealityDefenderError:
         raise
     except Exception as e:
         raise RealityDefenderError(f"Upload failed: {str(e)}", "upload_failed")
 
 
-async def upload_file(client: HttpClient, file_path: str) -> UploadResult:
+async def upload_file(
+    client: HttpClient,
+    file_path: str,
+    stream: bool = False,
+    chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    use_mmap: bool = False,
+    multipart_backend: Optional[MultipartUploadBackend] = None,
+    part_size: int = DEFAULT_MULTIPART_PART_SIZE,
+    concurrency: int = DEFAULT_MULTIPART_CONCURRENCY,
+    journal: Optional[UploadJournal] = None,
+) -> UploadResult:
     """
     Upload a file to Reality Defender for analysis
 
     Args:
         client: HTTP client for API requests
         file_path: Path to the file to upload
+        stream: Send the body in chunks instead of reading the whole file first
+        chunk_size: Size in bytes of each chunk when streaming
+        use_mmap: Stream zero-copy slices of a memory-mapped file (implies stream)
+        multipart_backend: Upload the file in parallel parts through this backend
+        part_size: Size in bytes of each part for multipart uploads
+        concurrency: Maximum number of parts uploaded at once for multipart uploads
+        journal: Checkpoint journal used to resume an interrupted upload. A resumed
+            upload reuses its signed URL and request ID; multipart uploads also
+            skip the parts that were already stored.
 
     Returns:
         Dictionary with request_id and media_id
@@ -96,22 +332,68 @@ async def upload_file(client: HttpClient, file_path: str) -> UploadResult:
         # Get the filename
         filename = os.path.basename(file_path)
 
-        # Get signed URL
-        signed_url_response = await get_signed_url(client, filename)
+        entry = await run_blocking(journal.get, file_path) if journal else None
 
-        # Handle regular API response format
-        request_id: str = signed_url_response.get("requestId", "")
-        media_id: str = signed_url_response.get("mediaId", "")
-        signed_url = signed_url_response.get("response", {}).get("signedUrl", "")
-
-        if not request_id or not media_id or not signed_url:
-            raise RealityDefenderError(
-                "Invalid response from API - missing requestId, mediaId, or signedUrl",
-                "server_error",
+        if entry is not None:
+            # Continue the interrupted upload with its original signed URL
+            request_id = entry["request_id"]
+            media_id = entry["media_id"]
+            signed_url = entry["signed_url"]
+        else:
+            request_id, media_id, signed_url = await request_signed_url(
+                client, filename
             )
 
+            if journal:
+                entry = await run_blocking(
+                    journal.start, file_path, signed_url, request_id, media_id
+                )
+
         # Upload to signed URL
-        await upload_to_signed_url(client, signed_url, file_path)
+        if multipart_backend is not None:
+            upload_id = None
+            completed_parts: List[CompletedPart] = []
+            if entry is not None and entry.get("part_size") == part_size:
+                upload_id = entry["upload_id"]
+                completed_parts = entry["completed_parts"]
+
+            # Checkpoints are written in the order parts complete
+            checkpoint_lock = asyncio.Lock()
+
+            async def checkpoint(
+                active_upload_id: str, parts: List[CompletedPart]
+            ) -> None:
+                if journal and entry is not None:
+                    async with checkpoint_lock:
+                        entry["upload_id"] = active_upload_id
+                        entry["part_size"] = part_size
+                        entry["completed_parts"] = parts
+                        await run_blocking(journal.save, file_path, entry.copy())
+
+            await upload_multipart(
+                multipart_backend,
+                signed_url,
+                file_path,
+                part_size=part_size,
+                concurrency=concurrency,
+                upload_id=upload_id,
+                completed_parts=completed_parts,
+                on_progress=checkpoint,
+                # Keep stored parts around so that a retry can resume them
+                abort_on_failure=journal is None,
+            )
+        else:
+            await upload_to_signed_url(
+                client,
+                signed_url,
+                file_path,
+                stream=stream,
+                chunk_size=chunk_size,
+                use_mmap=use_mmap,
+            )
+
+        if journal:
+            await run_blocking(journal.remove, file_path)
 
         # Return result
         return {"request_id": request_id, "media_id": media_id}
@@ -121,3 +403,202 @@ async def upload_file(client: HttpClient, file_path: str) -> UploadResult:
     except Exception as e:
         # Convert other errors to SDK errors
         raise RealityDefenderError(f"Upload failed: {str(e)}", "upload_failed")
+
+
+async def upload_content(
+    client: HttpClient,
+    filename: str,
+    data: UploadBody,
+    headers: Dict[str, str],
+    reserved_bytes: int = 0,
+) -> UploadResult:
+    """
+    Upload validated content that is not read from a file path
+
+    Args:
+        client: HTTP client for API requests
+        filename: Name the media is registered with
+        data: Content, either in full or as an async iterator of chunks
+        headers: Request headers for the signed URL upload
+        reserved_bytes: Upload byte budget held while the content is sent
+
+    Returns:
+        Dictionary with request_id and media_id
+
+    Raises:
+        RealityDefenderError: If upload fails
+    """
+    try:
+        request_id, media_id, signed_url = await request_signed_url(client, filename)
+        async with reserve_upload_bytes(reserved_bytes):
+            await put_to_signed_url(client, signed_url, data, headers)
+        return {"request_id": request_id, "media_id": media_id}
+    except RealityDefenderError:
+        raise
+    except Exception as e:
+        raise RealityDefenderError(f"Upload failed: {str(e)}", "upload_failed")
+
+
+async def upload_bytes(
+    client: HttpClient,
+    data: bytes,
+    filename: Optional[str] = None,
+    content_type: Optional[str] = None,
+) -> UploadResult:
+    """
+    Upload in-memory content to Reality Defender for analysis
+
+    Args:
+        client: HTTP client for API requests
+        data: Media content
+        filename: Name of the media, used to determine its type
+        content_type: MIME type of the media, used when no filename is given
+
+    Returns:
+        Dictionary with request_id and media_id
+
+    Raises:
+        RealityDefenderError: If the media is invalid or upload fails
+    """
+    filename, content_type = validate_media(len(data), filename, content_type)
+    return await upload_content(
+        client, filename, data, {"Content-Type": content_type}, len(data)
+    )
+
+
+async def stream_fileobj(
+    fileobj: BinaryIO, size: int, chunk_size: int
+) -> AsyncIterator[bytes]:
+    """
+    Asynchronously yield up to size bytes from a file-like object
+
+    Args:
+        fileobj: Binary file-like object positioned at the start of the content
+        size: Number of bytes to read
+        chunk_size: Maximum number of bytes per chunk
+
+    Yields:
+        Consecutive chunks of the content
+    """
+    remaining = size
+    while remaining > 0:
+        chunk = await run_blocking(fileobj.read, min(chunk_size, remaining))
+        if not chunk:
+            raise RealityDefenderError(
+                f"Stream ended {remaining} bytes before its declared size",
+                "upload_failed",
+            )
+        remaining -= len(chunk)
+        yield chunk
+
+
+async def upload_fileobj(
+    client: HttpClient,
+    fileobj: BinaryIO,
+    filename: Optional[str] = None,
+    content_type: Optional[str] = None,
+    size: Optional[int] = None,
+    chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+) -> UploadResult:
+    """
+    Upload the content of a binary file-like object for analysis
+
+    The content is read from the current position in chunks, so it is never
+    held in memory as a whole.
+
+    Args:
+        client: HTTP client for API requests
+        fileobj: Binary file-like object, e.g. a request body or io.BytesIO
+        filename: Name of the media, defaults to fileobj.name when available
+        content_type: MIME type of the media, used when no filename is known
+        size: Number of bytes to upload, required if fileobj is not seekable
+        chunk_size: Size in bytes of each chunk read from fileobj
+
+    Returns:
+        Dictionary with request_id and media_id
+
+    Raises:
+        RealityDefenderError: If the media is invalid or upload fails
+    """
+    if filename is None and isinstance(getattr(fileobj, "name", None), str):
+        filename = os.path.basename(fileobj.name)
+
+    if size is None:
+        size = get_remaining_size(fileobj)
+        if size is None:
+            raise RealityDefenderError(
+                "size is required for file objects that are not seekable",
+                "invalid_request",
+            )
+
+    filename, content_type = validate_media(size, filename, content_type)
+    return await upload_content(
+        client,
+        filename,
+        stream_fileobj(fileobj, size, chunk_size),
+        {"Content-Type": content_type, "Content-Length": str(size)},
+        min(chunk_size, size),
+    )
+
+
+async def count_stream(stream: AsyncIterable[bytes], size: int) -> AsyncIterator[bytes]:
+    """
+    Pass chunks through while checking that they add up to the declared size
+
+    Args:
+        stream: Async iterable of content chunks
+        size: Declared total number of bytes
+
+    Yields:
+        The chunks of the stream
+    """
+    sent = 0
+    async for chunk in stream:
+        sent += len(chunk)
+        if sent > size:
+            raise RealityDefenderError(
+                f"Stream exceeded its declared size of {size} bytes", "upload_failed"
+            )
+        yield chunk
+    if sent != size:
+        raise RealityDefenderError(
+            f"Stream ended {size - sent} bytes before its declared size",
+            "upload_failed",
+        )
+
+
+async def upload_stream(
+    client: HttpClient,
+    stream: AsyncIterable[bytes],
+    size: int,
+    filename: Optional[str] = None,
+    content_type: Optional[str] = None,
+) -> UploadResult:
+    """
+    Upload content produced by an async byte iterator for analysis
+
+    Signed URLs require the length of the body up front, so the total size of
+    the stream has to be declared.
+
+    Args:
+        client: HTTP client for API requests
+        stream: Async iterable of content chunks, e.g. an incoming request body
+        size: Total number of bytes the stream produces
+        filename: Name of the media, used to determine its type
+        content_type: MIME type of the media, used when no filename is given
+
+    Returns:
+        Dictionary with request_id and media_id
+
+    Raises:
+        RealityDefenderError: If the media is invalid or upload fails
+    """
+    filename, content_type = validate_media(size, filename, content_type)
+    return await upload_content(
+        client,
+        filename,
+        count_stream(stream, size),
+        {"Content-Type": content_type, "Content-Length": str(size)},
+        # Chunk sizes are up to the caller, assume the default
+        min(DEFAULT_UPLOAD_CHUNK_SIZE, size),
+    )
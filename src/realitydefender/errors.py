@@ -2,7 +2,7 @@
 Error types and classes for the Reality Defender SDK
 """
 
-from typing import Literal
+from typing import Literal, Optional
 
 # Error codes returned by the SDK
 ErrorCode = Literal[
@@ -14,6 +14,7 @@ ErrorCode = Literal[
     "file_too_large",  # File too large to upload.
     "upload_failed",  # Failed to upload the file
     "not_found",  # Requested resource not found
+    "circuit_open",  # Endpoint is failing and calls are rejected for now
     "unknown_error",  # Unexpected error
 ]
 
@@ -23,17 +24,19 @@ class RealityDefenderError(Exception):
     Custom exception class for Reality Defender SDK errors
     """
 
-    def __init__(self, message: str, code: ErrorCode):
+    def __init__(self, message: str, code: ErrorCode, status: Optional[int] = None):
         """
         Creates a new SDK error
 
         Args:
             message: Human-readable error message
             code: Machine-readable error code
+            status: HTTP status of the response the error was raised for, if any
         """
         super().__init__(message)
         self.message = message
         self.code = code
+        self.status = status
 
     def __str__(self) -> str:
         return f"{self.message} (Code: {self.code})"
@@ -2,7 +2,7 @@
 Type definitions for the Reality Defender SDK
 """
 
-from typing import List, Optional, TypedDict
+from typing import Iterator, List, Mapping, Optional, Tuple, TypedDict
 from typing import Dict, Literal, Protocol, Union, Any
 
 from realitydefender.errors import RealityDefenderError
@@ -47,6 +47,79 @@ class DetectionResult(TypedDict):
     """Results from individual detection models"""
 
 
+class CompactDetectionResult(Mapping[str, Any]):
+    """
+    Memory-efficient, read-only detection result
+
+    Stores its fields in slots and keeps the models as a flat tuple of
+    (name, status, score) values; the list of ModelResult dicts is only built
+    the first time `models` is accessed. It behaves like a read-only
+    DetectionResult: result["status"], result.get("score"), iteration over the
+    keys and comparison with an equal dict all work.
+    """
+
+    __slots__ = ("request_id", "status", "score", "_model_fields", "_models")
+
+    _KEYS = ("request_id", "status", "score", "models")
+
+    request_id: str
+    status: str
+    score: Optional[float]
+    _model_fields: Tuple[Any, ...]
+    _models: Optional[List[ModelResult]]
+
+    def __init__(
+        self,
+        request_id: str,
+        status: str,
+        score: Optional[float],
+        model_fields: Tuple[Any, ...] = (),
+    ) -> None:
+        self.request_id = request_id
+        self.status = status
+        self.score = score
+        self._model_fields = model_fields
+        self._models = None
+
+    @property
+    def models(self) -> List[ModelResult]:
+        """Results from individual detection models, built on first access"""
+        if self._models is None:
+            fields = self._model_fields
+            self._models = [
+                {"name": fields[i], "status": fields[i + 1], "score": fields[i + 2]}
+                for i in range(0, len(fields), 3)
+            ]
+        return self._models
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def to_dict(self) -> DetectionResult:
+        """Convert to a regular DetectionResult dict"""
+        return {
+            "request_id": self.request_id,
+            "status": self.status,
+            "score": self.score,
+            "models": [model.copy() for model in self.models],
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactDetectionResult(request_id={self.request_id!r}, "
+            f"status={self.status!r}, score={self.score!r}, "
+            f"models={len(self._model_fields) // 3})"
+        )
+
+
 class DetectionResultList(TypedDict):
     """List of detection results"""
 
@@ -66,6 +139,40 @@ class DetectionResultList(TypedDict):
     """List of detection results"""
 
 
+class CompletedPart(TypedDict):
+    """A part of a multipart upload that has been stored"""
+
+    part_number: int
+    """1-based position of the part within the file"""
+
+    etag: str
+    """Entity tag returned by the storage backend for the part"""
+
+
+class MultipartUploadBackend(Protocol):
+    """Storage backend able to receive a file as concurrently uploaded parts"""
+
+    async def create_upload(self, target_url: str, content_type: str) -> str:
+        """Start a multipart upload and return its upload ID"""
+        ...
+
+    async def upload_part(
+        self, target_url: str, upload_id: str, part_number: int, data: bytes
+    ) -> str:
+        """Store a single part and return its entity tag"""
+        ...
+
+    async def complete_upload(
+        self, target_url: str, upload_id: str, parts: List[CompletedPart]
+    ) -> None:
+        """Assemble the stored parts, ordered by part number, into the final object"""
+        ...
+
+    async def abort_upload(self, target_url: str, upload_id: str) -> None:
+        """Discard an unfinished upload and any parts stored for it"""
+        ...
+
+
 # Protocol for event handlers
 class ResultHandler(Protocol):
     """Event handler for detection results"""
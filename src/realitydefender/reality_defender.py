@@ -6,27 +6,90 @@ import asyncio
 import atexit
 import os
 from datetime import date
-from typing import Any, Callable, Coroutine, Optional, TypeVar, cast
-
-import asyncio_atexit  # type:ignore
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    BinaryIO,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
-from realitydefender.client import create_http_client
+import asyncio_atexit  # type: ignore
+
+from realitydefender.cache.backends import MemoryCache
+from realitydefender.cache.dedup import UploadCache
+from realitydefender.cache.results import ResultCache
+from realitydefender.cache.store import ResultStore
+from realitydefender.client import (
+    CircuitBreakerConfig,
+    ClientConfig,
+    JsonCodec,
+    PoolConfig,
+    RateLimitConfig,
+    RetryBudgetConfig,
+    RetryPolicy,
+    create_http_client,
+)
 from realitydefender.core.constants import (
     DEFAULT_POLLING_INTERVAL,
     DEFAULT_TIMEOUT,
     DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_MULTIPART_CONCURRENCY,
+    DEFAULT_MULTIPART_PART_SIZE,
+    DEFAULT_POLLING_CONCURRENCY,
+    DEFAULT_RESULTS_CONCURRENCY,
+    DEFAULT_RESULTS_PREFETCH,
+    DEFAULT_RESULT_CACHE_SIZE,
+    DEFAULT_SHARD_MAX_ITEMS,
+    DEFAULT_UPLOAD_CHUNK_SIZE,
+    PENDING_STATUSES,
 )
 from realitydefender.core.events import EventEmitter
 from realitydefender.detection.results import (
+    get_all_detection_results,
     get_detection_result,
     get_detection_results,
+    iter_detection_result_pages,
+    iter_detection_results,
+)
+from realitydefender.detection.journal import UploadJournal
+from realitydefender.detection.estimator import ProcessingTimeEstimator
+from realitydefender.detection.polling import (
+    FixedPolling,
+    MediaTypePolling,
+    PollingStrategy,
+)
+from realitydefender.detection.scheduler import PollingScheduler
+from realitydefender.detection.planner import iter_sharded_results
+from realitydefender.detection.sync import SyncReport, sync_results
+from realitydefender.detection.upload import (
+    upload_bytes,
+    upload_file,
+    upload_fileobj,
+    upload_stream,
 )
-from realitydefender.detection.upload import upload_file
 from realitydefender.detection.social import upload_social_media_link
 from realitydefender.errors import RealityDefenderError
+from realitydefender.utils.async_utils import run_blocking
+from realitydefender.utils.file_utils import (
+    get_file_metadata,
+    get_media_type,
+    get_remaining_size,
+)
+from realitydefender.utils.loop_thread import get_background_loop
+from realitydefender.utils.singleflight import SingleFlight
 from realitydefender.model import (
     DetectionResult,
     ErrorHandler,
+    MultipartUploadBackend,
     ResultHandler,
     UploadResult,
     DetectionResultList,
@@ -40,13 +103,63 @@ class RealityDefender(EventEmitter):
     Main SDK class for interacting with the Reality Defender API
     """
 
-    def __init__(self, api_key: str, base_url: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        upload_journal: Optional[UploadJournal] = None,
+        upload_cache: Optional[UploadCache] = None,
+        result_store: Optional[ResultStore] = None,
+        result_cache: Optional[ResultCache] = None,
+        pool: Optional[PoolConfig] = None,
+        storage_pool: Optional[PoolConfig] = None,
+        retry: Optional[Dict[str, RetryPolicy]] = None,
+        retry_budget: Optional[RetryBudgetConfig] = None,
+        circuit_breaker: Optional[CircuitBreakerConfig] = None,
+        rate_limits: Optional[Dict[str, RateLimitConfig]] = None,
+        codec: Union[str, JsonCodec] = "auto",
+        coalesce: bool = True,
+        polling_concurrency: int = DEFAULT_POLLING_CONCURRENCY,
+        polling_strategy: Optional[PollingStrategy] = None,
+        estimator: Optional[ProcessingTimeEstimator] = None,
+    ) -> None:
         """
         Creates a new Reality Defender SDK instance
 
         Args:
             api_key: Reality Defender API key
             base_url: Base URL to connect to Reality Defender API
+            upload_journal: Checkpoint journal that lets interrupted uploads resume
+            upload_cache: Content-addressed cache that returns the previous upload
+                and result for identical files without contacting the API
+            result_store: Local store of results; get_result answers from it for
+                results that finished processing and stores the ones it fetches
+            result_cache: In-process cache of results that finished processing,
+                and of recent not found errors, used by get_result
+            pool: Connection pool and timeout settings for API requests
+            storage_pool: Connection pool and timeout settings for uploads to
+                signed URLs, kept separate so uploads cannot starve API requests
+            retry: Retry policy overrides per operation: signed_url, upload,
+                result, list or default
+            retry_budget: Limit on retries across all requests, so that retries
+                cannot amplify an outage
+            circuit_breaker: Settings of the circuit breakers that fail calls fast
+                while an endpoint is failing
+            rate_limits: Request rates allowed per operation, optionally shared by
+                processes on the host through a SQLite database
+            codec: JSON codec for API responses: "auto" uses orjson or msgspec
+                when installed, or "stdlib", "orjson", "msgspec" or an instance
+            coalesce: Whether concurrent identical GET requests, and concurrent
+                get_result calls for the same request ID, share one request or
+                polling loop
+            polling_concurrency: Maximum number of result polls in flight for
+                the requests watched with watch_result
+            polling_strategy: Default strategy deciding the wait before each poll
+                for results, e.g. ExponentialPolling or MediaTypePolling; polls at
+                a fixed interval when not given
+            estimator: Learns processing times of uploaded media to poll for
+                their results when they are likely done, replacing
+                polling_strategy for the uploads it timed
 
         Raises:
             RealityDefenderError: If the API key is missing
@@ -57,9 +170,38 @@ class RealityDefender(EventEmitter):
             raise RealityDefenderError("API key is required", "unauthorized")
 
         self.api_key = api_key
-        self.client = create_http_client(
-            {"api_key": self.api_key, "base_url": base_url}
+        config: ClientConfig = {
+            "api_key": self.api_key,
+            "base_url": base_url,
+            "codec": codec,
+            "coalesce": coalesce,
+        }
+        if pool is not None:
+            config["pool"] = pool
+        if storage_pool is not None:
+            config["storage_pool"] = storage_pool
+        if retry is not None:
+            config["retry"] = retry
+        if retry_budget is not None:
+            config["retry_budget"] = retry_budget
+        if circuit_breaker is not None:
+            config["circuit_breaker"] = circuit_breaker
+        if rate_limits is not None:
+            config["rate_limits"] = rate_limits
+        self.client = create_http_client(config)
+        self.upload_journal = upload_journal
+        self.upload_cache = upload_cache
+        self.result_store = result_store
+        self.result_cache = result_cache
+        self.result_polls: Optional[SingleFlight[DetectionResult]] = (
+            SingleFlight() if coalesce else None
         )
+        self.polling_concurrency = polling_concurrency
+        self.polling_scheduler: Optional[PollingScheduler] = None
+        self.polling_strategy = polling_strategy
+        self.estimator = estimator
+        # Media type of recent uploads, to poll them with a MediaTypePolling
+        self._media_types = MemoryCache(DEFAULT_RESULT_CACHE_SIZE)
 
         # register handlers to clean anything up at exit
         atexit.register(self.cleanup_sync)
@@ -70,12 +212,27 @@ class RealityDefender(EventEmitter):
             # If there is no async loop running, then we can't register cleanup
             pass
 
-    async def upload(self, file_path: str) -> UploadResult:
+    async def upload(
+        self,
+        file_path: str,
+        stream: bool = False,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        use_mmap: bool = False,
+        multipart_backend: Optional[MultipartUploadBackend] = None,
+        part_size: int = DEFAULT_MULTIPART_PART_SIZE,
+        concurrency: int = DEFAULT_MULTIPART_CONCURRENCY,
+    ) -> UploadResult:
         """
         Upload a file to Reality Defender for analysis (async version)
 
         Args:
             file_path: Path to file to upload
+            stream: Send the file in chunks so memory use is bounded by chunk_size
+            chunk_size: Size in bytes of each chunk when streaming
+            use_mmap: Stream zero-copy slices of a memory-mapped file (implies stream)
+            multipart_backend: Upload the file in parallel parts through this backend
+            part_size: Size in bytes of each part for multipart uploads
+            concurrency: Maximum number of parts uploaded at once for multipart uploads
 
         Returns:
             Dictionary with request_id and media_id
@@ -84,14 +241,49 @@ class RealityDefender(EventEmitter):
             RealityDefenderError: If upload fails
         """
         try:
-            result = await upload_file(self.client, file_path)
+            digest: Optional[str] = None
+            if self.upload_cache is not None:
+                # Reject unsupported and oversized files before hashing them
+                await run_blocking(get_file_metadata, file_path)
+                digest = await run_blocking(self.upload_cache.digest, file_path)
+                cached = await run_blocking(self.upload_cache.get_upload, digest)
+                if cached is not None:
+                    return cached
+
+            result = await upload_file(
+                self.client,
+                file_path,
+                stream=stream,
+                chunk_size=chunk_size,
+                use_mmap=use_mmap,
+                multipart_backend=multipart_backend,
+                part_size=part_size,
+                concurrency=concurrency,
+                journal=self.upload_journal,
+            )
+
+            if self.upload_cache is not None and digest is not None:
+                await run_blocking(self.upload_cache.put_upload, digest, result)
+            self._remember_media_type(result["request_id"], file_path)
+            if self.estimator is not None:
+                size = await run_blocking(os.path.getsize, file_path)
+                self.estimator.start(result["request_id"], file_path, size)
             return result
         except RealityDefenderError:
             raise
         except Exception as error:
             raise RealityDefenderError(f"Upload failed: {str(error)}", "upload_failed")
 
-    def upload_sync(self, file_path: str) -> UploadResult:
+    def upload_sync(
+        self,
+        file_path: str,
+        stream: bool = False,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        use_mmap: bool = False,
+        multipart_backend: Optional[MultipartUploadBackend] = None,
+        part_size: int = DEFAULT_MULTIPART_PART_SIZE,
+        concurrency: int = DEFAULT_MULTIPART_CONCURRENCY,
+    ) -> UploadResult:
         """
         Upload a file to Reality Defender for analysis (synchronous version)
 
@@ -99,6 +291,107 @@ class RealityDefender(EventEmitter):
 
         Args:
             file_path: Path to file to upload
+            stream: Send the file in chunks so memory use is bounded by chunk_size
+            chunk_size: Size in bytes of each chunk when streaming
+            use_mmap: Stream zero-copy slices of a memory-mapped file (implies stream)
+            multipart_backend: Upload the file in parallel parts through this backend
+            part_size: Size in bytes of each part for multipart uploads
+            concurrency: Maximum number of parts uploaded at once for multipart uploads
+
+        Returns:
+            Dictionary with request_id and media_id
+
+        Raises:
+            RealityDefenderError: If upload fails
+        """
+        return self._run_async(
+            self.upload(
+                file_path,
+                stream=stream,
+                chunk_size=chunk_size,
+                use_mmap=use_mmap,
+                multipart_backend=multipart_backend,
+                part_size=part_size,
+                concurrency=concurrency,
+            )
+        )
+
+    async def upload_bytes(
+        self,
+        data: bytes,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> UploadResult:
+        """
+        Upload in-memory media to Reality Defender for analysis (async version)
+
+        Args:
+            data: Media content
+            filename: Name of the media, used to determine its type
+            content_type: MIME type of the media, used when no filename is given
+
+        Returns:
+            Dictionary with request_id and media_id
+
+        Raises:
+            RealityDefenderError: If upload fails
+        """
+        try:
+            result = await upload_bytes(
+                self.client, data, filename=filename, content_type=content_type
+            )
+            self._remember_media_type(result["request_id"], filename)
+            if self.estimator is not None:
+                self.estimator.start(result["request_id"], filename or "", len(data))
+            return result
+        except RealityDefenderError:
+            raise
+        except Exception as error:
+            raise RealityDefenderError(f"Upload failed: {str(error)}", "upload_failed")
+
+    def upload_bytes_sync(
+        self,
+        data: bytes,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> UploadResult:
+        """
+        Upload in-memory media to Reality Defender for analysis (synchronous version)
+
+        This is a convenience wrapper around the async upload_bytes method.
+
+        Args:
+            data: Media content
+            filename: Name of the media, used to determine its type
+            content_type: MIME type of the media, used when no filename is given
+
+        Returns:
+            Dictionary with request_id and media_id
+
+        Raises:
+            RealityDefenderError: If upload fails
+        """
+        return self._run_async(
+            self.upload_bytes(data, filename=filename, content_type=content_type)
+        )
+
+    async def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        size: Optional[int] = None,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    ) -> UploadResult:
+        """
+        Upload media from a binary file-like object for analysis (async version)
+
+        Args:
+            fileobj: Binary file-like object, read from its current position
+            filename: Name of the media, defaults to fileobj.name when available
+            content_type: MIME type of the media, used when no filename is known
+            size: Number of bytes to upload, required if fileobj is not seekable
+            chunk_size: Size in bytes of each chunk read from fileobj
 
         Returns:
             Dictionary with request_id and media_id
@@ -106,7 +399,103 @@ class RealityDefender(EventEmitter):
         Raises:
             RealityDefenderError: If upload fails
         """
-        return self._run_async(self.upload(file_path))
+        try:
+            if size is None and self.estimator is not None:
+                size = get_remaining_size(fileobj)
+            result = await upload_fileobj(
+                self.client,
+                fileobj,
+                filename=filename,
+                content_type=content_type,
+                size=size,
+                chunk_size=chunk_size,
+            )
+            name = filename or getattr(fileobj, "name", None)
+            self._remember_media_type(result["request_id"], name)
+            if self.estimator is not None and size is not None:
+                self.estimator.start(
+                    result["request_id"], name if isinstance(name, str) else "", size
+                )
+            return result
+        except RealityDefenderError:
+            raise
+        except Exception as error:
+            raise RealityDefenderError(f"Upload failed: {str(error)}", "upload_failed")
+
+    def upload_fileobj_sync(
+        self,
+        fileobj: BinaryIO,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        size: Optional[int] = None,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    ) -> UploadResult:
+        """
+        Upload media from a binary file-like object for analysis (synchronous version)
+
+        This is a convenience wrapper around the async upload_fileobj method.
+
+        Args:
+            fileobj: Binary file-like object, read from its current position
+            filename: Name of the media, defaults to fileobj.name when available
+            content_type: MIME type of the media, used when no filename is known
+            size: Number of bytes to upload, required if fileobj is not seekable
+            chunk_size: Size in bytes of each chunk read from fileobj
+
+        Returns:
+            Dictionary with request_id and media_id
+
+        Raises:
+            RealityDefenderError: If upload fails
+        """
+        return self._run_async(
+            self.upload_fileobj(
+                fileobj,
+                filename=filename,
+                content_type=content_type,
+                size=size,
+                chunk_size=chunk_size,
+            )
+        )
+
+    async def upload_stream(
+        self,
+        stream: AsyncIterable[bytes],
+        size: int,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> UploadResult:
+        """
+        Upload media produced by an async byte iterator for analysis
+
+        Args:
+            stream: Async iterable of content chunks, e.g. an incoming request body
+            size: Total number of bytes the stream produces
+            filename: Name of the media, used to determine its type
+            content_type: MIME type of the media, used when no filename is given
+
+        Returns:
+            Dictionary with request_id and media_id
+
+        Raises:
+            RealityDefenderError: If upload fails
+        """
+        try:
+            result = await upload_stream(
+                self.client,
+                stream,
+                size,
+                filename=filename,
+                content_type=content_type,
+            )
+            self._remember_media_type(result["request_id"], filename)
+            if self.estimator is not None:
+                self.estimator.start(result["request_id"], filename or "", size)
+            return result
+        except RealityDefenderError:
+            raise
+        except Exception as error:
+            raise RealityDefenderError(f"Upload failed: {str(error)}", "upload_failed")
 
     async def upload_social_media(self, social_media_link: str) -> UploadResult:
         """
@@ -161,6 +550,7 @@ class RealityDefender(EventEmitter):
         request_id: str,
         max_attempts: int = DEFAULT_MAX_ATTEMPTS,
         polling_interval: int = DEFAULT_POLLING_INTERVAL,
+        polling_strategy: Optional[PollingStrategy] = None,
     ) -> DetectionResult:
         """
         Get the detection result for a specific request ID (async version)
@@ -169,16 +559,109 @@ class RealityDefender(EventEmitter):
             request_id: The request ID to get results for
             max_attempts: Maximum number of attempts to get results
             polling_interval: How long to wait between attempts
+            polling_strategy: Decides the wait before each poll, replacing
+                polling_interval; defaults to the SDK's polling_strategy
 
         Returns:
             Detection result with status and scores
         """
-        return await get_detection_result(
-            self.client,
+        if self.upload_cache is not None:
+            cached = await run_blocking(self.upload_cache.get_result, request_id)
+            if cached is not None:
+                self._discard_timing(request_id)
+                return cached
+        if self.result_store is not None:
+            stored = await run_blocking(self.result_store.get, request_id)
+            if stored is not None and stored["status"] not in PENDING_STATUSES:
+                self._discard_timing(request_id)
+                return stored
+
+        try:
+            result = await get_detection_result(
+                self.client,
+                request_id,
+                max_attempts=max_attempts,
+                polling_interval=polling_interval,
+                cache=self.result_cache,
+                polls=self.result_polls,
+                polling_strategy=self._polling_strategy_for(
+                    request_id, polling_strategy
+                ),
+            )
+        except RealityDefenderError as e:
+            if e.code == "not_found":
+                self._discard_timing(request_id)
+            raise
+
+        if self.upload_cache is not None:
+            await run_blocking(self.upload_cache.put_result, result)
+        if self.result_store is not None and result["status"] not in PENDING_STATUSES:
+            await run_blocking(self.result_store.upsert, [result])
+        if self.estimator is not None:
+            if self.estimator.finish(request_id, result) and self.estimator.save_due():
+                await run_blocking(self.estimator.save)
+        return result
+
+    def watch_result(
+        self,
+        request_id: str,
+        max_attempts: Optional[int] = None,
+        polling_interval: Optional[int] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ) -> "asyncio.Future[DetectionResult]":
+        """
+        Poll the result of a request from the shared polling scheduler
+
+        Unlike get_result, which runs a polling loop per call, all watched
+        requests are polled by one scheduler with at most polling_concurrency
+        polls in flight, which keeps the load flat when many requests are
+        pending. Must be called from within a running event loop.
+
+        Args:
+            request_id: The request ID to get results for
+            max_attempts: Maximum number of attempts to get results
+            polling_interval: How long to wait between attempts, in milliseconds
+            polling_strategy: Decides the wait before each poll, replacing
+                polling_interval; defaults to the SDK's polling_strategy
+
+        Returns:
+            Future resolved with the detection result, as get_result returns it
+
+        Raises:
+            RealityDefenderError: If request_id is empty
+        """
+        if self.polling_scheduler is None:
+            self.polling_scheduler = PollingScheduler(
+                self.client,
+                concurrency=self.polling_concurrency,
+                cache=self.result_cache,
+                polling_strategy=self.polling_strategy,
+            )
+        if polling_strategy is not None or polling_interval is None:
+            polling_strategy = self._polling_strategy_for(request_id, polling_strategy)
+        future = self.polling_scheduler.submit(
             request_id,
             max_attempts=max_attempts,
             polling_interval=polling_interval,
+            polling_strategy=polling_strategy,
         )
+        estimator = self.estimator
+        if estimator is not None:
+
+            def record(done: "asyncio.Future[DetectionResult]") -> None:
+                # Observations are persisted by get_result and cleanup
+                if done.cancelled():
+                    return
+                error = done.exception()
+                if error is None:
+                    estimator.finish(request_id, done.result())
+                elif isinstance(error, RealityDefenderError) and (
+                    error.code == "not_found"
+                ):
+                    estimator.discard(request_id)
+
+            future.add_done_callback(record)
+        return future
 
     async def get_results(
         self,
@@ -189,6 +672,7 @@ class RealityDefender(EventEmitter):
         end_date: Optional[date] = None,
         max_attempts: int = DEFAULT_MAX_ATTEMPTS,
         polling_interval: int = DEFAULT_POLLING_INTERVAL,
+        compact: bool = False,
     ) -> DetectionResultList:
         """
         Fetches the results of detections from the client asynchronously with pagination, date
@@ -207,6 +691,9 @@ class RealityDefender(EventEmitter):
             end_date (Optional[date]): The end date for filtering results (inclusive).
             max_attempts (int): The maximum number of polling attempts to be performed.
             polling_interval (int): The interval duration (in seconds) between poll attempts.
+            compact (bool): Whether to return the items as CompactDetectionResult objects,
+            read-only mappings that use less memory and build their models list on
+            first access. Useful when fetching large numbers of results.
 
         Returns:
             DetectionResultList: A list containing the detection results fetched
@@ -221,6 +708,241 @@ class RealityDefender(EventEmitter):
             end_date=end_date,
             max_attempts=max_attempts,
             polling_interval=polling_interval,
+            compact=compact,
+        )
+
+    async def iter_results(
+        self,
+        size: int = 10,
+        name: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        polling_interval: int = DEFAULT_POLLING_INTERVAL,
+        compact: bool = False,
+        prefetch: int = DEFAULT_RESULTS_PREFETCH,
+    ) -> AsyncGenerator[DetectionResult, None]:
+        """
+        Iterate over all detection results matching the filters
+
+        Pages are fetched on demand, with up to `prefetch` pages requested
+        concurrently ahead of the one being consumed, so there is no need to
+        track page numbers or `total_pages`.
+
+        Args:
+            size: Number of results per page
+            name: Only return results with this name
+            start_date: Only return results from this date on (inclusive)
+            end_date: Only return results up to this date (inclusive)
+            max_attempts: Maximum number of attempts to fetch each page
+            polling_interval: How long to wait between attempts
+            compact: Whether to yield CompactDetectionResult objects
+            prefetch: Maximum number of pages fetched ahead of the current one
+
+        Returns:
+            Async iterator over the detection results
+        """
+        results = iter_detection_results(
+            self.client,
+            size=size,
+            name=name,
+            start_date=start_date,
+            end_date=end_date,
+            max_attempts=max_attempts,
+            polling_interval=polling_interval,
+            compact=compact,
+            prefetch=prefetch,
+        )
+        try:
+            async for result in results:
+                yield result
+        finally:
+            await results.aclose()
+
+    async def get_all_results(
+        self,
+        size: int = 10,
+        name: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        polling_interval: int = DEFAULT_POLLING_INTERVAL,
+        compact: bool = False,
+        concurrency: int = DEFAULT_RESULTS_CONCURRENCY,
+    ) -> DetectionResultList:
+        """
+        Fetch all detection results matching the filters, fetching pages concurrently
+
+        After the first page reports the number of pages, the remaining pages are
+        fetched by up to `concurrency` concurrent requests, each retried on its
+        own, and reassembled in order.
+
+        Args:
+            size: Number of results per page
+            name: Only return results with this name
+            start_date: Only return results from this date on (inclusive)
+            end_date: Only return results up to this date (inclusive)
+            max_attempts: Maximum number of attempts to fetch each page
+            polling_interval: How long to wait between attempts
+            compact: Whether to return CompactDetectionResult objects
+            concurrency: Maximum number of pages fetched concurrently
+
+        Returns:
+            DetectionResultList: A single page holding all the results
+        """
+        return await get_all_detection_results(
+            self.client,
+            size=size,
+            name=name,
+            start_date=start_date,
+            end_date=end_date,
+            max_attempts=max_attempts,
+            polling_interval=polling_interval,
+            compact=compact,
+            concurrency=concurrency,
+        )
+
+    async def iter_result_pages(
+        self,
+        size: int = 10,
+        name: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        polling_interval: int = DEFAULT_POLLING_INTERVAL,
+        compact: bool = False,
+        concurrency: int = DEFAULT_RESULTS_CONCURRENCY,
+    ) -> AsyncGenerator[Tuple[int, DetectionResultList], None]:
+        """
+        Fetch all pages of detection results concurrently, yielding them as they arrive
+
+        Unlike get_all_results, pages are yielded out of order, together with
+        their zero-based index, as soon as they have been fetched.
+
+        Args:
+            size: Number of results per page
+            name: Only return results with this name
+            start_date: Only return results from this date on (inclusive)
+            end_date: Only return results up to this date (inclusive)
+            max_attempts: Maximum number of attempts to fetch each page
+            polling_interval: How long to wait between attempts
+            compact: Whether the pages hold CompactDetectionResult objects
+            concurrency: Maximum number of pages fetched concurrently
+
+        Returns:
+            Async iterator over (page index, page) pairs
+        """
+        pages = iter_detection_result_pages(
+            self.client,
+            size=size,
+            name=name,
+            start_date=start_date,
+            end_date=end_date,
+            max_attempts=max_attempts,
+            polling_interval=polling_interval,
+            compact=compact,
+            concurrency=concurrency,
+        )
+        try:
+            async for page in pages:
+                yield page
+        finally:
+            await pages.aclose()
+
+    async def iter_sharded_results(
+        self,
+        start_date: date,
+        end_date: Optional[date] = None,
+        name: Optional[str] = None,
+        size: int = 100,
+        max_shard_items: int = DEFAULT_SHARD_MAX_ITEMS,
+        concurrency: int = DEFAULT_RESULTS_CONCURRENCY,
+        newest_first: bool = True,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        polling_interval: int = DEFAULT_POLLING_INTERVAL,
+        compact: bool = False,
+    ) -> AsyncGenerator[DetectionResult, None]:
+        """
+        Iterate over the detection results of a large date range
+
+        The range is split into date shards of at most `max_shard_items` results,
+        sized adaptively from the number of results in each, so that no request
+        pages deep into the listing. Shards are fetched concurrently and merged
+        into one stream in date order.
+
+        Args:
+            start_date: First day of the listing (inclusive)
+            end_date: Last day of the listing (inclusive), defaults to today
+            name: Only return results with this name
+            size: Number of results per page
+            max_shard_items: Maximum number of results per shard
+            concurrency: Maximum number of shards fetched concurrently
+            newest_first: Whether to yield the most recent results first, else
+                the oldest ones first
+            max_attempts: Maximum number of attempts to fetch each page
+            polling_interval: How long to wait between attempts
+            compact: Whether to yield CompactDetectionResult objects
+
+        Returns:
+            Async iterator over the detection results
+        """
+        results = iter_sharded_results(
+            self.client,
+            start_date,
+            end_date=end_date,
+            name=name,
+            size=size,
+            max_shard_items=max_shard_items,
+            concurrency=concurrency,
+            newest_first=newest_first,
+            max_attempts=max_attempts,
+            polling_interval=polling_interval,
+            compact=compact,
+        )
+        try:
+            async for result in results:
+                yield result
+        finally:
+            await results.aclose()
+
+    async def sync_results(
+        self,
+        store: ResultStore,
+        name: Optional[str] = None,
+        size: int = 100,
+        prefetch: int = DEFAULT_RESULTS_PREFETCH,
+        concurrency: int = DEFAULT_RESULTS_CONCURRENCY,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        polling_interval: int = DEFAULT_POLLING_INTERVAL,
+    ) -> SyncReport:
+        """
+        Incrementally sync detection results into a local store
+
+        The first sync lists the full history. Later syncs only list results
+        since the watermark recorded by the previous one, and fetch again the
+        stored results that were still being processed.
+
+        Args:
+            store: Store the results are written to
+            name: Only sync results with this name, with a watermark of its own
+            size: Number of results per page
+            prefetch: Maximum number of pages fetched ahead of the current one
+            concurrency: Maximum number of pending results fetched again concurrently
+            max_attempts: Maximum number of attempts to fetch each page
+            polling_interval: How long to wait between attempts
+
+        Returns:
+            What the sync listed and stored
+        """
+        return await sync_results(
+            self.client,
+            store,
+            name=name,
+            size=size,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            max_attempts=max_attempts,
+            polling_interval=polling_interval,
         )
 
     def get_result_sync(
@@ -228,6 +950,7 @@ class RealityDefender(EventEmitter):
         request_id: str,
         max_attempts: int = DEFAULT_MAX_ATTEMPTS,
         polling_interval: int = DEFAULT_POLLING_INTERVAL,
+        polling_strategy: Optional[PollingStrategy] = None,
     ) -> DetectionResult:
         """
         Get the detection result for a specific request ID (synchronous version)
@@ -238,13 +961,18 @@ class RealityDefender(EventEmitter):
             request_id: The request ID to get results for
             max_attempts: Maximum number of attempts to get results
             polling_interval: How long to wait between attempts
+            polling_strategy: Decides the wait before each poll, replacing
+                polling_interval; defaults to the SDK's polling_strategy
 
         Returns:
             Detection result with status and scores
         """
         return self._run_async(
             self.get_result(
-                request_id, max_attempts=max_attempts, polling_interval=polling_interval
+                request_id,
+                max_attempts=max_attempts,
+                polling_interval=polling_interval,
+                polling_strategy=polling_strategy,
             )
         )
 
@@ -257,6 +985,7 @@ class RealityDefender(EventEmitter):
         end_date: Optional[date] = None,
         max_attempts: int = DEFAULT_MAX_ATTEMPTS,
         polling_interval: int = DEFAULT_POLLING_INTERVAL,
+        compact: bool = False,
     ) -> DetectionResultList:
         """
         Fetches a list of detection results synchronously with optional parameters for filtering and pagination.
@@ -274,6 +1003,8 @@ class RealityDefender(EventEmitter):
             max_attempts (int): The maximum number of polling attempts. Defaults to DEFAULT_POLLING_INTERVAL.
             polling_interval (int): The interval (in seconds) between polling attempts.
             Defaults to DEFAULT_POLLING_INTERVAL.
+            compact (bool): Whether to return the items as CompactDetectionResult objects.
+            Defaults to False.
 
         Returns:
             DetectionResultList: A list of detection results matching the provided filters and pagination criteria.
@@ -287,9 +1018,141 @@ class RealityDefender(EventEmitter):
                 end_date=end_date,
                 max_attempts=max_attempts,
                 polling_interval=polling_interval,
+                compact=compact,
             )
         )
 
+    def get_all_results_sync(
+        self,
+        size: int = 10,
+        name: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        polling_interval: int = DEFAULT_POLLING_INTERVAL,
+        compact: bool = False,
+        concurrency: int = DEFAULT_RESULTS_CONCURRENCY,
+    ) -> DetectionResultList:
+        """
+        Fetch all detection results matching the filters (synchronous version)
+
+        This is a convenience wrapper around the async get_all_results method.
+
+        Args:
+            size: Number of results per page
+            name: Only return results with this name
+            start_date: Only return results from this date on (inclusive)
+            end_date: Only return results up to this date (inclusive)
+            max_attempts: Maximum number of attempts to fetch each page
+            polling_interval: How long to wait between attempts
+            compact: Whether to return CompactDetectionResult objects
+            concurrency: Maximum number of pages fetched concurrently
+
+        Returns:
+            DetectionResultList: A single page holding all the results
+        """
+        return self._run_async(
+            self.get_all_results(
+                size=size,
+                name=name,
+                start_date=start_date,
+                end_date=end_date,
+                max_attempts=max_attempts,
+                polling_interval=polling_interval,
+                compact=compact,
+                concurrency=concurrency,
+            )
+        )
+
+    def sync_results_sync(
+        self,
+        store: ResultStore,
+        name: Optional[str] = None,
+        size: int = 100,
+        prefetch: int = DEFAULT_RESULTS_PREFETCH,
+        concurrency: int = DEFAULT_RESULTS_CONCURRENCY,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        polling_interval: int = DEFAULT_POLLING_INTERVAL,
+    ) -> SyncReport:
+        """
+        Incrementally sync detection results into a local store (synchronous version)
+
+        This is a convenience wrapper around the async sync_results method.
+
+        Args:
+            store: Store the results are written to
+            name: Only sync results with this name, with a watermark of its own
+            size: Number of results per page
+            prefetch: Maximum number of pages fetched ahead of the current one
+            concurrency: Maximum number of pending results fetched again concurrently
+            max_attempts: Maximum number of attempts to fetch each page
+            polling_interval: How long to wait between attempts
+
+        Returns:
+            What the sync listed and stored
+        """
+        return self._run_async(
+            self.sync_results(
+                store,
+                name=name,
+                size=size,
+                prefetch=prefetch,
+                concurrency=concurrency,
+                max_attempts=max_attempts,
+                polling_interval=polling_interval,
+            )
+        )
+
+    def iter_results_sync(
+        self,
+        size: int = 10,
+        name: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        polling_interval: int = DEFAULT_POLLING_INTERVAL,
+        compact: bool = False,
+        prefetch: int = DEFAULT_RESULTS_PREFETCH,
+    ) -> Iterator[DetectionResult]:
+        """
+        Iterate over all detection results matching the filters (synchronous version)
+
+        This is a convenience wrapper around the async iter_results method. The
+        prefetched pages are fetched while the next result is being requested.
+
+        Args:
+            size: Number of results per page
+            name: Only return results with this name
+            start_date: Only return results from this date on (inclusive)
+            end_date: Only return results up to this date (inclusive)
+            max_attempts: Maximum number of attempts to fetch each page
+            polling_interval: How long to wait between attempts
+            compact: Whether to yield CompactDetectionResult objects
+            prefetch: Maximum number of pages fetched ahead of the current one
+
+        Returns:
+            Iterator over the detection results
+        """
+        results = self.iter_results(
+            size=size,
+            name=name,
+            start_date=start_date,
+            end_date=end_date,
+            max_attempts=max_attempts,
+            polling_interval=polling_interval,
+            compact=compact,
+            prefetch=prefetch,
+        )
+
+        async def next_result() -> Optional[DetectionResult]:
+            return await anext(results, None)
+
+        try:
+            while (result := self._run_async(next_result())) is not None:
+                yield result
+        finally:
+            self._run_async(results.aclose())
+
     def detect_file(self, file_path: str) -> DetectionResult:
         """
         Convenience method to upload and detect a file in one step
@@ -321,6 +1184,7 @@ class RealityDefender(EventEmitter):
         request_id: str,
         polling_interval: Optional[int] = None,
         timeout: Optional[int] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
     ) -> None:
         """
         Start polling for results with event-based callback (async version)
@@ -329,11 +1193,18 @@ class RealityDefender(EventEmitter):
             request_id: The request ID to poll for
             polling_interval: Interval in milliseconds between polls (default: 2000)
             timeout: Maximum time to poll in milliseconds (default: 60000)
+            polling_strategy: Decides the wait before each poll, replacing
+                polling_interval; defaults to the SDK's polling_strategy
 
         Returns:
             Asyncio task that can be awaited
         """
-        polling_interval = polling_interval or DEFAULT_POLLING_INTERVAL
+        if polling_strategy is not None or polling_interval is None:
+            polling_strategy = self._polling_strategy_for(request_id, polling_strategy)
+        if polling_strategy is None:
+            polling_strategy = FixedPolling(
+                polling_interval or DEFAULT_POLLING_INTERVAL
+            )
         timeout = timeout or DEFAULT_TIMEOUT
 
         elapsed = 0
@@ -347,12 +1218,19 @@ class RealityDefender(EventEmitter):
             )
             return
 
+        delay = polling_strategy.first_delay()
+        if delay > 0:
+            elapsed += delay
+            await asyncio.sleep(delay / 1000)  # Convert to seconds
+        delay = 0
+
         while not is_completed and elapsed < max_wait_time:
             try:
                 result = await self.get_result(request_id)
                 if result["status"] == "ANALYZING":
-                    elapsed += polling_interval
-                    await asyncio.sleep(polling_interval / 1000)  # Convert to seconds
+                    delay = polling_strategy.next_delay(delay)
+                    elapsed += delay
+                    await asyncio.sleep(delay / 1000)  # Convert to seconds
                 else:
                     # We have a final result
                     is_completed = True
@@ -360,8 +1238,9 @@ class RealityDefender(EventEmitter):
             except RealityDefenderError as error:
                 if error.code == "not_found":
                     # Result not ready yet, continue polling
-                    elapsed += polling_interval
-                    await asyncio.sleep(polling_interval / 1000)  # Convert to seconds
+                    delay = polling_strategy.next_delay(delay)
+                    elapsed += delay
+                    await asyncio.sleep(delay / 1000)  # Convert to seconds
                 else:
                     # Any other error is emitted and polling stops
                     is_completed = True
@@ -409,10 +1288,55 @@ class RealityDefender(EventEmitter):
         polling_task = self.poll_for_results(request_id, polling_interval, timeout)
         self._run_async(polling_task)  # Discard the return value
 
+    def _discard_timing(self, request_id: str) -> None:
+        """Stop timing a request whose result did not come from processing it"""
+        if self.estimator is not None:
+            self.estimator.discard(request_id)
+
+    def _polling_strategy_for(
+        self, request_id: str, polling_strategy: Optional[PollingStrategy] = None
+    ) -> Optional[PollingStrategy]:
+        """
+        Get the polling strategy of a request
+
+        Args:
+            request_id: The request ID to poll for
+            polling_strategy: Strategy requested by the caller
+
+        Returns:
+            The requested strategy, else the estimator's for uploads it timed,
+            else the SDK's default; a MediaTypePolling is resolved to the
+            strategy of the uploaded media's type
+        """
+        if polling_strategy is None and self.estimator is not None:
+            polling_strategy = self.estimator.strategy_for(request_id)
+        if polling_strategy is None:
+            polling_strategy = self.polling_strategy
+        if isinstance(polling_strategy, MediaTypePolling):
+            return polling_strategy.for_media_type(self._media_types.get(request_id))
+        return polling_strategy
+
+    def _remember_media_type(self, request_id: str, filename: Optional[str]) -> None:
+        """
+        Remember the media type of an upload for MediaTypePolling
+
+        Args:
+            request_id: Request ID assigned to the upload
+            filename: Name or path of the uploaded media, if known
+        """
+        media_type = get_media_type(filename) if filename else None
+        if media_type is not None:
+            self._media_types.set(request_id, media_type)
+
     @classmethod
     def _run_async(cls, coro: Coroutine[Any, Any, T]) -> T:
         """
-        Run an async coroutine in a new event loop
+        Run an async coroutine on the SDK's background event loop
+
+        All synchronous calls share one long-lived loop running in a daemon
+        thread, so they cost a single hop to that thread, work from threads
+        that already run a loop, and keep reusing the HTTP sessions and their
+        pooled connections.
 
         Args:
             coro: Coroutine to run
@@ -424,25 +1348,7 @@ class RealityDefender(EventEmitter):
             RealityDefenderError: If the async operation fails
         """
         try:
-            # Get the current event loop, or create a new one if needed
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_closed():
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-            except RuntimeError:
-                # If there's no event loop in this thread, create one
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            if loop.is_running():
-                # If the loop is already running, use run_coroutine_threadsafe
-                # This will likely happen in a GUI application or web server
-                future = asyncio.run_coroutine_threadsafe(coro, loop)
-                return future.result()
-            else:
-                # If not running, we can use the loop directly
-                return loop.run_until_complete(coro)
+            return get_background_loop().run(coro)
         except Exception as e:
             # Convert any asyncio errors to our own error format
             if isinstance(e, RealityDefenderError):
@@ -457,9 +1363,25 @@ class RealityDefender(EventEmitter):
 
         This should be called when you're done using the SDK to ensure all resources
         are properly released.
+
+        Raises:
+            RealityDefenderError: If the estimator's observations cannot be
+                saved, after the HTTP sessions were closed
         """
-        if hasattr(self, "client") and self.client:
-            await self.client.close()
+        try:
+            scheduler: Optional[PollingScheduler] = getattr(
+                self, "polling_scheduler", None
+            )
+            if scheduler is not None:
+                await scheduler.close()
+            estimator: Optional[ProcessingTimeEstimator] = getattr(
+                self, "estimator", None
+            )
+            if estimator is not None:
+                await run_blocking(estimator.save)
+        finally:
+            if hasattr(self, "client") and self.client:
+                await self.client.close()
 
     def cleanup_sync(self) -> None:
         """
@@ -487,6 +1409,9 @@ class RealityDefender(EventEmitter):
                 if hasattr(self.client, "session") and self.client.session:
                     # Mark session for closing on GC - it's not perfect but better than nothing
                     self.client.session._closed = True
+                storage_session = getattr(self.client, "storage_session", None)
+                if storage_session:
+                    storage_session._closed = True
         except Exception:
             # Suppress any errors during cleanup
             pass
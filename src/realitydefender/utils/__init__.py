@@ -2,7 +2,56 @@
 Utility functions for the Reality Defender SDK
 """
 
-from .async_utils import sleep, with_timeout
-from .file_utils import get_file_info
+from .async_utils import (
+    get_io_executor,
+    run_blocking,
+    set_io_executor,
+    sleep,
+    with_timeout,
+)
+from .backoff import decorrelated_jitter, parse_retry_after
+from .byte_budget import (
+    ByteBudget,
+    ByteBudgetMetrics,
+    get_upload_byte_budget,
+    set_upload_byte_budget,
+)
+from .loop_thread import BackgroundLoop, get_background_loop
+from .singleflight import SingleFlight
+from .file_utils import (
+    get_file_info,
+    get_file_metadata,
+    get_media_type,
+    get_remaining_size,
+    hash_file,
+    mmap_file_chunks,
+    read_file_chunks,
+    read_file_range,
+    validate_media,
+)
 
-__all__ = ["sleep", "with_timeout", "get_file_info"]
+__all__ = [
+    "sleep",
+    "with_timeout",
+    "run_blocking",
+    "set_io_executor",
+    "get_io_executor",
+    "decorrelated_jitter",
+    "parse_retry_after",
+    "ByteBudget",
+    "ByteBudgetMetrics",
+    "set_upload_byte_budget",
+    "get_upload_byte_budget",
+    "SingleFlight",
+    "BackgroundLoop",
+    "get_background_loop",
+    "get_file_info",
+    "get_file_metadata",
+    "get_media_type",
+    "get_remaining_size",
+    "hash_file",
+    "mmap_file_chunks",
+    "read_file_chunks",
+    "read_file_range",
+    "validate_media",
+]
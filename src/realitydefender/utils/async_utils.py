@@ -3,10 +3,52 @@ Asynchronous utilities for the SDK
 """
 
 import asyncio
+import functools
+from concurrent.futures import Executor
 from typing import Any, Awaitable, Callable, Optional, TypeVar
 
 T = TypeVar("T")
 
+# Executor for blocking file I/O, None uses the event loop's default executor
+_io_executor: Optional[Executor] = None
+
+
+def set_io_executor(executor: Optional[Executor]) -> None:
+    """
+    Configure the executor that runs blocking file I/O for async operations
+
+    Args:
+        executor: Executor to use, e.g. a ThreadPoolExecutor sized for the
+            expected number of concurrent uploads, or None for the default
+    """
+    global _io_executor
+    _io_executor = executor
+
+
+def get_io_executor() -> Optional[Executor]:
+    """
+    Get the executor that runs blocking file I/O
+
+    Returns:
+        The configured executor, or None if the loop's default executor is used
+    """
+    return _io_executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a blocking function on the I/O executor without stalling the event loop
+
+    Args:
+        func: Function to call
+        *args: Positional arguments for func
+
+    Returns:
+        The return value of func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_executor, functools.partial(func, *args))
+
 
 async def sleep(ms: int) -> None:
     """
@@ -0,0 +1,55 @@
+"""
+Backoff delays for retries and polling
+"""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+def decorrelated_jitter(previous: int, base: int, cap: int) -> int:
+    """
+    Compute the next delay with decorrelated jitter
+
+    Each delay is drawn at random between the base delay and three times the
+    previous one, so that clients backing off at the same time spread out
+    instead of retrying in lockstep.
+
+    Args:
+        previous: Previous delay in milliseconds, base for the first one
+        base: Minimum delay in milliseconds
+        cap: Maximum delay in milliseconds
+
+    Returns:
+        The next delay in milliseconds
+    """
+    return int(min(cap, random.uniform(base, max(base, previous * 3))))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[int]:
+    """
+    Parse the value of a Retry-After header
+
+    Args:
+        value: Header value, either a number of seconds or an HTTP date
+
+    Returns:
+        Time to wait in milliseconds, or None if the value is missing or invalid
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return int(value) * 1000
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return max(0, int(delay * 1000))
@@ -0,0 +1,221 @@
+"""
+Process-wide budget for bytes held in memory by concurrent uploads
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Optional, Tuple, TypedDict
+
+from realitydefender.errors import RealityDefenderError
+
+
+class ByteBudgetMetrics(TypedDict):
+    """Snapshot of a byte budget's usage"""
+
+    capacity: int
+    """Maximum number of bytes that can be reserved at once"""
+
+    in_use: int
+    """Number of bytes currently reserved"""
+
+    waiting: int
+    """Number of reservations waiting for budget to free up"""
+
+    acquisitions: int
+    """Total number of reservations granted"""
+
+    total_wait_time: int
+    """Total time in milliseconds reservations spent waiting"""
+
+    max_wait_time: int
+    """Longest time in milliseconds a single reservation waited"""
+
+
+class ByteBudget:
+    """
+    Weighted semaphore that bounds the number of bytes in flight
+
+    Reservations are granted in FIFO order, so a large upload waiting for budget
+    is not starved by a stream of smaller ones. The budget can be shared by
+    event loops running in different threads.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the budget
+
+        Args:
+            capacity: Maximum number of bytes that can be reserved at once
+        """
+        if capacity < 1:
+            raise RealityDefenderError("capacity must be at least 1", "invalid_request")
+        self.capacity = capacity
+        self._in_use = 0
+        self._waiters: Deque[
+            Tuple[int, asyncio.AbstractEventLoop, "asyncio.Future[None]"]
+        ] = deque()
+        self._lock = threading.Lock()
+        self._acquisitions = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def acquire(self, amount: int) -> int:
+        """
+        Reserve bytes, waiting until enough budget is available
+
+        Reservations larger than the capacity are clamped to it so that they
+        run alone instead of waiting forever.
+
+        Args:
+            amount: Number of bytes to reserve
+
+        Returns:
+            The number of bytes actually reserved, to pass to release()
+        """
+        amount = max(0, min(amount, self.capacity))
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+
+        with self._lock:
+            if not self._waiters and self._in_use + amount <= self.capacity:
+                self._in_use += amount
+                self._record(0.0)
+                return amount
+            future: "asyncio.Future[None]" = loop.create_future()
+            waiter = (amount, loop, future)
+            self._waiters.append(waiter)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    # Waiters queued behind a large one may fit now
+                    self._wake_waiters()
+                    granted = False
+                else:
+                    granted = True
+            if granted:
+                # The budget was handed over just before the cancellation
+                self.release(amount)
+            raise
+
+        with self._lock:
+            self._record(time.monotonic() - started)
+        return amount
+
+    def release(self, amount: int) -> None:
+        """
+        Return reserved bytes to the budget
+
+        Args:
+            amount: Number of bytes returned by acquire()
+        """
+        with self._lock:
+            self._in_use -= amount
+            self._wake_waiters()
+
+    @asynccontextmanager
+    async def reserve(self, amount: int) -> AsyncIterator[int]:
+        """
+        Reserve bytes for the duration of a block
+
+        Args:
+            amount: Number of bytes to reserve
+
+        Yields:
+            The number of bytes reserved
+        """
+        granted = await self.acquire(amount)
+        try:
+            yield granted
+        finally:
+            self.release(granted)
+
+    def metrics(self) -> ByteBudgetMetrics:
+        """
+        Get a snapshot of the budget's usage
+
+        Returns:
+            Current usage and wait time statistics
+        """
+        with self._lock:
+            return {
+                "capacity": self.capacity,
+                "in_use": self._in_use,
+                "waiting": len(self._waiters),
+                "acquisitions": self._acquisitions,
+                "total_wait_time": int(self._total_wait * 1000),
+                "max_wait_time": int(self._max_wait * 1000),
+            }
+
+    def _wake_waiters(self) -> None:
+        """Grant budget to the waiters at the head of the queue, with the lock held"""
+        while self._waiters:
+            waiting_amount, loop, future = self._waiters[0]
+            if self._in_use + waiting_amount > self.capacity:
+                break
+            self._waiters.popleft()
+            self._in_use += waiting_amount
+            loop.call_soon_threadsafe(_wake, future)
+
+    def _record(self, waited: float) -> None:
+        self._acquisitions += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+
+
+def _wake(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+# Budget shared by all uploads in the process, None means unlimited
+_upload_budget: Optional[ByteBudget] = None
+
+
+def set_upload_byte_budget(max_bytes: Optional[int]) -> Optional[ByteBudget]:
+    """
+    Limit the number of bytes all uploads in the process may hold at once
+
+    Args:
+        max_bytes: Maximum number of in-flight upload bytes, None for no limit
+
+    Returns:
+        The installed budget, whose metrics() expose usage and wait time
+    """
+    global _upload_budget
+    _upload_budget = ByteBudget(max_bytes) if max_bytes is not None else None
+    return _upload_budget
+
+
+def get_upload_byte_budget() -> Optional[ByteBudget]:
+    """
+    Get the process-wide upload byte budget
+
+    Returns:
+        The installed budget, or None if uploads are not limited
+    """
+    return _upload_budget
+
+
+@asynccontextmanager
+async def reserve_upload_bytes(amount: int) -> AsyncIterator[None]:
+    """
+    Hold part of the process-wide upload budget for the duration of a block
+
+    Does nothing when no budget is configured.
+
+    Args:
+        amount: Number of bytes the upload keeps in memory
+    """
+    budget = _upload_budget
+    if budget is None:
+        yield
+        return
+    async with budget.reserve(amount):
+        yield
@@ -2,26 +2,148 @@
 File utilities for the SDK
 """
 
+import hashlib
 import mimetypes
+import mmap
 import os
-from typing import Tuple
+from typing import BinaryIO, Iterator, Optional, Tuple
 
 from realitydefender.core.constants import SUPPORTED_FILE_TYPES
 from realitydefender.errors import RealityDefenderError
 
 
-def get_file_info(file_path: str) -> Tuple[str, bytes, str]:
+def get_size_limit(extension: str) -> int:
     """
-    Get file information needed for upload
+    Get the maximum upload size for a file extension
+
+    Args:
+        extension: Lower-case file extension including the dot, e.g. ".mp4"
+
+    Returns:
+        Size limit in bytes, or 0 if the extension is not supported
+    """
+    return next(
+        (
+            x.get("size_limit", 0)
+            for x in SUPPORTED_FILE_TYPES
+            if extension in x.get("extensions", [])
+        ),
+        0,
+    )
+
+
+def get_media_type(filename: str) -> Optional[str]:
+    """
+    Get the type of media a file holds from its extension
+
+    Args:
+        filename: Name or path of the file, including its extension
+
+    Returns:
+        "video", "image", "audio" or "text", or None if the extension is not
+        supported
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    return next(
+        (
+            x.get("media_type")
+            for x in SUPPORTED_FILE_TYPES
+            if extension in x.get("extensions", [])
+        ),
+        None,
+    )
+
+
+def get_remaining_size(fileobj: BinaryIO) -> Optional[int]:
+    """
+    Measure the content left in a file object without reading it
+
+    Args:
+        fileobj: Binary file-like object
+
+    Returns:
+        Number of bytes from the current position to the end, or None if the
+        object is not seekable
+    """
+    try:
+        position = fileobj.tell()
+        size = fileobj.seek(0, os.SEEK_END) - position
+        fileobj.seek(position)
+        return size
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def validate_media(
+    size: int, filename: Optional[str] = None, content_type: Optional[str] = None
+) -> Tuple[str, str]:
+    """
+    Validate media that is not read from disk
+
+    The media type is taken from the filename extension, or inferred from the
+    content type when no filename is given.
+
+    Args:
+        size: Size of the content in bytes
+        filename: Name of the media, including its extension
+        content_type: MIME type of the media
+
+    Returns:
+        Tuple of (filename, content_type) to upload the media with
+
+    Raises:
+        RealityDefenderError: If the type is unsupported or the media is too large
+    """
+    if not filename:
+        if not content_type:
+            raise RealityDefenderError(
+                "filename or content_type is required for upload", "invalid_file"
+            )
+        extension = next(
+            (
+                x
+                for x in mimetypes.guess_all_extensions(content_type)
+                if get_size_limit(x) > 0
+            ),
+            "",
+        )
+        if not extension:
+            raise RealityDefenderError(
+                f"Unsupported content type: {content_type}", "invalid_file"
+            )
+        filename = f"upload{extension}"
+
+    extension = os.path.splitext(filename)[1].lower()
+    size_limit = get_size_limit(extension)
+
+    if size_limit == 0:
+        raise RealityDefenderError(
+            f"Unsupported file type: {extension}", "invalid_file"
+        )
+    if size > size_limit:
+        raise RealityDefenderError(
+            f"File too large to upload: {filename}", "file_too_large"
+        )
+
+    if not content_type:
+        # Default to binary if we can't determine the type
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+    return filename, content_type
+
+
+def get_file_metadata(file_path: str) -> Tuple[str, int, str]:
+    """
+    Validate a file for upload without reading its content
 
     Args:
         file_path: Path to the file
 
     Returns:
-        Tuple of (filename, file_content, mime_type)
+        Tuple of (filename, file_size, mime_type)
 
     Raises:
-        RealityDefenderError: If file not found or cannot be read
+        RealityDefenderError: If file not found, unsupported or too large
     """
     if not os.path.isfile(file_path):
         raise RealityDefenderError(f"File not found: {file_path}", "invalid_file")
@@ -31,14 +153,7 @@ def get_file_info(file_path: str) -> Tuple[str, bytes, str]:
 
         file_size = os.path.getsize(file_path)
         file_extension: str = os.path.splitext(filename)[1].lower()
-        file_extension_size_limit: int = next(
-            (
-                x.get("size_limit", 0)
-                for x in SUPPORTED_FILE_TYPES
-                if file_extension in x.get("extensions", [])
-            ),
-            0,
-        )
+        file_extension_size_limit = get_size_limit(file_extension)
 
         if file_extension_size_limit == 0:
             raise RealityDefenderError(
@@ -55,12 +170,154 @@ def get_file_info(file_path: str) -> Tuple[str, bytes, str]:
             # Default to binary if we can't determine the type
             content_type = "application/octet-stream"
 
+        return filename, file_size, content_type
+    except RealityDefenderError:
+        raise
+    except Exception as e:
+        raise RealityDefenderError(f"Error reading file: {str(e)}", "invalid_file")
+
+
+def get_file_info(file_path: str) -> Tuple[str, bytes, str]:
+    """
+    Get file information needed for upload
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Tuple of (filename, file_content, mime_type)
+
+    Raises:
+        RealityDefenderError: If file not found or cannot be read
+    """
+    filename, _, content_type = get_file_metadata(file_path)
+
+    try:
         # Read file content
         with open(file_path, "rb") as f:
             content = f.read()
 
         return filename, content, content_type
-    except RealityDefenderError:
-        raise
     except Exception as e:
         raise RealityDefenderError(f"Error reading file: {str(e)}", "invalid_file")
+
+
+def read_file_chunks(file_path: str, chunk_size: int) -> Iterator[bytes]:
+    """
+    Read a file sequentially in fixed-size chunks
+
+    Only one chunk is held in memory at a time, so memory use is bounded by
+    chunk_size rather than by the size of the file.
+
+    Args:
+        file_path: Path to the file
+        chunk_size: Maximum number of bytes per chunk
+
+    Yields:
+        Consecutive chunks of the file content
+
+    Raises:
+        RealityDefenderError: If the file cannot be read
+    """
+    if chunk_size <= 0:
+        raise RealityDefenderError("chunk_size must be positive", "invalid_request")
+
+    try:
+        with open(file_path, "rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+    except OSError as e:
+        raise RealityDefenderError(f"Error reading file: {str(e)}", "invalid_file")
+
+
+def read_file_range(file_path: str, offset: int, length: int) -> bytes:
+    """
+    Read a byte range of a file
+
+    Args:
+        file_path: Path to the file
+        offset: Position of the first byte to read
+        length: Number of bytes to read
+
+    Returns:
+        The requested bytes, shorter than length only at the end of the file
+
+    Raises:
+        RealityDefenderError: If the file cannot be read
+    """
+    try:
+        with open(file_path, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+    except OSError as e:
+        raise RealityDefenderError(f"Error reading file: {str(e)}", "invalid_file")
+
+
+def hash_file(file_path: str, chunk_size: int = 1048576) -> str:
+    """
+    Compute the SHA-256 digest of a file in a single streaming pass
+
+    Args:
+        file_path: Path to the file
+        chunk_size: Number of bytes hashed at a time
+
+    Returns:
+        Hex-encoded SHA-256 digest of the file content
+
+    Raises:
+        RealityDefenderError: If the file cannot be read
+    """
+    digest = hashlib.sha256()
+    for chunk in read_file_chunks(file_path, chunk_size):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def mmap_file_chunks(file_path: str, chunk_size: int) -> Iterator[memoryview]:
+    """
+    Yield zero-copy views over a memory-mapped file
+
+    The file is mapped read-only and each chunk is a memoryview slice of the
+    mapping, so the content is served from the page cache without being copied
+    into Python bytes objects.
+
+    Args:
+        file_path: Path to the file
+        chunk_size: Maximum number of bytes per chunk
+
+    Yields:
+        Consecutive memoryview slices of the file content
+
+    Raises:
+        RealityDefenderError: If the file cannot be mapped
+    """
+    if chunk_size <= 0:
+        raise RealityDefenderError("chunk_size must be positive", "invalid_request")
+
+    try:
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty files cannot be mapped
+                return
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        raise RealityDefenderError(f"Error reading file: {str(e)}", "invalid_file")
+
+    if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+    view = memoryview(mapped)
+    try:
+        for offset in range(0, len(view), chunk_size):
+            yield view[offset : offset + chunk_size]
+    finally:
+        view.release()
+        try:
+            mapped.close()
+        except BufferError:
+            # The transport may still reference a slice; the mapping is released
+            # once the last view is garbage collected
+            pass
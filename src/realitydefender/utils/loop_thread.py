@@ -0,0 +1,124 @@
+"""
+Event loop running in a background thread, backing the synchronous API
+"""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+from realitydefender.errors import RealityDefenderError
+
+T = TypeVar("T")
+
+
+class BackgroundLoop:
+    """
+    A long-lived event loop running in a daemon thread
+
+    Coroutines submitted from other threads run on this loop, and the calling
+    thread blocks until they finish. Since every call runs on the same loop,
+    the HTTP sessions, connection pools and locks the SDK creates on first use
+    keep working across calls, instead of being bound to a loop that no longer
+    runs.
+    """
+
+    def __init__(self, name: str = "realitydefender-loop") -> None:
+        """
+        Initialize the loop, started on first use
+
+        Args:
+            name: Name of the thread running the loop
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """
+        Start the loop's thread unless it is running
+
+        Returns:
+            The running loop
+        """
+        with self._lock:
+            if self._loop is not None and self._loop.is_running():
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                loop.run_forever()
+
+            thread = threading.Thread(target=run, name=self.name, daemon=True)
+            thread.start()
+            started.wait()
+            self._loop = loop
+            self._thread = thread
+            return loop
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the loop and wait for its result
+
+        Args:
+            coro: Coroutine to run
+            timeout: Maximum time to wait in seconds, None to wait until done
+
+        Returns:
+            The result of the coroutine
+
+        Raises:
+            RealityDefenderError: If called from the loop's own thread, which
+                would wait on itself forever
+            Exception: Whatever the coroutine raised
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RealityDefenderError(
+                "Synchronous methods cannot be called from the SDK's event loop, "
+                "use the async methods instead",
+                "invalid_request",
+            )
+
+        future = asyncio.run_coroutine_threadsafe(coro, self.start())
+        try:
+            return future.result(timeout)
+        except BaseException:
+            # Interrupted or timed out callers do not leave the coroutine running
+            future.cancel()
+            raise
+
+    def stop(self) -> None:
+        """Stop the loop and wait for its thread to finish"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not threading.current_thread():
+            thread.join()
+            loop.close()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the loop's thread is running"""
+        return self._loop is not None and self._loop.is_running()
+
+
+_background_loop = BackgroundLoop()
+
+
+def get_background_loop() -> BackgroundLoop:
+    """
+    Get the background loop shared by the synchronous API
+
+    Returns:
+        The process-wide background loop
+    """
+    return _background_loop
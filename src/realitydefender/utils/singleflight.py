@@ -0,0 +1,76 @@
+"""
+Coalescing of identical concurrent operations
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Runs at most one operation per key at a time, sharing its outcome
+
+    A caller asking for a key whose operation is already running waits for that
+    operation instead of starting its own, and receives the same result or
+    exception. Once the operation finishes, the next call for the key starts a
+    new one. A waiter that is cancelled does not cancel the shared operation
+    while others still wait for it.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Future[T]"] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self.started = 0
+        """Number of operations started"""
+        self.coalesced = 0
+        """Number of calls that joined an operation already running"""
+
+    async def do(self, key: Hashable, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run an operation, or join the one already running for the same key
+
+        Args:
+            key: Identity of the operation
+            operation: Starts the operation when no call for key is running
+
+        Returns:
+            The result of the shared operation
+
+        Raises:
+            Exception: Whatever the shared operation raised
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(operation())
+            self._calls[key] = call
+            self._waiters[key] = 0
+            self.started += 1
+            call.add_done_callback(lambda _: self._forget(key, call))
+        else:
+            self.coalesced += 1
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(call)
+        except asyncio.CancelledError:
+            # Cancel the operation once nobody is left waiting for it
+            if key in self._waiters and self._waiters[key] == 1 and not call.done():
+                call.cancel()
+            raise
+        finally:
+            if key in self._waiters:
+                self._waiters[key] -= 1
+
+    def in_flight(self) -> int:
+        """Number of operations currently running"""
+        return len(self._calls)
+
+    def _forget(self, key: Hashable, call: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+            del self._waiters[key]
+        if not call.cancelled():
+            # Mark the exception as retrieved when no waiter is left to see it
+            call.exception()
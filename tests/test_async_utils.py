@@ -0,0 +1,74 @@
+"""
+Tests for the asynchronous utilities
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generator
+
+import pytest
+
+from realitydefender.utils.async_utils import (
+    get_io_executor,
+    run_blocking,
+    set_io_executor,
+    with_timeout,
+)
+
+
+@pytest.fixture
+def io_executor() -> Generator[ThreadPoolExecutor, None, None]:
+    """Install a dedicated I/O executor for the duration of a test"""
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rd-io")
+    set_io_executor(executor)
+    yield executor
+    set_io_executor(None)
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_blocking_uses_configured_executor(
+    io_executor: ThreadPoolExecutor,
+) -> None:
+    """Test blocking calls run on the configured executor threads"""
+    assert get_io_executor() is io_executor
+
+    thread_name = await run_blocking(lambda: threading.current_thread().name)
+
+    assert thread_name.startswith("rd-io")
+
+
+@pytest.mark.asyncio
+async def test_run_blocking_does_not_stall_loop() -> None:
+    """Test other coroutines keep running while a blocking call is in progress"""
+    ticks = 0
+    release = threading.Event()
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while not release.is_set():
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    ticker_task = asyncio.ensure_future(ticker())
+    await run_blocking(release.wait, 0.05)
+    release.set()
+    await ticker_task
+
+    assert ticks > 5
+
+
+@pytest.mark.asyncio
+async def test_with_timeout() -> None:
+    """Test a timed out coroutine returns None and runs the callback"""
+    timed_out = []
+
+    result = await with_timeout(
+        asyncio.sleep(1, result="late"),
+        10,
+        timeout_callback=lambda: timed_out.append(True),
+    )
+
+    assert result is None
+    assert timed_out == [True]
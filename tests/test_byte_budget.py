@@ -0,0 +1,237 @@
+"""
+Tests for the upload byte budget
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+from typing import Any, Generator, List
+from unittest.mock import patch
+
+import pytest
+
+from realitydefender.client.http_client import create_http_client
+from realitydefender.detection.multipart import upload_multipart
+from realitydefender.detection.upload import upload_to_signed_url
+from realitydefender.errors import RealityDefenderError
+from realitydefender.utils.byte_budget import (
+    ByteBudget,
+    get_upload_byte_budget,
+    set_upload_byte_budget,
+)
+from tests.test_multipart import PART_SIZE, LocalMultipartBackend
+
+
+@pytest.fixture(autouse=True)
+def reset_budget() -> Generator[None, Any, None]:
+    """Remove the process-wide budget after each test"""
+    yield
+    set_upload_byte_budget(None)
+
+
+def test_budget_requires_capacity() -> None:
+    """Test a budget must allow at least one byte"""
+    with pytest.raises(RealityDefenderError) as exc_info:
+        ByteBudget(0)
+    assert exc_info.value.code == "invalid_request"
+
+
+def test_set_upload_byte_budget() -> None:
+    """Test installing and removing the process-wide budget"""
+    assert get_upload_byte_budget() is None
+
+    budget = set_upload_byte_budget(1024)
+
+    assert budget is not None
+    assert get_upload_byte_budget() is budget
+    assert budget.capacity == 1024
+    assert set_upload_byte_budget(None) is None
+    assert get_upload_byte_budget() is None
+
+
+@pytest.mark.asyncio
+async def test_budget_waits_for_release() -> None:
+    """Test reservations wait until enough bytes are released"""
+    budget = ByteBudget(100)
+    assert await budget.acquire(60) == 60
+
+    waiter = asyncio.ensure_future(budget.acquire(60))
+    await asyncio.sleep(0.02)
+    assert not waiter.done()
+    assert budget.metrics()["waiting"] == 1
+
+    budget.release(60)
+    assert await waiter == 60
+
+    metrics = budget.metrics()
+    assert metrics["in_use"] == 60
+    assert metrics["waiting"] == 0
+    assert metrics["acquisitions"] == 2
+    assert metrics["max_wait_time"] >= 10
+    assert metrics["total_wait_time"] == metrics["max_wait_time"]
+
+
+@pytest.mark.asyncio
+async def test_budget_is_first_in_first_out() -> None:
+    """Test a large reservation is not overtaken by smaller ones"""
+    budget = ByteBudget(100)
+    order: List[str] = []
+    await budget.acquire(50)
+
+    async def reserve(name: str, amount: int) -> None:
+        async with budget.reserve(amount):
+            order.append(name)
+
+    large = asyncio.ensure_future(reserve("large", 100))
+    await asyncio.sleep(0)
+    small = asyncio.ensure_future(reserve("small", 10))
+    await asyncio.sleep(0.01)
+    assert order == []
+
+    budget.release(50)
+    await asyncio.gather(large, small)
+
+    assert order == ["large", "small"]
+    assert budget.metrics()["in_use"] == 0
+
+
+@pytest.mark.asyncio
+async def test_budget_clamps_oversized_reservations() -> None:
+    """Test a reservation above the capacity runs alone instead of deadlocking"""
+    budget = ByteBudget(100)
+
+    async with budget.reserve(1000) as granted:
+        assert granted == 100
+        assert budget.metrics()["in_use"] == 100
+
+    assert budget.metrics()["in_use"] == 0
+
+
+@pytest.mark.asyncio
+async def test_budget_cancelled_waiter_gives_up_its_place() -> None:
+    """Test cancelling a waiting reservation does not leak budget"""
+    budget = ByteBudget(100)
+    await budget.acquire(100)
+
+    waiter = asyncio.ensure_future(budget.acquire(50))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    budget.release(100)
+    metrics = budget.metrics()
+    assert metrics["in_use"] == 0
+    assert metrics["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_budget_cancelled_head_wakes_waiters_behind_it() -> None:
+    """Test smaller waiters that fit are granted once a large head waiter leaves"""
+    budget = ByteBudget(10)
+    await budget.acquire(8)
+
+    large = asyncio.ensure_future(budget.acquire(10))
+    small = asyncio.ensure_future(budget.acquire(2))
+    await asyncio.sleep(0)
+    assert budget.metrics()["waiting"] == 2
+
+    large.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await large
+
+    assert await asyncio.wait_for(small, 1) == 2
+    metrics = budget.metrics()
+    assert metrics["in_use"] == 10
+    assert metrics["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_budget_is_shared_across_event_loops() -> None:
+    """Test a release on one loop wakes a waiter on another thread's loop"""
+    budget = ByteBudget(100)
+    await budget.acquire(100)
+    acquired = threading.Event()
+
+    def other_thread() -> None:
+        asyncio.run(budget.acquire(100))
+        acquired.set()
+
+    thread = threading.Thread(target=other_thread)
+    thread.start()
+    await asyncio.sleep(0.02)
+    assert not acquired.is_set()
+
+    budget.release(100)
+    thread.join(timeout=5)
+
+    assert acquired.is_set()
+    assert budget.metrics()["in_use"] == 100
+
+
+@pytest.mark.asyncio
+async def test_multipart_upload_respects_budget() -> None:
+    """Test parts wait for the process-wide budget despite higher concurrency"""
+    with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
+        f.write(os.urandom(PART_SIZE * 3))
+        temp_path = f.name
+
+    try:
+        budget = set_upload_byte_budget(PART_SIZE)
+        assert budget is not None
+        backend = LocalMultipartBackend(delay=0.01)
+
+        await upload_multipart(
+            backend,
+            "https://signed-url.com",
+            temp_path,
+            part_size=PART_SIZE,
+            concurrency=3,
+        )
+
+        with open(temp_path, "rb") as f:
+            assert backend.objects["https://signed-url.com"] == f.read()
+    finally:
+        os.unlink(temp_path)
+
+    assert backend.max_in_flight == 1
+    metrics = budget.metrics()
+    assert metrics["acquisitions"] == 3
+    assert metrics["in_use"] == 0
+    assert metrics["total_wait_time"] > 0
+
+
+@pytest.mark.asyncio
+async def test_buffered_upload_reserves_file_size() -> None:
+    """Test a buffered upload holds its whole size while it is sent"""
+    with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
+        f.write(b"x" * 1000)
+        temp_path = f.name
+
+    budget = set_upload_byte_budget(10000)
+    assert budget is not None
+    in_use: List[int] = []
+
+    async def put(*args: Any, **kwargs: Any) -> None:
+        in_use.append(budget.metrics()["in_use"])
+
+    try:
+        with patch("realitydefender.detection.upload.put_to_signed_url", put):
+            await upload_to_signed_url(
+                create_http_client({"api_key": "test-api-key"}),
+                "https://signed-url.com",
+                temp_path,
+            )
+            await upload_to_signed_url(
+                create_http_client({"api_key": "test-api-key"}),
+                "https://signed-url.com",
+                temp_path,
+                stream=True,
+                chunk_size=100,
+            )
+    finally:
+        os.unlink(temp_path)
+
+    assert in_use == [1000, 100]
+    assert budget.metrics()["in_use"] == 0
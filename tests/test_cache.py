@@ -0,0 +1,310 @@
+"""
+Tests for cache backends and the upload deduplication cache
+"""
+
+import os
+import tempfile
+import time
+from typing import Any, Dict, Generator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from realitydefender import RealityDefender
+from realitydefender.cache import MemoryCache, ResultCache, SQLiteCache, UploadCache
+from realitydefender.errors import RealityDefenderError
+from realitydefender.model import DetectionResult
+
+
+@pytest.fixture
+def sqlite_path() -> Generator[str, Any, None]:
+    """Create a path for a temporary SQLite database"""
+    with tempfile.TemporaryDirectory() as directory:
+        yield os.path.join(directory, "cache.db")
+
+
+@pytest.fixture
+def media_file() -> Generator[str, Any, None]:
+    """Create an image file to upload"""
+    with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
+        f.write(b"same viral clip")
+        temp_path = f.name
+
+    yield temp_path
+
+    if os.path.exists(temp_path):
+        os.unlink(temp_path)
+
+
+def test_memory_cache_lru_eviction() -> None:
+    """Test the least recently used entry is evicted first"""
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_memory_cache_ttl() -> None:
+    """Test entries expire after their time to live"""
+    cache = MemoryCache(ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=60000)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_sqlite_cache_persists_and_evicts(sqlite_path: str) -> None:
+    """Test values survive reopening and the size bound is enforced"""
+    cache = SQLiteCache(sqlite_path, max_entries=2)
+    cache.set("a", {"request_id": "1"})
+    cache.set("b", {"request_id": "2"})
+    time.sleep(0.01)
+    assert cache.get("a") == {"request_id": "1"}
+    cache.set("c", {"request_id": "3"})
+    cache.close()
+
+    reopened = SQLiteCache(sqlite_path, max_entries=2)
+    assert reopened.get("a") == {"request_id": "1"}
+    assert reopened.get("b") is None
+    assert reopened.get("c") == {"request_id": "3"}
+    assert len(reopened) == 2
+
+    reopened.set("d", 4, ttl=1)
+    time.sleep(0.01)
+    assert reopened.get("d") is None
+    reopened.close()
+
+
+def test_upload_cache_only_stores_final_results() -> None:
+    """Test results are attached to cached uploads once they are final"""
+    cache = UploadCache()
+    cache.put_upload("digest", {"request_id": "req", "media_id": "media"})
+
+    cache.put_result(
+        {"request_id": "req", "status": "ANALYZING", "score": None, "models": []}
+    )
+    assert cache.get_result("req") is None
+
+    cache.put_result(
+        {"request_id": "other", "status": "AUTHENTIC", "score": 0.1, "models": []}
+    )
+    assert cache.get_result("other") is None
+
+    final = {"request_id": "req", "status": "AUTHENTIC", "score": 0.1, "models": []}
+    cache.put_result(final)  # type: ignore[arg-type]
+    assert cache.get_result("req") == final
+    assert cache.get_upload("digest") == {"request_id": "req", "media_id": "media"}
+
+
+@pytest.mark.asyncio
+async def test_sdk_skips_network_for_duplicate_media(
+    media_file: str, sqlite_path: str
+) -> None:
+    """Test identical files are uploaded and analyzed only once"""
+    mock_client = AsyncMock()
+    mock_client.post.return_value = {
+        "requestId": "test-request-id",
+        "mediaId": "test-media-id",
+        "response": {"signedUrl": "https://signed-url.com"},
+    }
+    mock_client.get.return_value = {
+        "requestId": "test-request-id",
+        "resultsSummary": {"status": "FAKE", "metadata": {"finalScore": 90}},
+        "models": [],
+    }
+
+    with patch(
+        "realitydefender.reality_defender.create_http_client",
+        return_value=mock_client,
+    ):
+        sdk = RealityDefender(
+            api_key="test-api-key",
+            upload_cache=UploadCache(SQLiteCache(sqlite_path)),
+        )
+
+    with patch("realitydefender.detection.upload.upload_to_signed_url") as put:
+        first = await sdk.upload(file_path=media_file)
+        first_result = await sdk.get_result(first["request_id"])
+
+        # A copy of the same content under another name
+        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
+            f.write(b"same viral clip")
+            copy_path = f.name
+        try:
+            second = await sdk.upload(file_path=copy_path)
+        finally:
+            os.unlink(copy_path)
+        second_result = await sdk.get_result(second["request_id"])
+
+    assert second == first
+    assert second_result == first_result
+    assert first_result["status"] == "MANIPULATED"
+    assert mock_client.post.call_count == 1
+    assert mock_client.get.call_count == 1
+    assert put.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_sdk_validates_media_before_hashing(sqlite_path: str) -> None:
+    """Test unsupported files are rejected without reading their content"""
+    with patch(
+        "realitydefender.reality_defender.create_http_client",
+        return_value=AsyncMock(),
+    ):
+        sdk = RealityDefender(
+            api_key="test-api-key",
+            upload_cache=UploadCache(SQLiteCache(sqlite_path)),
+        )
+    with tempfile.NamedTemporaryFile(suffix=".exe", delete=False) as f:
+        f.write(b"not media")
+        path = f.name
+
+    try:
+        with patch.object(UploadCache, "digest") as digest:
+            with pytest.raises(RealityDefenderError) as exc_info:
+                await sdk.upload(file_path=path)
+    finally:
+        os.unlink(path)
+
+    assert exc_info.value.code == "invalid_file"
+    digest.assert_not_called()
+
+
+def test_result_cache_counts_and_invalidates() -> None:
+    """Test only final results are cached, with hit and miss counters"""
+    cache = ResultCache(max_entries=2)
+    final: DetectionResult = {
+        "request_id": "a",
+        "status": "AUTHENTIC",
+        "score": 0.1,
+        "models": [],
+    }
+    pending: DetectionResult = {
+        "request_id": "b",
+        "status": "ANALYZING",
+        "score": None,
+        "models": [],
+    }
+
+    cache.put(final)
+    cache.put(pending)
+
+    assert cache.get("a") == final
+    assert cache.get("b") is None
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "not_found_hits": 0, "size": 0}
+
+    for request_id in ("x", "y", "z"):
+        cache.put({**final, "request_id": request_id})
+    assert cache.get("x") is None
+    cache.invalidate()
+    assert cache.stats()["size"] == 0
+
+
+def test_result_cache_hands_out_copies() -> None:
+    """Test callers modifying a cached result do not change it for others"""
+    cache = ResultCache()
+    result: DetectionResult = {
+        "request_id": "a",
+        "status": "MANIPULATED",
+        "score": 0.9,
+        "models": [{"name": "model", "status": "MANIPULATED", "score": 0.9}],
+    }
+    cache.put(result)
+    result["models"].clear()
+
+    first = cache.get("a")
+    assert first is not None
+    first["score"] = None
+    first["models"][0]["score"] = None
+    first["models"].append({"name": "other", "status": "AUTHENTIC", "score": 0.1})
+
+    second = cache.get("a")
+    assert second is not None
+    assert second["score"] == 0.9
+    assert second["models"] == [
+        {"name": "model", "status": "MANIPULATED", "score": 0.9}
+    ]
+
+
+def test_result_cache_not_found_expires() -> None:
+    """Test not found answers are cached for a short time only"""
+    cache = ResultCache(not_found_ttl=50)
+    cache.put_not_found("missing")
+
+    with pytest.raises(RealityDefenderError) as exc_info:
+        cache.get("missing")
+    assert exc_info.value.code == "not_found"
+
+    time.sleep(0.06)
+    assert cache.get("missing") is None
+    assert cache.stats()["not_found_hits"] == 1
+
+    ResultCache(not_found_ttl=None).put_not_found("missing")
+
+
+@pytest.mark.asyncio
+async def test_sdk_caches_final_results_and_not_found() -> None:
+    """Test repeated lookups of hot request IDs do not reach the API"""
+
+    async def get(path: str) -> Dict[str, Any]:
+        if not path.endswith("/done"):
+            raise RealityDefenderError("Not found", "not_found")
+        return {
+            "requestId": "done",
+            "resultsSummary": {"status": "FAKE", "metadata": {"finalScore": 90}},
+            "models": [],
+        }
+
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(side_effect=get)
+    with patch(
+        "realitydefender.reality_defender.create_http_client", return_value=mock_client
+    ):
+        sdk = RealityDefender(api_key="test-api-key", result_cache=ResultCache())
+
+    for _ in range(5):
+        assert (await sdk.get_result("done"))["status"] == "MANIPULATED"
+    for _ in range(5):
+        with pytest.raises(RealityDefenderError):
+            await sdk.get_result("unknown", max_attempts=1)
+
+    assert mock_client.get.call_count == 2
+    assert sdk.result_cache is not None
+    assert sdk.result_cache.stats()["hits"] == 4
+    assert sdk.result_cache.stats()["not_found_hits"] == 4
+
+
+@pytest.mark.asyncio
+async def test_cached_not_found_does_not_cut_polling_short() -> None:
+    """Test a not found cached by a single poll is ignored by a longer polling"""
+    done = {
+        "requestId": "fresh",
+        "resultsSummary": {"status": "AUTHENTIC", "metadata": {"finalScore": 5}},
+        "models": [],
+    }
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(
+        side_effect=[RealityDefenderError("Not found", "not_found"), done]
+    )
+    with patch(
+        "realitydefender.reality_defender.create_http_client", return_value=mock_client
+    ):
+        sdk = RealityDefender(api_key="test-api-key", result_cache=ResultCache())
+
+    with pytest.raises(RealityDefenderError):
+        await sdk.get_result("fresh", max_attempts=1)
+    result = await sdk.get_result("fresh", max_attempts=3, polling_interval=0)
+
+    assert result["status"] == "AUTHENTIC"
+    assert mock_client.get.call_count == 2
@@ -0,0 +1,195 @@
+"""
+Tests for the circuit breaker
+"""
+
+import time
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from realitydefender.client.circuit_breaker import CircuitBreaker
+from realitydefender.client.http_client import HttpClient, create_http_client
+from realitydefender.detection.results import get_detection_result
+from realitydefender.errors import RealityDefenderError
+from tests.test_retry import make_response
+
+
+@pytest.fixture
+def http_client() -> HttpClient:
+    """Create a client whose circuits open after two failed requests"""
+    return create_http_client(
+        {
+            "api_key": "test-api-key",
+            "retry": {"default": {"max_attempts": 1}, "result": {"max_attempts": 1}},
+            "circuit_breaker": {"failure_threshold": 2, "reset_timeout": 20},
+        }
+    )
+
+
+def test_circuit_opens_after_consecutive_failures() -> None:
+    """Test the circuit opens on the threshold and a success resets the count"""
+    breaker = CircuitBreaker("result", {"failure_threshold": 2})
+    breaker.on_failure()
+    breaker.on_success()
+    breaker.on_failure()
+    assert breaker.state == "closed"
+
+    breaker.on_failure()
+    assert breaker.state == "open"
+    with pytest.raises(RealityDefenderError) as exc_info:
+        breaker.before_call()
+    assert exc_info.value.code == "circuit_open"
+
+
+def test_half_open_limits_probes() -> None:
+    """Test only a limited number of probes run once the reset timeout passed"""
+    breaker = CircuitBreaker(
+        "result",
+        {"failure_threshold": 1, "reset_timeout": 10, "half_open_max_calls": 1},
+    )
+    breaker.on_failure()
+    time.sleep(0.02)
+
+    assert breaker.state == "half_open"
+    breaker.before_call()
+    with pytest.raises(RealityDefenderError):
+        breaker.before_call()
+
+    # A failed probe opens the circuit again
+    breaker.on_failure()
+    assert breaker.state == "open"
+
+    time.sleep(0.02)
+    breaker.before_call()
+    breaker.on_success()
+    assert breaker.state == "closed"
+    breaker.before_call()
+
+
+def test_cancelled_probe_frees_its_slot() -> None:
+    """Test an abandoned probe lets another one through"""
+    breaker = CircuitBreaker("result", {"failure_threshold": 1, "reset_timeout": 0})
+    breaker.on_failure()
+
+    breaker.before_call()
+    breaker.on_cancel()
+    breaker.before_call()
+    assert breaker.state == "half_open"
+
+
+@pytest.mark.asyncio
+async def test_client_fails_fast_while_open(http_client: HttpClient) -> None:
+    """Test calls are rejected without a request once the circuit opened"""
+    with patch("aiohttp.ClientSession.get", return_value=make_response(503)) as get:
+        for _ in range(2):
+            with pytest.raises(RealityDefenderError) as exc_info:
+                await http_client.get("/api/media/users/req")
+            assert exc_info.value.code == "server_error"
+
+        with pytest.raises(RealityDefenderError) as exc_info:
+            await http_client.get("/api/media/users/req")
+
+    assert exc_info.value.code == "circuit_open"
+    assert get.call_count == 2
+    assert http_client.circuit_breaker("result").state == "open"
+
+
+@pytest.mark.asyncio
+async def test_circuits_are_tracked_per_endpoint_class(
+    http_client: HttpClient,
+) -> None:
+    """Test a failing endpoint does not block other endpoints"""
+    with patch("aiohttp.ClientSession.get", return_value=make_response(503)):
+        for _ in range(2):
+            with pytest.raises(RealityDefenderError):
+                await http_client.get("/api/media/users/req")
+
+    with patch(
+        "aiohttp.ClientSession.post",
+        return_value=make_response(200, {"requestId": "req"}),
+    ):
+        result = await http_client.post("/api/files/aws-presigned", {"fileName": "a"})
+
+    assert result == {"requestId": "req"}
+    assert http_client.circuit_breaker("signed_url").state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_client_recovers_through_probe(http_client: HttpClient) -> None:
+    """Test a successful probe closes the circuit"""
+    with patch("aiohttp.ClientSession.get", return_value=make_response(503)):
+        for _ in range(2):
+            with pytest.raises(RealityDefenderError):
+                await http_client.get("/api/media/users/req")
+
+    time.sleep(0.03)
+
+    with patch(
+        "aiohttp.ClientSession.get",
+        return_value=make_response(200, {"requestId": "req"}),
+    ):
+        assert await http_client.get("/api/media/users/req") == {"requestId": "req"}
+
+    assert http_client.circuit_breaker("result").state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_open_the_circuit(http_client: HttpClient) -> None:
+    """Test rejected requests count as a healthy endpoint"""
+    with patch("aiohttp.ClientSession.get", return_value=make_response(404)):
+        for _ in range(3):
+            with pytest.raises(RealityDefenderError) as exc_info:
+                await http_client.get("/api/media/users/req")
+            assert exc_info.value.code == "not_found"
+
+    assert http_client.circuit_breaker("result").state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_unretried_server_errors_open_the_circuit() -> None:
+    """Test 500 responses, which the API policies do not retry, count as failures"""
+    http_client = create_http_client(
+        {
+            "api_key": "test-api-key",
+            "circuit_breaker": {"failure_threshold": 2, "reset_timeout": 20},
+        }
+    )
+    with patch("aiohttp.ClientSession.get", return_value=make_response(500)) as get:
+        for _ in range(2):
+            with pytest.raises(RealityDefenderError) as exc_info:
+                await http_client.get("/api/media/users/req")
+            assert exc_info.value.code == "server_error"
+            assert exc_info.value.status == 500
+
+        with pytest.raises(RealityDefenderError) as exc_info:
+            await http_client.get("/api/media/users/req")
+
+    assert exc_info.value.code == "circuit_open"
+    assert get.call_count == 2
+
+    # Other 4xx rejections reported as server errors keep the circuit closed
+    with patch("aiohttp.ClientSession.post", return_value=make_response(403)):
+        for _ in range(3):
+            with pytest.raises(RealityDefenderError):
+                await http_client.post("/api/files/aws-presigned", {"fileName": "a"})
+    assert http_client.circuit_breaker("signed_url").state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_polling_stops_when_circuit_opens(http_client: HttpClient) -> None:
+    """Test result polling gives up instead of waiting on a failing API"""
+    sleep: Any = AsyncMock()
+    with (
+        patch("aiohttp.ClientSession.get", return_value=make_response(503)),
+        patch("realitydefender.detection.results.sleep", sleep),
+    ):
+        for _ in range(2):
+            with pytest.raises(RealityDefenderError):
+                await http_client.get("/api/media/users/req")
+
+        with pytest.raises(RealityDefenderError) as exc_info:
+            await get_detection_result(http_client, "req")
+
+    assert exc_info.value.code == "circuit_open"
+    sleep.assert_not_called()
@@ -2,6 +2,7 @@
 Tests for the HTTP client module
 """
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
@@ -22,7 +23,7 @@ def mock_response() -> AsyncMock:
     """Create a mock aiohttp.ClientResponse"""
     mock = AsyncMock(spec=aiohttp.ClientResponse)
     mock.status = 200
-    mock.json = AsyncMock(return_value={"data": {"test": "value"}})
+    mock.read = AsyncMock(return_value=json.dumps({"data": {"test": "value"}}).encode())
     mock.text = AsyncMock(return_value="response text")
     mock.__aenter__ = AsyncMock(return_value=mock)
     mock.__aexit__ = AsyncMock(return_value=None)
@@ -58,6 +59,70 @@ async def test_ensure_session(http_client: HttpClient) -> None:
     assert second_session is session
 
 
+@pytest.mark.asyncio
+async def test_ensure_session_applies_pool_config() -> None:
+    """Test pool settings are applied to the connector and timeouts"""
+    client = create_http_client(
+        {
+            "api_key": "test-api-key",
+            "pool": {
+                "limit": 20,
+                "limit_per_host": 5,
+                "ttl_dns_cache": 60000,
+                "connect_timeout": 2000,
+                "read_timeout": 10000,
+            },
+        }
+    )
+    try:
+        session = await client.ensure_session()
+        connector = session.connector
+        assert isinstance(connector, aiohttp.TCPConnector)
+        assert connector.limit == 20
+        assert connector.limit_per_host == 5
+        assert session.timeout.sock_connect == 2
+        assert session.timeout.sock_read == 10
+        # Unset values keep their defaults
+        assert session.timeout.total == 300
+        assert not connector.force_close
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_ensure_session_force_close() -> None:
+    """Test connections can be closed after every request"""
+    client = create_http_client(
+        {"api_key": "test-api-key", "pool": {"force_close": True}}
+    )
+    try:
+        session = await client.ensure_session()
+        assert isinstance(session.connector, aiohttp.TCPConnector)
+        assert session.connector.force_close
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_storage_session_is_separate(http_client: HttpClient) -> None:
+    """Test uploads use their own pool and do not send the API key"""
+    try:
+        session = await http_client.ensure_session()
+        storage_session = await http_client.ensure_storage_session()
+
+        assert storage_session is not session
+        assert storage_session.connector is not session.connector
+        assert "X-API-KEY" not in storage_session.headers
+        assert session.headers["X-API-KEY"] == "test-api-key"
+        assert storage_session.timeout.total is None
+        assert await http_client.ensure_storage_session() is storage_session
+    finally:
+        await http_client.close()
+
+    assert session.closed
+    assert storage_session.closed
+
+
 @pytest.mark.asyncio
 async def test_get_success(http_client: HttpClient, mock_response: AsyncMock) -> None:
     """Test successful GET request"""
@@ -92,11 +157,13 @@ async def test_handle_response_400_free_tier_error(http_client: HttpClient) -> N
     """Test 400 response with free-tier-not-allowed error code"""
     mock_response = AsyncMock(spec=aiohttp.ClientResponse)
     mock_response.status = 400
-    mock_response.json = AsyncMock(
-        return_value={
-            "code": "free-tier-not-allowed",
-            "response": "Error: paid plan required",
-        }
+    mock_response.read = AsyncMock(
+        return_value=json.dumps(
+            {
+                "code": "free-tier-not-allowed",
+                "response": "Error: paid plan required",
+            }
+        ).encode()
     )
 
     with pytest.raises(RealityDefenderError) as exc_info:
@@ -111,8 +178,10 @@ async def test_handle_response_400_other_error(http_client: HttpClient) -> None:
     """Test 400 response with non-free-tier error"""
     mock_response = AsyncMock(spec=aiohttp.ClientResponse)
     mock_response.status = 400
-    mock_response.json = AsyncMock(
-        return_value={"code": "validation-error", "response": "Invalid file format"}
+    mock_response.read = AsyncMock(
+        return_value=json.dumps(
+            {"code": "validation-error", "response": "Invalid file format"}
+        ).encode()
     )
 
     with pytest.raises(RealityDefenderError) as exc_info:
@@ -129,7 +198,9 @@ async def test_handle_response_400_missing_error_structure(
     """Test 400 response with malformed error structure"""
     mock_response = AsyncMock(spec=aiohttp.ClientResponse)
     mock_response.status = 400
-    mock_response.json = AsyncMock(return_value={"some_other_field": "value"})
+    mock_response.read = AsyncMock(
+        return_value=json.dumps({"some_other_field": "value"}).encode()
+    )
 
     with pytest.raises(RealityDefenderError) as exc_info:
         await http_client._handle_response(mock_response)
@@ -143,7 +214,7 @@ async def test_handle_response_400_empty_error_fields(http_client: HttpClient) -
     """Test 400 response with empty error code and message"""
     mock_response = AsyncMock(spec=aiohttp.ClientResponse)
     mock_response.status = 400
-    mock_response.json = AsyncMock(return_value={})
+    mock_response.read = AsyncMock(return_value=json.dumps({}).encode())
 
     with pytest.raises(RealityDefenderError) as exc_info:
         await http_client._handle_response(mock_response)
@@ -168,7 +239,9 @@ async def test_post_success(http_client: HttpClient, mock_response: AsyncMock) -
 async def test_post_error(http_client: HttpClient, mock_response: AsyncMock) -> None:
     """Test POST request with error"""
     mock_response.status = 500
-    mock_response.json = AsyncMock(return_value={"error": {"message": "Server error"}})
+    mock_response.read = AsyncMock(
+        return_value=json.dumps({"error": {"message": "Server error"}}).encode()
+    )
 
     with patch("aiohttp.ClientSession.post", return_value=mock_response):
         with pytest.raises(RealityDefenderError) as exc_info:
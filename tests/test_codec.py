@@ -0,0 +1,99 @@
+"""
+Tests for JSON codecs
+"""
+
+import importlib.util
+import json
+from typing import Any, List
+from unittest.mock import patch
+
+import pytest
+
+from realitydefender.client.codec import StdlibCodec, get_codec
+from realitydefender.client.http_client import create_http_client
+from realitydefender.errors import RealityDefenderError
+from tests.test_retry import make_response
+
+DOCUMENT = {"requestId": "req", "models": [{"name": "m", "predictionNumber": 0.5}]}
+
+
+@pytest.mark.parametrize("name", ["stdlib", "orjson", "msgspec"])
+def test_codecs_decode_bytes(name: str) -> None:
+    """Test every installed codec decodes bytes and rejects invalid input"""
+    if name != "stdlib" and importlib.util.find_spec(name) is None:
+        pytest.skip(f"{name} is not installed")
+
+    codec = get_codec(name)
+
+    assert codec.name == name
+    assert codec.loads(json.dumps(DOCUMENT).encode()) == DOCUMENT
+    assert codec.loads('{"name": "é"}'.encode()) == {"name": "é"}
+    with pytest.raises(ValueError):
+        codec.loads(b"<html>Bad Gateway</html>")
+
+
+def test_auto_codec_prefers_installed_libraries() -> None:
+    """Test automatic selection falls back to the standard library"""
+    expected = next(
+        (
+            name
+            for name in ("orjson", "msgspec")
+            if importlib.util.find_spec(name) is not None
+        ),
+        "stdlib",
+    )
+    assert get_codec().name == expected
+
+    with patch.dict("sys.modules", {"orjson": None, "msgspec": None}):
+        assert get_codec().name == "stdlib"
+
+
+def test_unknown_or_missing_codec() -> None:
+    """Test naming a codec that cannot be used is an error"""
+    with pytest.raises(RealityDefenderError) as exc_info:
+        get_codec("yaml")
+    assert exc_info.value.code == "invalid_request"
+
+    with patch.dict("sys.modules", {"orjson": None}):
+        with pytest.raises(RealityDefenderError) as exc_info:
+            get_codec("orjson")
+    assert "not installed" in exc_info.value.message
+
+
+@pytest.mark.asyncio
+async def test_client_uses_configured_codec() -> None:
+    """Test responses are decoded from bytes by the client's codec"""
+    decoded: List[bytes] = []
+
+    class RecordingCodec(StdlibCodec):
+        name = "recording"
+
+        def loads(self, data: bytes) -> Any:
+            decoded.append(data)
+            return super().loads(data)
+
+    client = create_http_client({"api_key": "test-api-key", "codec": RecordingCodec()})
+
+    with patch("aiohttp.ClientSession.get", return_value=make_response(200, DOCUMENT)):
+        assert await client.get("/api/media/users/req") == DOCUMENT
+
+    assert decoded and isinstance(decoded[0], bytes)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_non_json_error_body_is_reported_as_text() -> None:
+    """Test an error page that is not JSON is included in the error message"""
+    client = create_http_client(
+        {"api_key": "test-api-key", "retry": {"default": {"max_attempts": 1}}}
+    )
+    response = make_response(502)
+    response.read.return_value = b"<html>Bad Gateway</html>"
+
+    with patch("aiohttp.ClientSession.get", return_value=response):
+        with pytest.raises(RealityDefenderError) as exc_info:
+            await client.get("/test")
+
+    assert exc_info.value.code == "server_error"
+    assert "Bad Gateway" in exc_info.value.message
+    await client.close()
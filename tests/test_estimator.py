@@ -0,0 +1,273 @@
+"""
+Tests for the processing time estimator
+"""
+
+import io
+import os
+import tempfile
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from realitydefender import RealityDefender
+from realitydefender.detection.estimator import (
+    EstimatedPolling,
+    ProcessingTimeEstimator,
+)
+from realitydefender.detection.polling import FixedPolling
+from realitydefender.errors import RealityDefenderError
+from realitydefender.model import DetectionResult
+
+DONE: DetectionResult = {
+    "request_id": "req",
+    "status": "AUTHENTIC",
+    "score": 0.1,
+    "models": [],
+}
+
+
+def test_polls_are_scheduled_at_percentiles() -> None:
+    """Test polls follow the percentiles of similar media, then the fallback"""
+    estimator = ProcessingTimeEstimator(
+        percentiles=[0.5, 0.9], fallback=FixedPolling(3000)
+    )
+    for duration in range(1000, 11000, 1000):
+        estimator.observe("clip.mp4", 5000000, duration)
+
+    estimator.start("req", "other.MP4", 6000000)
+    strategy = estimator.strategy_for("req")
+
+    assert isinstance(strategy, EstimatedPolling)
+    assert 4900 <= strategy.first_delay() <= 5000
+    assert strategy.next_delay(0) == 4000
+    assert strategy.next_delay(4000) == 3000
+    assert estimator.estimate("clip.mp4", 5000000, 0.9) == 9000
+    # Another size bucket has no observations yet
+    assert estimator.estimate("clip.mp4", 50000000) is None
+    assert estimator.strategy_for("unknown") is None
+
+
+def test_too_few_samples_use_fallback() -> None:
+    """Test media without enough observations are polled by the fallback"""
+    estimator = ProcessingTimeEstimator(min_samples=3, fallback=FixedPolling(700))
+    estimator.observe("photo.jpg", 1000, 500)
+
+    estimator.start("req", "photo.jpg", 1000)
+    strategy = estimator.strategy_for("req")
+
+    assert strategy is not None
+    assert strategy.first_delay() == 0
+    assert strategy.next_delay(0) == 700
+
+
+def test_finish_records_durations_and_wasted_polls() -> None:
+    """Test final results record a processing time and the polls spent on it"""
+    estimator = ProcessingTimeEstimator()
+    estimator.start("req", "photo.jpg", 1000)
+    strategy = estimator.strategy_for("req")
+    assert strategy is not None
+    strategy.next_delay(0)
+    strategy.next_delay(2000)
+
+    assert not estimator.finish("req", {**DONE, "status": "ANALYZING"})
+    assert estimator.finish("req", DONE)
+    assert not estimator.finish("req", DONE)
+
+    assert estimator.stats() == {
+        "results": 1,
+        "polls": 3,
+        "wasted_polls": 2,
+        "samples": 1,
+    }
+
+
+def test_observations_persist() -> None:
+    """Test observations and counters are reloaded from the file"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "times.json")
+        estimator = ProcessingTimeEstimator(path, max_samples=2)
+        for duration in (100, 200, 300):
+            estimator.observe("voice.mp3", 2000, duration)
+        estimator.start("req", "voice.mp3", 2000)
+        estimator.finish("req", DONE)
+        estimator.save()
+
+        reloaded = ProcessingTimeEstimator(path, min_samples=1)
+
+        assert reloaded.stats()["results"] == 1
+        assert reloaded.stats()["samples"] == 2
+        assert reloaded.estimate("voice.mp3", 2000, 1.0) == 300
+
+
+@pytest.mark.asyncio
+async def test_get_result_polls_with_estimator() -> None:
+    """Test get_result polls timed uploads with the estimator and records them"""
+    analyzing: Dict[str, Any] = {
+        "requestId": "req",
+        "resultsSummary": {"status": "ANALYZING", "metadata": {"finalScore": None}},
+        "models": [],
+    }
+    done: Dict[str, Any] = {
+        "requestId": "req",
+        "resultsSummary": {"status": "AUTHENTIC", "metadata": {"finalScore": 10}},
+        "models": [],
+    }
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(side_effect=[analyzing, done])
+    estimator = ProcessingTimeEstimator(fallback=FixedPolling(1234))
+    with patch(
+        "realitydefender.reality_defender.create_http_client", return_value=mock_client
+    ):
+        sdk = RealityDefender(api_key="test-api-key", estimator=estimator)
+    estimator.start("req", "photo.png", 1000)
+    sleep = AsyncMock()
+
+    with patch("realitydefender.detection.results.sleep", sleep):
+        result = await sdk.get_result("req")
+
+    assert result["status"] == "AUTHENTIC"
+    assert [call.args[0] for call in sleep.call_args_list] == [1234]
+    assert estimator.stats()["wasted_polls"] == 1
+    assert estimator.strategy_for("req") is None
+
+
+def test_pending_uploads_are_evicted() -> None:
+    """Test uploads never finished stop being timed past the size and age limits"""
+    estimator = ProcessingTimeEstimator(max_pending=2, pending_ttl=1000)
+    with patch("realitydefender.detection.estimator.time.monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        estimator.start("first", "photo.jpg", 1000)
+        estimator.start("second", "photo.jpg", 1000)
+        estimator.start("third", "photo.jpg", 1000)
+
+        assert estimator.strategy_for("first") is None
+        assert estimator.strategy_for("second") is not None
+
+        monotonic.return_value = 101.5
+        estimator.start("fourth", "photo.jpg", 1000)
+
+    assert estimator.strategy_for("second") is None
+    assert estimator.strategy_for("third") is None
+    assert estimator.strategy_for("fourth") is not None
+
+
+def test_saves_are_throttled() -> None:
+    """Test save_due only asks for a save once new observations are old enough"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "times.json")
+        with patch("realitydefender.detection.estimator.time.monotonic") as monotonic:
+            monotonic.return_value = 200.0
+            estimator = ProcessingTimeEstimator(path, save_interval=60000)
+            estimator.start("req", "photo.jpg", 1000)
+            estimator.finish("req", DONE)
+            assert not estimator.save_due()
+
+            monotonic.return_value = 260.0
+            assert estimator.save_due()
+            estimator.save()
+            assert not estimator.save_due()
+
+
+@pytest.mark.asyncio
+async def test_get_result_stops_timing_cached_results() -> None:
+    """Test results answered from the upload cache are not recorded"""
+    mock_client = AsyncMock()
+    estimator = ProcessingTimeEstimator()
+    upload_cache = MagicMock()
+    upload_cache.get_result.return_value = DONE
+    with patch(
+        "realitydefender.reality_defender.create_http_client", return_value=mock_client
+    ):
+        sdk = RealityDefender(
+            api_key="test-api-key", estimator=estimator, upload_cache=upload_cache
+        )
+    estimator.start("req", "photo.png", 1000)
+
+    assert await sdk.get_result("req") == DONE
+    assert estimator.strategy_for("req") is None
+    assert estimator.stats()["results"] == 0
+    mock_client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upload_fileobj_is_timed() -> None:
+    """Test uploads from file objects are timed with their measured size"""
+    mock_client = AsyncMock()
+    estimator = ProcessingTimeEstimator(min_samples=1, percentiles=[1.0])
+    estimator.observe("photo.png", 11, 3000)
+    with patch(
+        "realitydefender.reality_defender.create_http_client", return_value=mock_client
+    ):
+        sdk = RealityDefender(api_key="test-api-key", estimator=estimator)
+    fileobj = io.BytesIO(b"image bytes")
+
+    with patch(
+        "realitydefender.reality_defender.upload_fileobj",
+        AsyncMock(return_value={"request_id": "req", "media_id": "media"}),
+    ):
+        await sdk.upload_fileobj(fileobj, filename="photo.png")
+
+    strategy = estimator.strategy_for("req")
+    assert isinstance(strategy, EstimatedPolling)
+    assert strategy.schedule == [3000]
+
+
+@pytest.mark.asyncio
+async def test_cleanup_closes_client_when_save_fails() -> None:
+    """Test the HTTP sessions are closed even if the observations cannot be saved"""
+    mock_client = AsyncMock()
+    estimator = ProcessingTimeEstimator(
+        os.path.join(tempfile.gettempdir(), "missing-directory", "times.json")
+    )
+    with patch(
+        "realitydefender.reality_defender.create_http_client", return_value=mock_client
+    ):
+        sdk = RealityDefender(api_key="test-api-key", estimator=estimator)
+
+    with pytest.raises(RealityDefenderError):
+        await sdk.cleanup()
+
+    mock_client.close.assert_awaited_once()
+
+
+def test_failed_save_removes_temporary_file() -> None:
+    """Test a save that cannot replace the file leaves no temporary file behind"""
+    with tempfile.TemporaryDirectory() as directory:
+        estimator = ProcessingTimeEstimator(os.path.join(directory, "times.json"))
+        estimator.observe("photo.jpg", 1000, 500)
+
+        with patch(
+            "realitydefender.detection.estimator.os.replace",
+            side_effect=OSError("read-only"),
+        ):
+            with pytest.raises(RealityDefenderError):
+                estimator.save()
+
+        assert os.listdir(directory) == []
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "[1, 2]",
+        '{"samples": {".jpg:10": ["fast"]}}',
+        '{"samples": {".jpg:10": 5}}',
+        '{"samples": {}, "stats": {"results": null}}',
+    ],
+)
+def test_unexpected_observations_are_ignored(content: str) -> None:
+    """Test a file of valid JSON but unexpected shape starts from scratch"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "times.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+        estimator = ProcessingTimeEstimator(path)
+
+        assert estimator.stats() == {
+            "results": 0,
+            "polls": 0,
+            "wasted_polls": 0,
+            "samples": 0,
+        }
@@ -3,7 +3,12 @@ import tempfile
 
 import pytest
 
-from realitydefender.utils.file_utils import get_file_info
+from realitydefender.utils.file_utils import (
+    get_file_info,
+    get_file_metadata,
+    mmap_file_chunks,
+    read_file_chunks,
+)
 from realitydefender.errors import RealityDefenderError
 
 
@@ -103,3 +108,63 @@ def test_get_file_info_supported_extensions() -> None:
             assert mime_type == expected_mime
         finally:
             os.unlink(temp_path)
+
+
+def test_get_file_metadata_does_not_read_content() -> None:
+    """Test metadata extraction returns the size instead of the content"""
+    with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
+        f.write(b"x" * 1234)
+        temp_path = f.name
+
+    try:
+        filename, file_size, mime_type = get_file_metadata(temp_path)
+
+        assert filename == os.path.basename(temp_path)
+        assert file_size == 1234
+        assert mime_type == "video/mp4"
+    finally:
+        os.unlink(temp_path)
+
+
+def test_read_file_chunks() -> None:
+    """Test file content is yielded in bounded chunks"""
+    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
+        f.write(b"0123456789")
+        temp_path = f.name
+
+    try:
+        chunks = list(read_file_chunks(temp_path, 4))
+        assert chunks == [b"0123", b"4567", b"89"]
+
+        with pytest.raises(RealityDefenderError) as exc_info:
+            list(read_file_chunks(temp_path, 0))
+        assert exc_info.value.code == "invalid_request"
+    finally:
+        os.unlink(temp_path)
+
+
+def test_mmap_file_chunks() -> None:
+    """Test memory-mapped chunks are zero-copy views of the file"""
+    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
+        f.write(b"0123456789")
+        temp_path = f.name
+
+    try:
+        chunks = [bytes(chunk) for chunk in mmap_file_chunks(temp_path, 4)]
+        assert chunks == [b"0123", b"4567", b"89"]
+
+        first = next(mmap_file_chunks(temp_path, 4))
+        assert isinstance(first, memoryview)
+    finally:
+        os.unlink(temp_path)
+
+
+def test_mmap_file_chunks_empty_file() -> None:
+    """Test that an empty file yields no chunks"""
+    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
+        temp_path = f.name
+
+    try:
+        assert list(mmap_file_chunks(temp_path, 4)) == []
+    finally:
+        os.unlink(temp_path)
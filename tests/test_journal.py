@@ -0,0 +1,209 @@
+"""
+Tests for resumable uploads and the upload journal
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Generator, List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from realitydefender.client.http_client import HttpClient, create_http_client
+from realitydefender.detection.journal import JournalEntry, UploadJournal
+from realitydefender.detection.upload import upload_file
+from realitydefender.errors import RealityDefenderError
+from tests.test_multipart import PART_SIZE, LocalMultipartBackend
+
+SIGNED_URL_RESPONSE: Dict[str, Any] = {
+    "requestId": "test-request-id",
+    "mediaId": "test-media-id",
+    "response": {"signedUrl": "https://signed-url.com"},
+}
+
+
+@pytest.fixture
+def http_client() -> HttpClient:
+    """Create an HTTP client for testing"""
+    return create_http_client({"api_key": "test-api-key"})
+
+
+@pytest.fixture
+def journal() -> Generator[UploadJournal, Any, None]:
+    """Create a journal in a temporary directory"""
+    with tempfile.TemporaryDirectory() as directory:
+        yield UploadJournal(os.path.join(directory, "uploads.json"))
+
+
+@pytest.fixture
+def large_file() -> Generator[str, Any, None]:
+    """Create a video file spanning several parts"""
+    with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
+        f.write(os.urandom(PART_SIZE * 3 + 10))
+        temp_path = f.name
+
+    yield temp_path
+
+    if os.path.exists(temp_path):
+        os.unlink(temp_path)
+
+
+def test_journal_round_trip(journal: UploadJournal, large_file: str) -> None:
+    """Test entries are persisted, reloaded and removed"""
+    assert journal.get(large_file) is None
+
+    entry = journal.start(large_file, "https://signed-url.com", "req", "media")
+    entry["completed_parts"] = [{"part_number": 1, "etag": "abc"}]
+    journal.save(large_file, entry)
+
+    reloaded = UploadJournal(journal.path).get(large_file)
+    assert reloaded is not None
+    assert reloaded["request_id"] == "req"
+    assert reloaded["completed_parts"] == [{"part_number": 1, "etag": "abc"}]
+
+    journal.remove(large_file)
+    assert journal.get(large_file) is None
+
+
+def test_journal_concurrent_saves_keep_all_entries(
+    journal: UploadJournal, large_file: str
+) -> None:
+    """Test saves from several threads do not overwrite each other's entries"""
+    entry = journal.start(large_file, "https://signed-url.com", "req", "media")
+    journal.remove(large_file)
+    paths = [f"/uploads/file-{index}.mp4" for index in range(40)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda path: journal.save(path, entry), paths))
+
+    with open(journal.path, "r", encoding="utf-8") as f:
+        assert len(json.load(f)) == 40
+
+
+def test_journal_discards_stale_entries(
+    journal: UploadJournal, large_file: str
+) -> None:
+    """Test entries are dropped when the file changes or the TTL passes"""
+    journal.start(large_file, "https://signed-url.com", "req", "media")
+    with open(large_file, "ab") as f:
+        f.write(b"more")
+    assert journal.get(large_file) is None
+
+    expiring = UploadJournal(journal.path, ttl=1)
+    expiring.start(large_file, "https://signed-url.com", "req", "media")
+    time.sleep(0.01)
+    assert expiring.get(large_file) is None
+
+
+@pytest.mark.asyncio
+async def test_upload_file_resumes_multipart_upload(
+    http_client: HttpClient, journal: UploadJournal, large_file: str
+) -> None:
+    """Test a failed multipart upload resumes without re-sending stored parts"""
+    backend = LocalMultipartBackend(fail_part=3)
+
+    with patch(
+        "realitydefender.detection.upload.get_signed_url",
+        AsyncMock(return_value=SIGNED_URL_RESPONSE),
+    ) as mock_get_signed_url:
+        with pytest.raises(RealityDefenderError):
+            await upload_file(
+                http_client,
+                file_path=large_file,
+                multipart_backend=backend,
+                part_size=PART_SIZE,
+                concurrency=1,
+                journal=journal,
+            )
+
+        entry = journal.get(large_file)
+        assert entry is not None
+        assert [p["part_number"] for p in entry["completed_parts"]] == [1, 2]
+        assert backend.aborted == []
+
+        # Retry once the connection is back
+        backend.fail_part = None
+        backend.sent.clear()
+
+        result = await upload_file(
+            http_client,
+            file_path=large_file,
+            multipart_backend=backend,
+            part_size=PART_SIZE,
+            concurrency=1,
+            journal=journal,
+        )
+
+    assert result == {"request_id": "test-request-id", "media_id": "test-media-id"}
+    assert mock_get_signed_url.call_count == 1
+    assert backend.sent == [3, 4]
+    with open(large_file, "rb") as f:
+        assert backend.objects["https://signed-url.com"] == f.read()
+    assert journal.get(large_file) is None
+
+
+@pytest.mark.asyncio
+async def test_upload_file_reuses_signed_url_after_failure(
+    http_client: HttpClient, journal: UploadJournal, large_file: str
+) -> None:
+    """Test a retried single PUT upload keeps its request ID and signed URL"""
+    with (
+        patch(
+            "realitydefender.detection.upload.get_signed_url",
+            AsyncMock(return_value=SIGNED_URL_RESPONSE),
+        ) as mock_get_signed_url,
+        patch(
+            "realitydefender.detection.upload.upload_to_signed_url",
+            AsyncMock(
+                side_effect=[
+                    RealityDefenderError("connection reset", "upload_failed"),
+                    None,
+                ]
+            ),
+        ) as mock_upload,
+    ):
+        with pytest.raises(RealityDefenderError):
+            await upload_file(http_client, file_path=large_file, journal=journal)
+
+        result = await upload_file(http_client, file_path=large_file, journal=journal)
+
+    assert result["request_id"] == "test-request-id"
+    assert mock_get_signed_url.call_count == 1
+    assert mock_upload.call_args.args[1] == "https://signed-url.com"
+
+
+@pytest.mark.asyncio
+async def test_multipart_checkpoints_are_written_off_the_loop(
+    http_client: HttpClient, journal: UploadJournal, large_file: str
+) -> None:
+    """Test part checkpoints are saved on the I/O executor, not the event loop"""
+    threads: List[threading.Thread] = []
+    save = journal.save
+
+    def recording_save(file_path: str, entry: JournalEntry) -> None:
+        threads.append(threading.current_thread())
+        save(file_path, entry)
+
+    with (
+        patch(
+            "realitydefender.detection.upload.get_signed_url",
+            AsyncMock(return_value=SIGNED_URL_RESPONSE),
+        ),
+        patch.object(journal, "save", recording_save),
+    ):
+        await upload_file(
+            http_client,
+            file_path=large_file,
+            multipart_backend=LocalMultipartBackend(),
+            part_size=PART_SIZE,
+            concurrency=2,
+            journal=journal,
+        )
+
+    # Once when the upload starts, once when it is created and once per part
+    assert len(threads) == 6
+    assert threading.current_thread() not in threads
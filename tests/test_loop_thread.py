@@ -0,0 +1,98 @@
+"""
+Tests for the background event loop of the synchronous API
+"""
+
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+import pytest
+
+from realitydefender import RealityDefender
+from realitydefender.errors import RealityDefenderError
+from realitydefender.utils.loop_thread import BackgroundLoop
+
+
+async def current_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+def test_calls_share_one_loop_in_another_thread() -> None:
+    """Test coroutines run on the same loop, outside the calling thread"""
+    background = BackgroundLoop()
+    try:
+
+        async def thread_name() -> str:
+            return threading.current_thread().name
+
+        first = background.run(current_loop())
+        assert background.run(current_loop()) is first
+        assert background.run(thread_name()) == "realitydefender-loop"
+        assert background.is_running
+    finally:
+        background.stop()
+    assert not background.is_running
+
+
+def test_errors_propagate_and_loop_restarts() -> None:
+    """Test exceptions reach the caller and a stopped loop starts again"""
+    background = BackgroundLoop()
+
+    async def fail() -> None:
+        raise ValueError("boom")
+
+    try:
+        with pytest.raises(ValueError):
+            background.run(fail())
+        background.stop()
+        assert background.run(current_loop()).is_running()
+    finally:
+        background.stop()
+
+
+@pytest.mark.asyncio
+async def test_runs_from_thread_with_running_loop() -> None:
+    """Test blocking calls work from a thread already running a loop"""
+    background = BackgroundLoop()
+    try:
+        assert background.run(current_loop()) is not asyncio.get_running_loop()
+    finally:
+        background.stop()
+
+
+def test_calls_from_loop_thread_are_rejected() -> None:
+    """Test calling run from the loop's own thread raises instead of hanging"""
+    background = BackgroundLoop()
+
+    async def nested() -> None:
+        background.run(current_loop())
+
+    try:
+        with pytest.raises(RealityDefenderError) as error:
+            background.run(nested())
+        assert error.value.code == "invalid_request"
+    finally:
+        background.stop()
+
+
+def test_sync_api_reuses_one_loop() -> None:
+    """Test synchronous SDK calls all run on the shared background loop"""
+    sdk = RealityDefender(api_key="test-api-key")
+    loops: List[asyncio.AbstractEventLoop] = []
+
+    async def get(path: str, params: Optional[Dict[str, str]] = None) -> Any:
+        loops.append(asyncio.get_running_loop())
+        return {
+            "requestId": "req",
+            "resultsSummary": {"status": "AUTHENTIC", "metadata": {"finalScore": 5}},
+            "models": [],
+        }
+
+    with patch.object(sdk.client, "get", get):
+        sdk.get_result_sync("req")
+        sdk.get_result_sync("req")
+
+    assert len(loops) == 2
+    assert loops[0] is loops[1]
+    sdk.cleanup_sync()
@@ -0,0 +1,168 @@
+"""
+Tests for multipart uploads against a local S3-compatible stand-in
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+from typing import Any, Dict, Generator, List, Optional
+from unittest.mock import patch
+
+import pytest
+
+from realitydefender.client.http_client import HttpClient, create_http_client
+from realitydefender.core.constants import MIN_MULTIPART_PART_SIZE
+from realitydefender.detection.multipart import plan_parts, upload_multipart
+from realitydefender.detection.upload import upload_file
+from realitydefender.errors import RealityDefenderError
+from realitydefender.model import CompletedPart
+
+PART_SIZE = MIN_MULTIPART_PART_SIZE
+
+
+class LocalMultipartBackend:
+    """In-memory stand-in for an S3-compatible multipart upload API"""
+
+    def __init__(self, fail_part: Optional[int] = None, delay: float = 0.0) -> None:
+        self.fail_part = fail_part
+        self.delay = delay
+        self.uploads: Dict[str, Dict[int, bytes]] = {}
+        self.objects: Dict[str, bytes] = {}
+        self.aborted: List[str] = []
+        self.sent: List[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create_upload(self, target_url: str, content_type: str) -> str:
+        upload_id = f"upload-{len(self.uploads) + 1}"
+        self.uploads[upload_id] = {}
+        return upload_id
+
+    async def upload_part(
+        self, target_url: str, upload_id: str, part_number: int, data: bytes
+    ) -> str:
+        self.sent.append(part_number)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if part_number == self.fail_part:
+                raise ConnectionResetError("connection reset by peer")
+            self.uploads[upload_id][part_number] = bytes(data)
+            return hashlib.md5(data).hexdigest()
+        finally:
+            self.in_flight -= 1
+
+    async def complete_upload(
+        self, target_url: str, upload_id: str, parts: List[CompletedPart]
+    ) -> None:
+        stored = self.uploads.pop(upload_id)
+        for part in parts:
+            assert hashlib.md5(stored[part["part_number"]]).hexdigest() == part["etag"]
+        self.objects[target_url] = b"".join(
+            stored[part["part_number"]] for part in parts
+        )
+
+    async def abort_upload(self, target_url: str, upload_id: str) -> None:
+        self.uploads.pop(upload_id, None)
+        self.aborted.append(upload_id)
+
+
+@pytest.fixture
+def http_client() -> HttpClient:
+    """Create an HTTP client for testing"""
+    return create_http_client({"api_key": "test-api-key"})
+
+
+@pytest.fixture
+def large_file() -> Generator[str, Any, None]:
+    """Create a video file spanning several parts"""
+    with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
+        f.write(os.urandom(PART_SIZE * 3 + 1234))
+        temp_path = f.name
+
+    yield temp_path
+
+    if os.path.exists(temp_path):
+        os.unlink(temp_path)
+
+
+def test_plan_parts() -> None:
+    """Test files are split into contiguous parts with a short last part"""
+    parts = plan_parts(PART_SIZE * 2 + 10, PART_SIZE)
+    assert parts == [
+        (1, 0, PART_SIZE),
+        (2, PART_SIZE, PART_SIZE),
+        (3, PART_SIZE * 2, 10),
+    ]
+
+    with pytest.raises(RealityDefenderError) as exc_info:
+        plan_parts(100, PART_SIZE - 1)
+    assert exc_info.value.code == "invalid_request"
+
+
+@pytest.mark.asyncio
+async def test_upload_multipart_reassembles_file(large_file: str) -> None:
+    """Test parts are uploaded concurrently and completed in order"""
+    backend = LocalMultipartBackend(delay=0.01)
+
+    await upload_multipart(
+        backend,
+        "https://signed-url.com",
+        large_file,
+        part_size=PART_SIZE,
+        concurrency=2,
+    )
+
+    with open(large_file, "rb") as f:
+        assert backend.objects["https://signed-url.com"] == f.read()
+    assert backend.max_in_flight == 2
+    assert backend.uploads == {}
+
+
+@pytest.mark.asyncio
+async def test_upload_multipart_aborts_on_failure(large_file: str) -> None:
+    """Test a failed part aborts the upload and raises upload_failed"""
+    backend = LocalMultipartBackend(fail_part=2)
+
+    with pytest.raises(RealityDefenderError) as exc_info:
+        await upload_multipart(
+            backend, "https://signed-url.com", large_file, part_size=PART_SIZE
+        )
+
+    assert exc_info.value.code == "upload_failed"
+    assert backend.aborted == ["upload-1"]
+    assert backend.objects == {}
+
+
+@pytest.mark.asyncio
+async def test_upload_file_with_multipart_backend(
+    http_client: HttpClient, large_file: str
+) -> None:
+    """Test upload_file routes the content through the multipart backend"""
+    backend = LocalMultipartBackend()
+    signed_url_response: Dict[str, Any] = {
+        "requestId": "test-request-id",
+        "mediaId": "test-media-id",
+        "response": {"signedUrl": "https://signed-url.com"},
+    }
+
+    with (
+        patch(
+            "realitydefender.detection.upload.get_signed_url",
+            return_value=signed_url_response,
+        ),
+        patch("realitydefender.detection.upload.upload_to_signed_url") as single_put,
+    ):
+        result = await upload_file(
+            http_client,
+            file_path=large_file,
+            multipart_backend=backend,
+            part_size=PART_SIZE,
+            concurrency=3,
+        )
+
+    assert result == {"request_id": "test-request-id", "media_id": "test-media-id"}
+    single_put.assert_not_called()
+    assert os.path.getsize(large_file) == len(backend.objects["https://signed-url.com"])
@@ -0,0 +1,200 @@
+"""
+Tests for the date range query planner
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, cast
+
+import pytest
+
+from realitydefender.client.http_client import HttpClient
+from realitydefender.detection.planner import (
+    iter_sharded_results,
+    plan_date_shards,
+    split_date_range,
+)
+from realitydefender.errors import RealityDefenderError
+
+START = date(2025, 1, 1)
+
+
+class DatedClient:
+    """Client stand-in listing results by day, newest first"""
+
+    def __init__(self, items_per_day: Dict[date, int]) -> None:
+        self.items_per_day = items_per_day
+        self.pages: List[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, path: str, params: Dict[str, str]) -> Dict[str, Any]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+        finally:
+            self.in_flight -= 1
+
+        first = datetime.strptime(params["startDate"], "%Y-%m-%d").date()
+        last = datetime.strptime(params["endDate"], "%Y-%m-%d").date()
+        media = [
+            {
+                "requestId": f"{day.isoformat()}-{index}",
+                "resultsSummary": {"status": "AUTHENTIC", "metadata": {}},
+            }
+            for day, count in sorted(self.items_per_day.items(), reverse=True)
+            if first <= day <= last
+            for index in range(count)
+        ]
+        page_number = int(path.rsplit("/", 1)[1])
+        size = int(params["size"])
+        if size > 1:
+            self.pages.append(page_number)
+        page = media[page_number * size : (page_number + 1) * size]
+        return {
+            "totalItems": len(media),
+            "totalPages": -(-len(media) // size),
+            "currentPage": page_number,
+            "currentPageItemsCount": len(page),
+            "mediaList": page,
+        }
+
+
+def make_client(counts: List[int]) -> DatedClient:
+    return DatedClient(
+        {START + timedelta(days=offset): count for offset, count in enumerate(counts)}
+    )
+
+
+def test_split_date_range() -> None:
+    """Test ranges are split into contiguous parts of nearly equal length"""
+    shards = split_date_range(START, START + timedelta(days=9), 3)
+
+    assert [(s["start_date"].day, s["end_date"].day) for s in shards] == [
+        (1, 4),
+        (5, 7),
+        (8, 10),
+    ]
+    assert len(split_date_range(START, START + timedelta(days=1), 5)) == 2
+
+
+@pytest.mark.asyncio
+async def test_plan_date_shards_splits_adaptively() -> None:
+    """Test busy ranges are split until shards are small enough or a single day"""
+    client = make_client([1, 0, 0, 12, 3, 3, 0, 0, 2, 0])
+
+    shards = await plan_date_shards(
+        cast(HttpClient, client), START, START + timedelta(days=9), max_shard_items=5
+    )
+
+    assert sum(shard["total_items"] for shard in shards) == 21
+    for shard in shards:
+        assert 0 < shard["total_items"]
+        assert shard["total_items"] <= 5 or shard["start_date"] == shard["end_date"]
+    assert any(shard["total_items"] == 12 for shard in shards)
+    assert [shard["start_date"] for shard in shards] == sorted(
+        shard["start_date"] for shard in shards
+    )
+
+
+class FailingClient(DatedClient):
+    """Client stand-in failing the probes of one day"""
+
+    def __init__(self, items_per_day: Dict[date, int], failing_day: date) -> None:
+        super().__init__(items_per_day)
+        self.failing_day = failing_day
+
+    async def get(self, path: str, params: Dict[str, str]) -> Dict[str, Any]:
+        if params["startDate"] == self.failing_day.isoformat():
+            raise RealityDefenderError("Bad request", "invalid_request")
+        return await super().get(path, params)
+
+
+@pytest.mark.asyncio
+async def test_plan_date_shards_stops_sibling_probes_on_failure() -> None:
+    """Test a failing probe cancels the probes running alongside it"""
+    client = FailingClient(
+        {START + timedelta(days=offset): 3 for offset in range(10)},
+        START + timedelta(days=9),
+    )
+
+    with pytest.raises(RealityDefenderError):
+        await plan_date_shards(
+            cast(HttpClient, client),
+            START,
+            START + timedelta(days=9),
+            max_shard_items=2,
+        )
+
+    assert client.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_plan_date_shards_rejects_invalid_ranges() -> None:
+    """Test an end date before the start date is an error"""
+    with pytest.raises(RealityDefenderError) as exc_info:
+        await plan_date_shards(
+            cast(HttpClient, make_client([])), START, START - timedelta(days=1)
+        )
+    assert exc_info.value.code == "invalid_request"
+
+
+@pytest.mark.asyncio
+async def test_iter_sharded_results_merges_shards_in_order() -> None:
+    """Test shards are fetched concurrently and merged in either date order"""
+    counts = [4, 7, 2, 9, 5, 1, 8, 3, 6, 4]
+    client = make_client(counts)
+    expected = [
+        f"{(START + timedelta(days=offset)).isoformat()}-{index}"
+        for offset in reversed(range(len(counts)))
+        for index in range(counts[offset])
+    ]
+
+    request_ids = [
+        result["request_id"]
+        async for result in iter_sharded_results(
+            cast(HttpClient, client),
+            START,
+            START + timedelta(days=9),
+            size=2,
+            max_shard_items=10,
+            concurrency=3,
+        )
+    ]
+
+    assert request_ids == expected
+    assert max(client.pages) <= 4
+    assert client.max_in_flight <= 3
+
+    oldest_first = [
+        result["request_id"]
+        async for result in iter_sharded_results(
+            cast(HttpClient, client),
+            START,
+            START + timedelta(days=9),
+            size=2,
+            max_shard_items=10,
+            newest_first=False,
+        )
+    ]
+    assert oldest_first == list(reversed(expected))
+
+
+@pytest.mark.asyncio
+async def test_iter_sharded_results_stops_fetching_on_close() -> None:
+    """Test closing the iterator early waits for the cancelled shard fetches"""
+    client = make_client([4, 7, 2, 9, 5, 1, 8, 3, 6, 4])
+    results = iter_sharded_results(
+        cast(HttpClient, client),
+        START,
+        START + timedelta(days=9),
+        size=2,
+        max_shard_items=10,
+        concurrency=3,
+    )
+
+    await results.__anext__()
+    await results.aclose()
+
+    assert client.in_flight == 0
@@ -0,0 +1,129 @@
+"""
+Tests for polling strategies
+"""
+
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from realitydefender import RealityDefender
+from realitydefender.detection.polling import (
+    DecorrelatedJitterPolling,
+    ExponentialPolling,
+    FixedPolling,
+    MediaTypePolling,
+)
+from realitydefender.detection.results import get_detection_result
+from realitydefender.utils.file_utils import get_media_type
+
+
+def delays(strategy: Any, count: int) -> List[int]:
+    """Collect the waits before the first count polls after the first one"""
+    waits: List[int] = []
+    previous = 0
+    for _ in range(count):
+        previous = strategy.next_delay(previous)
+        waits.append(previous)
+    return waits
+
+
+def test_fixed_and_exponential_delays() -> None:
+    """Test fixed intervals stay constant and exponential ones grow to the cap"""
+    assert delays(FixedPolling(1500), 3) == [1500, 1500, 1500]
+    assert FixedPolling().first_delay() == 0
+
+    exponential = ExponentialPolling(interval=250, max_interval=2000)
+    assert delays(exponential, 6) == [250, 500, 1000, 2000, 2000, 2000]
+
+
+def test_decorrelated_jitter_stays_within_bounds() -> None:
+    """Test jittered intervals stay between the interval and the cap and differ"""
+    strategy = DecorrelatedJitterPolling(interval=1000, max_interval=8000)
+
+    waits = delays(strategy, 50)
+
+    assert all(1000 <= wait <= 8000 for wait in waits)
+    assert len(set(waits)) > 1
+
+
+def test_media_type_polling_picks_strategy_by_extension() -> None:
+    """Test images poll sooner than videos, unknown media use the default"""
+    strategy = MediaTypePolling(strategies={"audio": FixedPolling(700)})
+
+    image = strategy.for_media("photo.JPG")
+    video = strategy.for_media("/tmp/clip.mp4")
+
+    assert image.first_delay() == 0
+    assert image.next_delay(0) < 1000
+    assert video.first_delay() >= 5000
+    assert strategy.for_media("voice.mp3").next_delay(0) == 700
+    assert strategy.for_media("archive.zip") is strategy.default
+    assert strategy.for_media(None) is strategy.default
+    assert get_media_type("clip.mov") == "video"
+    assert get_media_type("notes.txt") == "text"
+
+
+@pytest.mark.asyncio
+async def test_get_detection_result_waits_as_strategy_decides() -> None:
+    """Test the polling loop sleeps for the strategy's delays"""
+    analyzing: Dict[str, Any] = {
+        "requestId": "req",
+        "resultsSummary": {"status": "ANALYZING", "metadata": {"finalScore": None}},
+        "models": [],
+    }
+    done: Dict[str, Any] = {
+        "requestId": "req",
+        "resultsSummary": {"status": "AUTHENTIC", "metadata": {"finalScore": 10}},
+        "models": [],
+    }
+    client = AsyncMock()
+    client.get = AsyncMock(side_effect=[analyzing, analyzing, analyzing, done])
+    sleep = AsyncMock()
+
+    with patch("realitydefender.detection.results.sleep", sleep):
+        result = await get_detection_result(
+            client,
+            "req",
+            polling_strategy=ExponentialPolling(interval=100, initial_delay=50),
+        )
+
+    assert result["status"] == "AUTHENTIC"
+    assert [call.args[0] for call in sleep.call_args_list] == [50, 100, 200, 400]
+
+
+@pytest.mark.asyncio
+async def test_get_result_polls_uploads_by_media_type() -> None:
+    """Test a media type strategy polls an uploaded image at the image cadence"""
+    analyzing: Dict[str, Any] = {
+        "requestId": "req",
+        "resultsSummary": {"status": "ANALYZING", "metadata": {"finalScore": None}},
+        "models": [],
+    }
+    done: Dict[str, Any] = {
+        "requestId": "req",
+        "resultsSummary": {"status": "AUTHENTIC", "metadata": {"finalScore": 10}},
+        "models": [],
+    }
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(side_effect=[analyzing, analyzing, done])
+    with patch(
+        "realitydefender.reality_defender.create_http_client", return_value=mock_client
+    ):
+        sdk = RealityDefender(
+            api_key="test-api-key", polling_strategy=MediaTypePolling()
+        )
+    sleep = AsyncMock()
+
+    with (
+        patch(
+            "realitydefender.reality_defender.upload_bytes",
+            AsyncMock(return_value={"request_id": "req", "media_id": "media"}),
+        ),
+        patch("realitydefender.detection.results.sleep", sleep),
+    ):
+        await sdk.upload_bytes(b"image", filename="photo.jpg")
+        result = await sdk.get_result("req")
+
+    assert result["status"] == "AUTHENTIC"
+    assert [call.args[0] for call in sleep.call_args_list] == [250, 500]
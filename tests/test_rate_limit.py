@@ -0,0 +1,158 @@
+"""
+Tests for client-side rate limiting
+"""
+
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import time
+from typing import Any, Generator, List
+from unittest.mock import patch
+
+import pytest
+
+from realitydefender.client.http_client import create_http_client
+from realitydefender.client.rate_limit import (
+    SQLiteTokenBucket,
+    TokenBucket,
+    create_rate_limiter,
+)
+from realitydefender.errors import RealityDefenderError
+from tests.test_retry import make_response
+
+
+@pytest.fixture
+def database_path() -> Generator[str, Any, None]:
+    """Create a path for a temporary SQLite database"""
+    with tempfile.TemporaryDirectory() as directory:
+        yield os.path.join(directory, "limits.db")
+
+
+def reserve_shared(path: str, count: int) -> List[float]:
+    """Reserve tokens from a shared bucket in another process"""
+    bucket = SQLiteTokenBucket(path, "signed_url", rate=1, burst=2)
+    try:
+        return [bucket.reserve() for _ in range(count)]
+    finally:
+        bucket.close()
+
+
+def test_rate_limit_validation() -> None:
+    """Test invalid rates are rejected"""
+    with pytest.raises(RealityDefenderError) as exc_info:
+        TokenBucket(rate=0, burst=1)
+    assert exc_info.value.code == "invalid_request"
+
+    with pytest.raises(RealityDefenderError):
+        create_rate_limiter("result", {"burst": 5})
+
+
+def test_token_bucket_reserves_future_tokens() -> None:
+    """Test waiters queue for tokens at the configured rate"""
+    bucket = TokenBucket(rate=10, burst=2)
+
+    waits = [bucket.reserve() for _ in range(4)]
+
+    assert waits[:2] == [0, 0]
+    assert waits[2] == pytest.approx(0.1, abs=0.01)
+    assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_coroutines() -> None:
+    """Test acquire waits once the burst is used up"""
+    bucket = TokenBucket(rate=50, burst=2)
+    started = time.monotonic()
+
+    for _ in range(5):
+        await bucket.acquire()
+
+    assert time.monotonic() - started >= 0.055
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_returns_tokens_of_cancelled_waiters() -> None:
+    """Test a waiter cancelled before its token is due gives it back"""
+    bucket = TokenBucket(rate=1, burst=1)
+    await bucket.acquire()
+    waiter = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert bucket.reserve() == pytest.approx(1, abs=0.05)
+
+
+def test_sqlite_bucket_is_shared(database_path: str) -> None:
+    """Test buckets opened on the same database share their tokens"""
+    first = SQLiteTokenBucket(database_path, "signed_url", rate=1, burst=2)
+    second = SQLiteTokenBucket(database_path, "signed_url", rate=1, burst=2)
+    other = SQLiteTokenBucket(database_path, "result", rate=1, burst=1)
+
+    assert first.reserve() == 0
+    assert second.reserve() == 0
+    assert first.reserve() == pytest.approx(1, abs=0.05)
+    assert other.reserve() == 0
+
+    for bucket in (first, second, other):
+        bucket.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_bucket_returns_tokens_of_cancelled_waiters(
+    database_path: str,
+) -> None:
+    """Test a waiter cancelled before its token is due gives it back to all"""
+    bucket = SQLiteTokenBucket(database_path, "signed_url", rate=1, burst=1)
+    other = SQLiteTokenBucket(database_path, "signed_url", rate=1, burst=1)
+    await bucket.acquire()
+    waiter = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0.05)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert other.reserve() == pytest.approx(1, abs=0.1)
+    for shared in (bucket, other):
+        shared.close()
+
+
+def test_sqlite_bucket_is_shared_across_processes(database_path: str) -> None:
+    """Test worker processes together stay within one budget"""
+    SQLiteTokenBucket(database_path, "signed_url", rate=1, burst=2).close()
+
+    with multiprocessing.get_context("fork").Pool(2) as pool:
+        results = pool.starmap(reserve_shared, [(database_path, 3)] * 2)
+
+    waits = sorted(wait for result in results for wait in result)
+    assert waits[:2] == [0, 0]
+    for expected, wait in zip([1, 2, 3, 4], waits[2:]):
+        assert wait == pytest.approx(expected, abs=0.2)
+
+
+@pytest.mark.asyncio
+async def test_client_applies_rate_limits_per_operation() -> None:
+    """Test limited operations wait while others are sent right away"""
+    client = create_http_client(
+        {"api_key": "test-api-key", "rate_limits": {"result": {"rate": 10, "burst": 1}}}
+    )
+
+    with patch(
+        "aiohttp.ClientSession.get",
+        return_value=make_response(200, {"requestId": "req"}),
+    ):
+        started = time.monotonic()
+        for _ in range(3):
+            await client.get("/api/v2/media/users/pages/0")
+        assert time.monotonic() - started < 0.1
+
+        started = time.monotonic()
+        for _ in range(3):
+            await client.get("/api/media/users/req")
+        assert time.monotonic() - started >= 0.19
+
+    await client.close()
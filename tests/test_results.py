@@ -0,0 +1,299 @@
+"""
+Tests for detection result formatting and listing
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, cast
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from realitydefender import (
+    CompactDetectionResult,
+    RealityDefender,
+    RealityDefenderError,
+)
+from realitydefender.client.http_client import HttpClient
+from realitydefender.detection.results import (
+    format_result,
+    format_result_compact,
+    format_result_list,
+    get_all_detection_results,
+    iter_detection_result_pages,
+    iter_detection_results,
+)
+
+MEDIA: Dict[str, Any] = {
+    "requestId": "req-1",
+    "resultsSummary": {"status": "FAKE", "metadata": {"finalScore": 87.5}},
+    "models": [
+        {"name": "face", "status": "FAKE", "predictionNumber": 0.9},
+        {"name": "audio", "status": "NOT_APPLICABLE", "predictionNumber": None},
+        {"name": "voice", "status": "AUTHENTIC", "predictionNumber": "n/a"},
+    ],
+}
+
+PAGE: Dict[str, Any] = {
+    "totalItems": 2,
+    "totalPages": 1,
+    "currentPage": 0,
+    "currentPageItemsCount": 2,
+    "mediaList": [MEDIA, {"requestId": "req-2"}],
+}
+
+
+def test_compact_result_matches_format_result() -> None:
+    """Test compact results hold the same values as regular results"""
+    for media in PAGE["mediaList"]:
+        compact = format_result_compact(media)
+        expected = format_result(media)
+
+        assert compact.to_dict() == expected
+        assert dict(compact) == expected
+        assert compact == expected
+        assert expected == compact
+
+    result = format_result_compact(MEDIA)
+    assert result["status"] == result.status == "MANIPULATED"
+    assert result.get("score") == 0.875
+    assert result.get("media_id") is None
+    assert list(result) == ["request_id", "status", "score", "models"]
+    with pytest.raises(KeyError):
+        result["media_id"]
+
+
+def test_compact_result_builds_models_lazily() -> None:
+    """Test the models list is only built on first access, then reused"""
+    result = format_result_compact(MEDIA)
+
+    assert result._models is None
+    assert "models=2" in repr(result)
+
+    models = result["models"]
+    assert models == [
+        {"name": "face", "status": "MANIPULATED", "score": 0.9},
+        {"name": "voice", "status": "AUTHENTIC", "score": None},
+    ]
+    assert result.models is models
+
+
+def test_compact_result_has_no_instance_dict() -> None:
+    """Test compact results are slotted"""
+    result = CompactDetectionResult("req", "AUTHENTIC", 0.1)
+
+    assert not hasattr(result, "__dict__")
+    with pytest.raises(AttributeError):
+        result.extra = 1  # type: ignore[attr-defined]
+
+
+def test_format_result_list_compact() -> None:
+    """Test result list items can be formatted as compact results"""
+    result = format_result_list(PAGE, compact=True)
+
+    assert result["total_items"] == 2
+    assert all(isinstance(item, CompactDetectionResult) for item in result["items"])
+    assert result["items"] == format_result_list(PAGE)["items"]
+
+
+@pytest.mark.asyncio
+async def test_get_results_compact() -> None:
+    """Test the SDK forwards the compact option"""
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=PAGE)
+    with patch(
+        "realitydefender.reality_defender.create_http_client", return_value=mock_client
+    ):
+        sdk = RealityDefender(api_key="test-api-key")
+
+    result = await sdk.get_results(compact=True)
+
+    assert isinstance(result["items"][0], CompactDetectionResult)
+    assert result["items"][0]["request_id"] == "req-1"
+
+
+def make_page(page_number: int, total_pages: int, size: int = 2) -> Dict[str, Any]:
+    """Build a results page whose request IDs encode their position"""
+    return {
+        "totalItems": total_pages * size,
+        "totalPages": total_pages,
+        "currentPage": page_number,
+        "currentPageItemsCount": size,
+        "mediaList": [
+            {
+                "requestId": f"req-{page_number}-{index}",
+                "resultsSummary": {"status": "AUTHENTIC", "metadata": {}},
+            }
+            for index in range(size)
+        ],
+    }
+
+
+class PagedClient:
+    """Client stand-in serving pages with a delay, tracking concurrent requests"""
+
+    def __init__(
+        self,
+        total_pages: int,
+        delays: Optional[Dict[int, float]] = None,
+        failures: Optional[Dict[int, int]] = None,
+    ) -> None:
+        self.total_pages = total_pages
+        self.delays = delays or {}
+        self.failures = failures or {}
+        self.requested: List[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+
+    async def get(self, path: str, params: Dict[str, str]) -> Dict[str, Any]:
+        page_number = int(path.rsplit("/", 1)[1])
+        self.requested.append(page_number)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(page_number, 0.01))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        if self.failures.get(page_number, 0) > 0:
+            self.failures[page_number] -= 1
+            raise RealityDefenderError("Bad gateway", "server_error")
+        return make_page(page_number, self.total_pages)
+
+
+@pytest.mark.asyncio
+async def test_iter_detection_results_prefetches_pages_in_order() -> None:
+    """Test all items are yielded in page order with a bounded prefetch window"""
+    client = PagedClient(total_pages=6)
+
+    request_ids = [
+        result["request_id"]
+        async for result in iter_detection_results(
+            cast(HttpClient, client), size=2, prefetch=2
+        )
+    ]
+
+    assert request_ids == [
+        f"req-{page}-{index}" for page in range(6) for index in (0, 1)
+    ]
+    assert sorted(client.requested) == list(range(6))
+    assert client.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_detection_results_without_prefetch() -> None:
+    """Test pages are fetched one at a time when prefetching is disabled"""
+    client = PagedClient(total_pages=3)
+
+    results = [
+        result
+        async for result in iter_detection_results(
+            cast(HttpClient, client), size=2, prefetch=0
+        )
+    ]
+
+    assert len(results) == 6
+    assert client.requested == [0, 1, 2]
+    assert client.max_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_iter_detection_results_cancels_prefetch_on_close() -> None:
+    """Test stopping early cancels the pages still being fetched"""
+    client = PagedClient(total_pages=10)
+    results = iter_detection_results(cast(HttpClient, client), size=2, prefetch=3)
+
+    assert (await results.__anext__())["request_id"] == "req-0-0"
+    await asyncio.sleep(0)
+    await results.aclose()
+
+    # The cancelled fetches finished before aclose returned
+    assert client.requested == [0, 1, 2, 3]
+    assert client.cancelled == 3
+    assert client.in_flight == 0
+
+
+def test_iter_results_sync() -> None:
+    """Test the synchronous iterator yields every result"""
+    client = PagedClient(total_pages=3)
+    with patch(
+        "realitydefender.reality_defender.create_http_client", return_value=client
+    ):
+        sdk = RealityDefender(api_key="test-api-key")
+
+    request_ids = [
+        result["request_id"] for result in sdk.iter_results_sync(size=2, compact=True)
+    ]
+
+    assert len(request_ids) == 6
+    assert request_ids[-1] == "req-2-1"
+
+
+@pytest.mark.asyncio
+async def test_get_all_detection_results_reassembles_pages_in_order() -> None:
+    """Test pages fetched concurrently are returned in order, retrying failed pages"""
+    client = PagedClient(total_pages=8, delays={1: 0.05, 2: 0.03}, failures={5: 1})
+
+    result = await get_all_detection_results(
+        cast(HttpClient, client), size=2, concurrency=3, polling_interval=0
+    )
+
+    assert result["total_items"] == 16
+    assert result["current_page_items_count"] == 16
+    assert [item["request_id"] for item in result["items"]] == [
+        f"req-{page}-{index}" for page in range(8) for index in (0, 1)
+    ]
+    assert client.requested.count(5) == 2
+    assert client.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_iter_detection_result_pages_yields_pages_as_they_arrive() -> None:
+    """Test pages are streamed out of order with their index"""
+    client = PagedClient(total_pages=4, delays={1: 0.05})
+
+    order = [
+        page_number
+        async for page_number, page in iter_detection_result_pages(
+            cast(HttpClient, client), size=2, concurrency=3
+        )
+    ]
+
+    assert order[0] == 0
+    assert order[-1] == 1
+    assert sorted(order) == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_iter_detection_result_pages_raises_page_errors() -> None:
+    """Test a page failing every attempt stops the fan-out"""
+    client = PagedClient(total_pages=20, failures={1: 5})
+
+    with pytest.raises(RealityDefenderError) as exc_info:
+        await get_all_detection_results(
+            cast(HttpClient, client),
+            size=2,
+            concurrency=2,
+            max_attempts=2,
+            polling_interval=0,
+        )
+
+    assert exc_info.value.code == "server_error"
+    assert client.in_flight == 0
+    assert len(client.requested) < 20
+
+
+def test_get_all_results_sync() -> None:
+    """Test the SDK fetches and reassembles all pages synchronously"""
+    client = PagedClient(total_pages=3)
+    with patch(
+        "realitydefender.reality_defender.create_http_client", return_value=client
+    ):
+        sdk = RealityDefender(api_key="test-api-key")
+
+    result = sdk.get_all_results_sync(size=2, concurrency=2)
+
+    assert len(result["items"]) == 6
+    assert result["items"][0]["request_id"] == "req-0-0"
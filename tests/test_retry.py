@@ -0,0 +1,267 @@
+"""
+Tests for retries of transient HTTP failures
+"""
+
+import json
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+
+from realitydefender.client.http_client import HttpClient, create_http_client
+from realitydefender.client.retry import RetryBudget
+from realitydefender.detection.upload import put_to_signed_url
+from realitydefender.errors import RealityDefenderError
+from realitydefender.utils.backoff import decorrelated_jitter, parse_retry_after
+
+
+def make_response(
+    status: int,
+    body: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> AsyncMock:
+    """Create a mock aiohttp.ClientResponse"""
+    mock = AsyncMock(spec=aiohttp.ClientResponse)
+    mock.status = status
+    mock.headers = headers or {}
+    mock.read = AsyncMock(
+        return_value=json.dumps(body or {"response": "busy"}).encode()
+    )
+    mock.text = AsyncMock(return_value="busy")
+    mock.__aenter__ = AsyncMock(return_value=mock)
+    mock.__aexit__ = AsyncMock(return_value=None)
+    return mock
+
+
+@pytest.fixture
+def http_client() -> HttpClient:
+    """Create an HTTP client for testing"""
+    return create_http_client({"api_key": "test-api-key"})
+
+
+@pytest.fixture
+def delays() -> Any:
+    """Record retry delays instead of sleeping"""
+    recorded: List[int] = []
+
+    async def record(ms: int) -> None:
+        recorded.append(ms)
+
+    with patch("realitydefender.client.retry.sleep", record):
+        yield recorded
+
+
+def test_parse_retry_after() -> None:
+    """Test both Retry-After formats are parsed to milliseconds"""
+    assert parse_retry_after("3") == 3000
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+    assert delay is not None and 28000 <= delay <= 30000
+
+    past = datetime.now(timezone.utc) - timedelta(seconds=30)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0
+
+
+def test_decorrelated_jitter_bounds() -> None:
+    """Test delays stay between the base and the cap"""
+    delay = 100
+    for _ in range(100):
+        delay = decorrelated_jitter(delay, 100, 2000)
+        assert 100 <= delay <= 2000
+
+
+def test_retry_budget_stops_retries_during_outage() -> None:
+    """Test retries stop once half of the budget is used and resume on success"""
+    budget = RetryBudget(max_tokens=4, token_ratio=1)
+    budget.on_failure()
+    assert budget.can_retry()
+    budget.on_failure()
+    assert not budget.can_retry()
+
+    budget.on_success()
+    assert budget.can_retry()
+
+
+def test_operation_names(http_client: HttpClient) -> None:
+    """Test requests are mapped to the retry policy of their operation"""
+    assert http_client.operation("POST", "/api/files/aws-presigned") == "signed_url"
+    assert http_client.operation("GET", "/api/media/users/req") == "result"
+    assert http_client.operation("GET", "/api/v2/media/users/pages/0") == "list"
+    assert http_client.operation("POST", "/api/files/social") == "default"
+
+
+@pytest.mark.asyncio
+async def test_get_retries_transient_status(
+    http_client: HttpClient, delays: List[int]
+) -> None:
+    """Test a GET is retried after 503 and honours Retry-After"""
+    responses = [
+        make_response(503, headers={"Retry-After": "2"}),
+        make_response(502),
+        make_response(200, {"requestId": "req"}),
+    ]
+
+    with patch("aiohttp.ClientSession.get", side_effect=responses):
+        result = await http_client.get("/api/media/users/req")
+
+    assert result == {"requestId": "req"}
+    assert len(delays) == 2
+    assert delays[0] >= 2000
+
+
+@pytest.mark.asyncio
+async def test_get_gives_up_after_max_attempts(
+    http_client: HttpClient, delays: List[int]
+) -> None:
+    """Test the last error is raised once all attempts failed"""
+    with patch(
+        "aiohttp.ClientSession.get", side_effect=[make_response(504) for _ in range(4)]
+    ) as get:
+        with pytest.raises(RealityDefenderError) as exc_info:
+            await http_client.get("/api/media/users/req")
+
+    assert exc_info.value.code == "server_error"
+    assert get.call_count == 4
+    assert len(delays) == 3
+
+
+@pytest.mark.asyncio
+async def test_internal_server_error_is_not_retried(
+    http_client: HttpClient, delays: List[int]
+) -> None:
+    """Test API errors that are not transient fail immediately"""
+    with patch("aiohttp.ClientSession.get", return_value=make_response(500)) as get:
+        with pytest.raises(RealityDefenderError):
+            await http_client.get("/api/media/users/req")
+
+    assert get.call_count == 1
+    assert delays == []
+
+
+@pytest.mark.asyncio
+async def test_retry_after_beyond_max_delay_is_not_waited_for(
+    http_client: HttpClient, delays: List[int]
+) -> None:
+    """Test a server asking to wait longer than the policy allows fails fast"""
+    with patch(
+        "aiohttp.ClientSession.get",
+        return_value=make_response(429, headers={"Retry-After": "3600"}),
+    ) as get:
+        with pytest.raises(RealityDefenderError):
+            await http_client.get("/api/media/users/req")
+
+    assert get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_post_only_retried_when_not_processed(
+    http_client: HttpClient, delays: List[int]
+) -> None:
+    """Test a POST is retried after 429 but not after 502"""
+    with patch(
+        "aiohttp.ClientSession.post",
+        side_effect=[make_response(429), make_response(200, {"requestId": "req"})],
+    ) as post:
+        result = await http_client.post("/api/files/aws-presigned", {"fileName": "a"})
+    assert result == {"requestId": "req"}
+    assert post.call_count == 2
+
+    with patch("aiohttp.ClientSession.post", return_value=make_response(502)) as post:
+        with pytest.raises(RealityDefenderError):
+            await http_client.post("/api/files/aws-presigned", {"fileName": "a"})
+    assert post.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_is_shared_by_requests(delays: List[int]) -> None:
+    """Test an exhausted budget prevents further retries on the client"""
+    client = create_http_client(
+        {"api_key": "test-api-key", "retry_budget": {"max_tokens": 4}}
+    )
+
+    with patch("aiohttp.ClientSession.get", return_value=make_response(503)) as get:
+        with pytest.raises(RealityDefenderError):
+            await client.get("/api/media/users/req")
+        assert get.call_count == 2
+
+        get.reset_mock()
+        with pytest.raises(RealityDefenderError):
+            await client.get("/api/media/users/req")
+        assert get.call_count == 1
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_policy_overrides(delays: List[int]) -> None:
+    """Test per-operation policies can be configured"""
+    client = create_http_client(
+        {"api_key": "test-api-key", "retry": {"result": {"max_attempts": 1}}}
+    )
+    assert client.retry_policies["result"]["max_attempts"] == 1
+    assert client.retry_policies["result"]["retry_statuses"] == [429, 502, 503, 504]
+
+    with patch("aiohttp.ClientSession.get", return_value=make_response(503)) as get:
+        with pytest.raises(RealityDefenderError):
+            await client.get("/api/media/users/req")
+    assert get.call_count == 1
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_errors_are_retried(
+    http_client: HttpClient, delays: List[int]
+) -> None:
+    """Test transport failures of a GET are retried"""
+    with patch(
+        "aiohttp.ClientSession.get",
+        side_effect=[
+            aiohttp.ServerDisconnectedError(),
+            make_response(200, {"requestId": "req"}),
+        ],
+    ):
+        result = await http_client.get("/api/media/users/req")
+
+    assert result == {"requestId": "req"}
+    assert len(delays) == 1
+
+
+@pytest.mark.asyncio
+async def test_upload_retries_replayable_bodies(
+    http_client: HttpClient, delays: List[int]
+) -> None:
+    """Test storage uploads are retried when the body can be sent again"""
+    with patch(
+        "aiohttp.ClientSession.put",
+        side_effect=[make_response(500), make_response(200)],
+    ) as put:
+        await put_to_signed_url(http_client, "https://signed-url.com", b"content", {})
+    assert put.call_count == 2
+
+    async def chunks() -> Any:
+        yield b"content"
+
+    with patch(
+        "aiohttp.ClientSession.put",
+        side_effect=[make_response(500), make_response(200)],
+    ) as put:
+        await put_to_signed_url(
+            http_client, "https://signed-url.com", lambda: chunks(), {}
+        )
+    assert put.call_count == 2
+
+    # A plain iterator is consumed by the first attempt
+    with patch("aiohttp.ClientSession.put", return_value=make_response(503)) as put:
+        with pytest.raises(RealityDefenderError) as exc_info:
+            await put_to_signed_url(http_client, "https://signed-url.com", chunks(), {})
+    assert exc_info.value.code == "upload_failed"
+    assert put.call_count == 1
+
+    await http_client.close()
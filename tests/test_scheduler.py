@@ -0,0 +1,149 @@
+"""
+Tests for the polling scheduler
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, cast
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from realitydefender import RealityDefender
+from realitydefender.cache import ResultCache
+from realitydefender.client.http_client import HttpClient
+from realitydefender.detection.scheduler import PollingScheduler
+from realitydefender.errors import RealityDefenderError
+
+
+class ProcessingClient:
+    """Client stand-in whose media finish processing after a number of polls"""
+
+    def __init__(self, polls_needed: Dict[str, int], delay: float = 0) -> None:
+        self.polls_needed = polls_needed
+        self.delay = delay
+        self.polls: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(
+        self, path: str, params: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        request_id = path.rsplit("/", 1)[1]
+        self.polls.append(request_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if request_id not in self.polls_needed:
+            raise RealityDefenderError("Not found", "not_found")
+        done = self.polls.count(request_id) >= self.polls_needed[request_id]
+        return {
+            "requestId": request_id,
+            "resultsSummary": {
+                "status": "FAKE" if done else "ANALYZING",
+                "metadata": {"finalScore": 90 if done else None},
+            },
+            "models": [],
+        }
+
+
+@pytest.mark.asyncio
+async def test_scheduler_resolves_each_request() -> None:
+    """Test each future resolves once its request finished processing"""
+    client = ProcessingClient({"fast": 1, "slow": 3})
+    scheduler = PollingScheduler(cast(HttpClient, client), polling_interval=10)
+
+    fast = scheduler.submit("fast")
+    slow = scheduler.submit("slow")
+    assert scheduler.submit("slow") is slow
+    assert scheduler.pending() == 2
+
+    assert (await fast)["status"] == "MANIPULATED"
+    assert not slow.done()
+    result = await slow
+    assert result["status"] == "MANIPULATED"
+    assert result["score"] == 0.9
+    assert client.polls.count("slow") == 3
+    assert scheduler.pending() == 0
+    await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_bounds_concurrent_polls() -> None:
+    """Test no more than concurrency polls are in flight"""
+    client = ProcessingClient({f"req-{i}": 2 for i in range(20)}, delay=0.005)
+    scheduler = PollingScheduler(
+        cast(HttpClient, client), concurrency=3, polling_interval=5
+    )
+
+    results = await asyncio.gather(*(scheduler.submit(f"req-{i}") for i in range(20)))
+
+    assert len(results) == 20
+    assert client.max_in_flight == 3
+    assert len(client.polls) == 40
+    await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_gives_up_after_max_attempts() -> None:
+    """Test pending results are returned and missing ones raised after the last poll"""
+    client = ProcessingClient({"stuck": 100})
+    cache = ResultCache()
+    scheduler = PollingScheduler(
+        cast(HttpClient, client), max_attempts=2, polling_interval=1, cache=cache
+    )
+
+    stuck = scheduler.submit("stuck")
+    missing = scheduler.submit("missing", max_attempts=3)
+
+    assert (await stuck)["status"] == "ANALYZING"
+    with pytest.raises(RealityDefenderError) as error:
+        await missing
+    assert error.value.code == "not_found"
+    assert client.polls.count("missing") == 3
+
+    # The not found answer is cached
+    with pytest.raises(RealityDefenderError):
+        await scheduler.submit("missing")
+    assert client.polls.count("missing") == 3
+    await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_close_cancels_pending_requests() -> None:
+    """Test closing the scheduler cancels the futures of pending requests"""
+    client = ProcessingClient({"slow": 100})
+    scheduler = PollingScheduler(cast(HttpClient, client), polling_interval=1000)
+
+    future = scheduler.submit("slow")
+    await asyncio.sleep(0.01)
+    await scheduler.close()
+
+    assert future.cancelled()
+    assert client.polls == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_watch_result_uses_shared_scheduler() -> None:
+    """Test watch_result resolves through the SDK's scheduler"""
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(
+        return_value={
+            "requestId": "req",
+            "resultsSummary": {"status": "AUTHENTIC", "metadata": {"finalScore": 5}},
+            "models": [],
+        }
+    )
+    with patch(
+        "realitydefender.reality_defender.create_http_client", return_value=mock_client
+    ):
+        sdk = RealityDefender(api_key="test-api-key", polling_concurrency=2)
+
+    result = await sdk.watch_result("req")
+
+    assert result["status"] == "AUTHENTIC"
+    assert sdk.polling_scheduler is not None
+    assert sdk.polling_scheduler.concurrency == 2
+    await sdk.cleanup()
@@ -56,6 +56,19 @@ async def test_sdk_initialization() -> None:
     assert exc_info.value.code == "unauthorized"
 
 
+@pytest.mark.asyncio
+async def test_sdk_initialization_with_pools() -> None:
+    """Test pool settings are passed to the HTTP client"""
+    sdk = RealityDefender(
+        api_key="test-api-key",
+        pool={"limit_per_host": 10},
+        storage_pool={"limit": 4},
+    )
+    assert sdk.client.pool["limit_per_host"] == 10
+    assert sdk.client.pool["limit"] == 100
+    assert sdk.client.storage_pool["limit"] == 4
+
+
 @pytest.mark.asyncio
 async def test_upload(sdk_instance: RealityDefender, mock_client: AsyncMock) -> None:
     """Test file upload functionality"""
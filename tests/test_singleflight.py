@@ -0,0 +1,124 @@
+"""
+Tests for coalescing identical concurrent operations
+"""
+
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from realitydefender import RealityDefender
+from realitydefender.client.http_client import create_http_client
+from realitydefender.utils.singleflight import SingleFlight
+from tests.test_retry import make_response
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_operation() -> None:
+    """Test callers of a running key share its result, later calls start anew"""
+    flights: SingleFlight[int] = SingleFlight()
+    calls: List[str] = []
+
+    async def operation() -> int:
+        calls.append("run")
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    results = await asyncio.gather(*(flights.do("key", operation) for _ in range(5)))
+    assert results == [1] * 5
+    assert flights.coalesced == 4
+    assert flights.in_flight() == 0
+
+    assert await flights.do("key", operation) == 2
+    assert await flights.do("other", operation) == 3
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared() -> None:
+    """Test every waiter receives the exception of the shared operation"""
+    flights: SingleFlight[None] = SingleFlight()
+
+    async def operation() -> None:
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *(flights.do("key", operation) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flights.started == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_others() -> None:
+    """Test the operation keeps running for remaining waiters, and stops without any"""
+    flights: SingleFlight[str] = SingleFlight()
+    finished = asyncio.Event()
+
+    async def operation() -> str:
+        await finished.wait()
+        return "done"
+
+    first = asyncio.ensure_future(flights.do("key", operation))
+    second = asyncio.ensure_future(flights.do("key", operation))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    finished.set()
+    assert await second == "done"
+
+    finished.clear()
+    only = asyncio.ensure_future(flights.do("key", operation))
+    await asyncio.sleep(0)
+    only.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await only
+    await asyncio.sleep(0)
+    assert flights.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_client_coalesces_identical_gets() -> None:
+    """Test concurrent identical GETs send one request"""
+    client = create_http_client({"api_key": "test-api-key"})
+
+    with patch(
+        "aiohttp.ClientSession.get", return_value=make_response(200, {"ok": True})
+    ) as get:
+        results = await asyncio.gather(
+            client.get("/api/media/users/req"),
+            client.get("/api/media/users/req"),
+            client.get("/api/v2/media/users/pages/0", params={"size": "10"}),
+            client.get("/api/v2/media/users/pages/0", params={"size": "10"}),
+            client.get("/api/v2/media/users/pages/0", params={"size": "20"}),
+        )
+
+    assert results == [{"ok": True}] * 5
+    assert get.call_count == 3
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_result_calls_share_polling() -> None:
+    """Test concurrent waiters for one request ID share its polling loop"""
+    responses: List[Dict[str, Any]] = [
+        {"requestId": "req", "resultsSummary": {"status": "ANALYZING"}},
+        {
+            "requestId": "req",
+            "resultsSummary": {"status": "FAKE", "metadata": {"finalScore": 90}},
+        },
+    ]
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(side_effect=responses)
+    with patch(
+        "realitydefender.reality_defender.create_http_client", return_value=mock_client
+    ):
+        sdk = RealityDefender(api_key="test-api-key")
+
+    results = await asyncio.gather(
+        *(sdk.get_result("req", polling_interval=1) for _ in range(10))
+    )
+
+    assert {result["status"] for result in results} == {"MANIPULATED"}
+    assert mock_client.get.call_count == 2
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -20,7 +21,9 @@ def mock_response() -> AsyncMock:
     """Create a mock aiohttp.ClientResponse"""
     mock = AsyncMock(spec=aiohttp.ClientResponse)
     mock.status = 200
-    mock.json = AsyncMock(return_value={"data": {"test": "value"}})
+    mock.read = AsyncMock(
+        return_value=json.dumps({"data": {"test": "value"}}).encode()
+    )
     mock.text = AsyncMock(return_value="response text")
     mock.__aenter__ = AsyncMock(return_value=mock)
     mock.__aexit__ = AsyncMock(return_value=None)
@@ -33,10 +36,8 @@ async def test_upload_social_media_link_success_return_type(
     http_client: HttpClient, mock_response: AsyncMock
 ) -> None:
     """Test successful social media link upload returns correct type"""
-    mock_response.json = AsyncMock(
-        return_value={
-            "requestId": "test-request-id",
-        }
+    mock_response.read = AsyncMock(
+        return_value=json.dumps({"requestId": "test-request-id"}).encode()
     )
 
     with patch("aiohttp.ClientSession.post", return_value=mock_response):
@@ -54,10 +55,8 @@ async def test_upload_social_media_link_ensures_session(
     http_client: HttpClient, mock_response: AsyncMock
 ) -> None:
     """Test that upload_social_media_link calls ensure_session"""
-    mock_response.json = AsyncMock(
-        return_value={
-            "requestId": "test-request-id",
-        }
+    mock_response.read = AsyncMock(
+        return_value=json.dumps({"requestId": "test-request-id"}).encode()
     )
 
     with (
@@ -0,0 +1,244 @@
+"""
+Tests for the result store and incremental sync
+"""
+
+import asyncio
+import os
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Generator, List, Optional, cast
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from realitydefender import RealityDefender
+from realitydefender.cache import ResultStore
+from realitydefender.client.http_client import HttpClient
+from realitydefender.detection.sync import sync_results
+from realitydefender.errors import RealityDefenderError
+from realitydefender.model import DetectionResult
+
+TODAY = datetime.now(timezone.utc).date()
+
+
+@pytest.fixture
+def store() -> Generator[ResultStore, Any, None]:
+    """Create a result store in a temporary database"""
+    with tempfile.TemporaryDirectory() as directory:
+        result_store = ResultStore(os.path.join(directory, "results.db"))
+        yield result_store
+        result_store.close()
+
+
+def make_result(
+    request_id: str, status: str, score: Optional[float]
+) -> DetectionResult:
+    return {
+        "request_id": request_id,
+        "status": status,
+        "score": score,
+        "models": [{"name": "face", "status": status, "score": score}],
+    }
+
+
+def test_store_query_filters_and_pages(store: ResultStore) -> None:
+    """Test queries filter on status, score, name and date, newest first"""
+    with patch("realitydefender.cache.store.time.time", return_value=1735732800.0):
+        store.upsert([make_result("jan", "AUTHENTIC", 0.1)])  # 2025-01-01 12:00 UTC
+    store.upsert(
+        [make_result(f"m-{index}", "MANIPULATED", index / 10) for index in range(5)]
+    )
+    store.upsert([make_result("named", "AUTHENTIC", 0.2)], name="campaign")
+
+    page = store.query(size=2)
+    assert page["total_items"] == 7
+    assert page["total_pages"] == 4
+    assert page["items"][0]["models"] == [
+        {"name": "face", "status": "AUTHENTIC", "score": 0.2}
+    ]
+
+    manipulated = store.query(status="MANIPULATED", min_score=0.2, max_score=0.35)
+    assert sorted(item["request_id"] for item in manipulated["items"]) == [
+        "m-2",
+        "m-3",
+    ]
+    assert store.query(name="campaign")["items"][0]["request_id"] == "named"
+
+    january = store.query(start_date=date(2025, 1, 1), end_date=date(2025, 1, 1))
+    assert [item["request_id"] for item in january["items"]] == ["jan"]
+    assert store.query(end_date=date(2024, 12, 31))["total_items"] == 0
+
+    last_page = store.query(page_number=3, size=2)
+    assert last_page["current_page"] == 3
+    assert last_page["current_page_items_count"] == 1
+
+
+def test_store_analytics(store: ResultStore) -> None:
+    """Test status counts and model score statistics"""
+    store.upsert(
+        [
+            make_result("a", "AUTHENTIC", 0.1),
+            make_result("b", "MANIPULATED", 0.9),
+            make_result("c", "MANIPULATED", 0.7),
+        ]
+    )
+
+    assert store.status_counts() == {"AUTHENTIC": 1, "MANIPULATED": 2}
+    assert store.status_counts(end_date=date(2000, 1, 1)) == {}
+    stats = store.model_score_stats()["face"]
+    assert stats["count"] == 3
+    assert stats["max"] == 0.9
+    assert stats["avg"] == pytest.approx(1.7 / 3)
+
+
+@pytest.mark.asyncio
+async def test_get_result_is_served_from_store(store: ResultStore) -> None:
+    """Test finished results are answered from the store without requests"""
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(
+        return_value={
+            "requestId": "req",
+            "resultsSummary": {"status": "FAKE", "metadata": {"finalScore": 90}},
+            "models": [],
+        }
+    )
+    with patch(
+        "realitydefender.reality_defender.create_http_client", return_value=mock_client
+    ):
+        sdk = RealityDefender(api_key="test-api-key", result_store=store)
+    store.upsert([make_result("pending", "ANALYZING", None)])
+
+    assert (await sdk.get_result("req"))["status"] == "MANIPULATED"
+    assert (await sdk.get_result("req"))["score"] == 0.9
+    assert mock_client.get.call_count == 1
+
+    await sdk.get_result("pending", max_attempts=1)
+    assert mock_client.get.call_count == 2
+
+
+class HistoryClient:
+    """Client stand-in serving a history of dated results"""
+
+    def __init__(self) -> None:
+        self.media: Dict[str, Dict[str, Any]] = {}
+        self.list_params: List[Dict[str, str]] = []
+        self.fetched: List[str] = []
+        self.fail_listing = False
+
+    def add(self, request_id: str, day: date, status: str) -> None:
+        self.media[request_id] = {
+            "requestId": request_id,
+            "day": day,
+            "resultsSummary": {"status": status, "metadata": {"finalScore": 50}},
+            "models": [],
+        }
+
+    async def get(
+        self, path: str, params: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        await asyncio.sleep(0)
+        if params is None:
+            request_id = path.rsplit("/", 1)[1]
+            self.fetched.append(request_id)
+            if request_id not in self.media:
+                raise RealityDefenderError("Not found", "not_found")
+            return self.media[request_id]
+
+        if self.fail_listing:
+            raise RealityDefenderError("Unauthorized", "unauthorized")
+        self.list_params.append(params)
+        since = params.get("startDate")
+        media = [
+            item
+            for item in self.media.values()
+            if since is None or item["day"].isoformat() >= since
+        ]
+        size = int(params["size"])
+        page_number = int(path.rsplit("/", 1)[1])
+        page = media[page_number * size : (page_number + 1) * size]
+        return {
+            "totalItems": len(media),
+            "totalPages": max(1, -(-len(media) // size)),
+            "currentPage": page_number,
+            "currentPageItemsCount": len(page),
+            "mediaList": page,
+        }
+
+
+def test_store_upserts_only_changes(store: ResultStore) -> None:
+    """Test storing unchanged results again does not count as a change"""
+    assert store.upsert([make_result("a", "AUTHENTIC", 0.1)]) == 1
+    assert store.upsert([make_result("a", "AUTHENTIC", 0.1)]) == 0
+    assert store.upsert([make_result("a", "MANIPULATED", 0.9)]) == 1
+    assert store.upsert([make_result("b", "ANALYZING", None)]) == 1
+
+    assert store.get("a") == make_result("a", "MANIPULATED", 0.9)
+    assert store.get("missing") is None
+    assert store.pending_request_ids() == ["b"]
+    assert len(store) == 2
+
+
+def test_store_watermarks(store: ResultStore) -> None:
+    """Test watermarks are kept per sync key"""
+    assert store.get_watermark() is None
+
+    store.set_watermark(date(2025, 3, 1))
+    store.set_watermark(date(2025, 1, 1), "campaign")
+
+    assert store.get_watermark() == date(2025, 3, 1)
+    assert store.get_watermark("campaign") == date(2025, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_sync_lists_only_new_results_after_first_run(
+    store: ResultStore,
+) -> None:
+    """Test later syncs list from the watermark and recheck pending results"""
+    client = HistoryClient()
+    for index in range(25):
+        client.add(f"old-{index}", TODAY - timedelta(days=30 + index), "AUTHENTIC")
+    client.add("slow", TODAY - timedelta(days=10), "ANALYZING")
+
+    report = await sync_results(cast(HttpClient, client), store, size=10)
+
+    assert report == {
+        "since": None,
+        "listed": 26,
+        "rechecked": 0,
+        "stored": 26,
+        "pending": 1,
+    }
+    assert len(client.list_params) == 3
+    assert "startDate" not in client.list_params[0]
+    assert store.get_watermark() == TODAY - timedelta(days=1)
+
+    client.list_params.clear()
+    client.media["slow"]["resultsSummary"]["status"] = "FAKE"
+    client.add("new", TODAY, "AUTHENTIC")
+
+    report = await sync_results(cast(HttpClient, client), store, size=10)
+
+    assert report == {
+        "since": TODAY - timedelta(days=1),
+        "listed": 1,
+        "rechecked": 1,
+        "stored": 2,
+        "pending": 0,
+    }
+    assert len(client.list_params) == 1
+    assert client.fetched == ["slow"]
+    assert store.get("slow")["status"] == "MANIPULATED"  # type: ignore[index]
+    assert len(store) == 27
+
+
+@pytest.mark.asyncio
+async def test_failed_sync_keeps_watermark(store: ResultStore) -> None:
+    """Test the watermark only moves forward once a sync succeeds"""
+    client = HistoryClient()
+    store.set_watermark(date(2025, 1, 1))
+    client.fail_listing = True
+
+    with pytest.raises(RealityDefenderError):
+        await sync_results(cast(HttpClient, client), store)
+
+    assert store.get_watermark() == date(2025, 1, 1)
@@ -1,6 +1,9 @@
+import asyncio
+import io
+import json
 import os
 import tempfile
-from typing import Any, Dict, Generator
+from typing import Any, AsyncIterator, Dict, Generator
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -9,6 +12,9 @@ import aiohttp
 from realitydefender.client.http_client import HttpClient, create_http_client
 from realitydefender.detection.upload import (
     get_signed_url,
+    upload_bytes,
+    upload_fileobj,
+    upload_stream,
     upload_to_signed_url,
     upload_file,
 )
@@ -27,7 +33,7 @@ def mock_response() -> AsyncMock:
     """Create a mock aiohttp.ClientResponse"""
     mock = AsyncMock(spec=aiohttp.ClientResponse)
     mock.status = 200
-    mock.json = AsyncMock(return_value={"data": {"test": "value"}})
+    mock.read = AsyncMock(return_value=json.dumps({"data": {"test": "value"}}).encode())
     mock.text = AsyncMock(return_value="response text")
     mock.__aenter__ = AsyncMock(return_value=mock)
     mock.__aexit__ = AsyncMock(return_value=None)
@@ -54,12 +60,14 @@ async def test_get_signed_url_success_return_type(
     http_client: HttpClient, mock_response: AsyncMock
 ) -> None:
     """Test successful signed URL retrieval returns correct type"""
-    mock_response.json = AsyncMock(
-        return_value={
-            "requestId": "test-request-id",
-            "mediaId": "test-media-id",
-            "response": {"signedUrl": "https://signed-url.com"},
-        }
+    mock_response.read = AsyncMock(
+        return_value=json.dumps(
+            {
+                "requestId": "test-request-id",
+                "mediaId": "test-media-id",
+                "response": {"signedUrl": "https://signed-url.com"},
+            }
+        ).encode()
     )
 
     with patch("aiohttp.ClientSession.post", return_value=mock_response):
@@ -106,6 +114,83 @@ async def test_upload_to_signed_url_success_return_type(
             )
 
 
+@pytest.mark.asyncio
+async def test_upload_to_signed_url_streaming(
+    http_client: HttpClient, mock_response: AsyncMock, temp_test_file: str
+) -> None:
+    """Test streaming upload sends chunks with an explicit Content-Length"""
+    with patch("aiohttp.ClientSession.put", return_value=mock_response) as session:
+        await upload_to_signed_url(
+            http_client,
+            "https://signed-url.com",
+            temp_test_file,
+            stream=True,
+            chunk_size=5,
+        )
+
+        session.assert_called_once()
+        kwargs = session.call_args.kwargs
+        assert kwargs["headers"] == {
+            "Content-Type": "text/plain",
+            "Content-Length": str(len("test content")),
+        }
+        chunks = [chunk async for chunk in kwargs["data"]]
+        assert chunks == [b"test ", b"conte", b"nt"]
+
+
+@pytest.mark.asyncio
+async def test_upload_file_streaming_passes_options(
+    http_client: HttpClient, temp_test_file: str
+) -> None:
+    """Test that upload_file forwards streaming options to the signed URL upload"""
+    signed_url_response: Dict[str, Any] = {
+        "requestId": "test-request-id",
+        "mediaId": "test-media-id",
+        "response": {"signedUrl": "https://signed-url.com"},
+    }
+
+    with (
+        patch(
+            "realitydefender.detection.upload.get_signed_url",
+            return_value=signed_url_response,
+        ),
+        patch("realitydefender.detection.upload.upload_to_signed_url") as mock_upload,
+    ):
+        await upload_file(
+            http_client, file_path=temp_test_file, stream=True, chunk_size=1024
+        )
+
+        mock_upload.assert_called_once_with(
+            http_client,
+            "https://signed-url.com",
+            temp_test_file,
+            stream=True,
+            chunk_size=1024,
+            use_mmap=False,
+        )
+
+
+@pytest.mark.asyncio
+async def test_upload_to_signed_url_mmap(
+    http_client: HttpClient, mock_response: AsyncMock, temp_test_file: str
+) -> None:
+    """Test memory-mapped upload sends memoryview slices with a Content-Length"""
+    with patch("aiohttp.ClientSession.put", return_value=mock_response) as session:
+        await upload_to_signed_url(
+            http_client,
+            "https://signed-url.com",
+            temp_test_file,
+            chunk_size=5,
+            use_mmap=True,
+        )
+
+        kwargs = session.call_args.kwargs
+        assert kwargs["headers"]["Content-Length"] == str(len("test content"))
+        chunks = [chunk async for chunk in kwargs["data"]]
+        assert all(isinstance(chunk, memoryview) for chunk in chunks)
+        assert b"".join(chunks) == b"test content"
+
+
 @pytest.mark.asyncio
 async def test_upload_file_success_test_format_return_type(
     http_client: HttpClient, temp_test_file: str
@@ -219,3 +304,172 @@ async def test_upload_file_none_values_handling(http_client: HttpClient) -> None
         raised_error: RealityDefenderError = exc_info.value
         assert isinstance(raised_error, RealityDefenderError)
         assert raised_error.code == "server_error"
+
+
+SIGNED_URL_RESPONSE: Dict[str, Any] = {
+    "requestId": "test-request-id",
+    "mediaId": "test-media-id",
+    "response": {"signedUrl": "https://signed-url.com"},
+}
+
+
+@pytest.mark.asyncio
+async def test_upload_bytes(http_client: HttpClient, mock_response: AsyncMock) -> None:
+    """Test in-memory content is uploaded with a type inferred from the filename"""
+    with (
+        patch(
+            "realitydefender.detection.upload.get_signed_url",
+            return_value=SIGNED_URL_RESPONSE,
+        ) as mock_get_signed_url,
+        patch("aiohttp.ClientSession.put", return_value=mock_response) as session,
+    ):
+        result = await upload_bytes(http_client, b"image bytes", filename="photo.png")
+
+    assert result == {"request_id": "test-request-id", "media_id": "test-media-id"}
+    mock_get_signed_url.assert_called_once_with(http_client, "photo.png")
+    session.assert_called_once_with(
+        "https://signed-url.com",
+        data=b"image bytes",
+        headers={"Content-Type": "image/png"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_upload_bytes_validates_type_and_size(http_client: HttpClient) -> None:
+    """Test unsupported or oversized content is rejected before any request"""
+    with patch("realitydefender.detection.upload.get_signed_url") as mock_signed_url:
+        with pytest.raises(RealityDefenderError) as exc_info:
+            await upload_bytes(http_client, b"data", filename="archive.zip")
+        assert exc_info.value.code == "invalid_file"
+
+        with pytest.raises(RealityDefenderError) as exc_info:
+            await upload_bytes(http_client, b"x" * (5242880 + 1), filename="a.txt")
+        assert exc_info.value.code == "file_too_large"
+
+        with pytest.raises(RealityDefenderError) as exc_info:
+            await upload_bytes(http_client, b"data")
+        assert exc_info.value.code == "invalid_file"
+
+    mock_signed_url.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upload_fileobj(
+    http_client: HttpClient, mock_response: AsyncMock
+) -> None:
+    """Test a file-like object is streamed from its current position"""
+    fileobj = io.BytesIO(b"headerVIDEO CONTENT")
+    fileobj.seek(6)
+
+    with (
+        patch(
+            "realitydefender.detection.upload.get_signed_url",
+            return_value=SIGNED_URL_RESPONSE,
+        ) as mock_get_signed_url,
+        patch("aiohttp.ClientSession.put", return_value=mock_response) as session,
+    ):
+        await upload_fileobj(
+            http_client, fileobj, content_type="video/mp4", chunk_size=4
+        )
+
+        mock_get_signed_url.assert_called_once_with(http_client, "upload.mp4")
+        kwargs = session.call_args.kwargs
+        assert kwargs["headers"] == {
+            "Content-Type": "video/mp4",
+            "Content-Length": "13",
+        }
+        chunks = [chunk async for chunk in kwargs["data"]]
+        assert chunks == [b"VIDE", b"O CO", b"NTEN", b"T"]
+
+
+@pytest.mark.asyncio
+async def test_upload_stream(http_client: HttpClient, mock_response: AsyncMock) -> None:
+    """Test an async byte iterator is sent with its declared length"""
+
+    async def produce() -> AsyncIterator[bytes]:
+        yield b"abc"
+        yield b"def"
+
+    with (
+        patch(
+            "realitydefender.detection.upload.get_signed_url",
+            return_value=SIGNED_URL_RESPONSE,
+        ),
+        patch("aiohttp.ClientSession.put", return_value=mock_response) as session,
+    ):
+        await upload_stream(http_client, produce(), 6, filename="clip.wav")
+
+        kwargs = session.call_args.kwargs
+        assert kwargs["headers"]["Content-Length"] == "6"
+        assert [chunk async for chunk in kwargs["data"]] == [b"abc", b"def"]
+
+    async def short() -> AsyncIterator[bytes]:
+        yield b"abc"
+
+    with (
+        patch(
+            "realitydefender.detection.upload.get_signed_url",
+            return_value=SIGNED_URL_RESPONSE,
+        ),
+        patch("aiohttp.ClientSession.put", return_value=mock_response) as session,
+    ):
+        await upload_stream(http_client, short(), 6, filename="clip.wav")
+
+        with pytest.raises(RealityDefenderError) as exc_info:
+            [chunk async for chunk in session.call_args.kwargs["data"]]
+        assert exc_info.value.code == "upload_failed"
+
+
+@pytest.mark.asyncio
+async def test_upload_stream_uses_upload_circuit_breaker(
+    mock_response: AsyncMock,
+) -> None:
+    """Test non-replayable uploads are sent once and counted by the breaker"""
+    http_client = create_http_client(
+        {
+            "api_key": "test-api-key",
+            "circuit_breaker": {"failure_threshold": 1, "reset_timeout": 60000},
+        }
+    )
+    mock_response.status = 503
+
+    async def produce() -> AsyncIterator[bytes]:
+        yield b"abc"
+
+    with (
+        patch(
+            "realitydefender.detection.upload.get_signed_url",
+            return_value=SIGNED_URL_RESPONSE,
+        ),
+        patch("aiohttp.ClientSession.put", return_value=mock_response) as session,
+    ):
+        with pytest.raises(RealityDefenderError) as exc_info:
+            await upload_stream(http_client, produce(), 3, filename="clip.wav")
+        assert exc_info.value.code == "upload_failed"
+        assert session.call_count == 1
+
+        with pytest.raises(RealityDefenderError) as exc_info:
+            await upload_stream(http_client, produce(), 3, filename="clip.wav")
+        assert exc_info.value.code == "circuit_open"
+        assert session.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_upload_timeout_is_reported_as_timeout(
+    http_client: HttpClient,
+) -> None:
+    """Test a timed out upload raises a timeout error, not a generic failure"""
+
+    async def produce() -> AsyncIterator[bytes]:
+        yield b"abc"
+
+    with (
+        patch(
+            "realitydefender.detection.upload.get_signed_url",
+            return_value=SIGNED_URL_RESPONSE,
+        ),
+        patch("aiohttp.ClientSession.put", side_effect=asyncio.TimeoutError()),
+    ):
+        with pytest.raises(RealityDefenderError) as exc_info:
+            await upload_stream(http_client, produce(), 3, filename="clip.wav")
+    assert exc_info.value.code == "timeout"